@@ -0,0 +1,90 @@
+import os
+import sys
+import threading
+from PySide6.QtGui import QImage, QPixmap, QFontDatabase
+from core.logger import logger
+
+# Police de l'interface (splash, QSS)
+UI_FONT = "assets/Orbitron-Bold.ttf"
+# Images de la fenêtre principale, dans l'ordre où elle les demande (logo, cartes, puis fond en calques)
+MAIN_WINDOW_IMAGES = (
+    "assets/logonexuscore.png", "assets/telemetrycard1.png", "assets/telemetrycard2.png",
+    "assets/backgroundmain.png", "assets/background2.png", "assets/background3.png",
+)
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+
+_lock = threading.Lock()
+_images = {}     # {chemin relatif: QImage} décodées hors thread UI, pas encore converties
+_pending = {}    # {chemin relatif: threading.Event} décodage en cours
+_pixmaps = {}    # {chemin relatif: QPixmap} (thread UI uniquement)
+_fonts = {}      # {chemin relatif: famille ou None}
+
+
+def load_image(relative_path):
+    """Décode une image une seule fois (QImage, utilisable depuis n'importe quel thread)."""
+    with _lock:
+        if relative_path in _images:
+            return _images[relative_path]
+        event = _pending.get(relative_path)
+        owner = event is None
+        if owner:
+            event = _pending[relative_path] = threading.Event()
+    if not owner:
+        event.wait()
+        with _lock:
+            return _images.get(relative_path, QImage())
+
+    image = QImage(resource_path(relative_path))
+    if image.isNull():
+        logger.warning(f"Assets: Could not load {relative_path}")
+    with _lock:
+        _images[relative_path] = image
+        del _pending[relative_path]
+    event.set()
+    return image
+
+
+def pixmap(relative_path):
+    """QPixmap partagé d'une ressource, chargé au premier usage (thread UI uniquement)."""
+    pix = _pixmaps.get(relative_path)
+    if pix is None:
+        image = load_image(relative_path)
+        pix = _pixmaps[relative_path] = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        with _lock:
+            _images.pop(relative_path, None)   # le QImage n'est plus utile une fois converti
+    return pix
+
+
+def preload(relative_paths):
+    """Décode les images en arrière-plan (pendant le splash) pour que pixmap() ne fasse que convertir."""
+    paths = [p for p in relative_paths if p not in _pixmaps]
+    if not paths:
+        return
+    def run():
+        for path in paths:
+            if path not in _pixmaps:
+                load_image(path)
+    threading.Thread(target=run, name="AssetPreload", daemon=True).start()
+
+
+def font_family(relative_path=UI_FONT):
+    """Enregistre une police de l'application une seule fois. Retourne sa famille, ou None."""
+    if relative_path not in _fonts:
+        family = None
+        font_path = resource_path(relative_path)
+        if os.path.exists(font_path):
+            font_id = QFontDatabase.addApplicationFont(font_path)
+            if font_id != -1:
+                family = QFontDatabase.applicationFontFamilies(font_id)[0]
+                logger.info(f"UI: Loaded custom font -> {family}")
+        _fonts[relative_path] = family
+    return _fonts[relative_path]
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+from core.database import DATA_FOLDER
+from core.logger import logger
+
+# Icônes d'exe extraites une seule fois, stockées en PNG dans data/icons
+ICON_FOLDER = os.path.join(DATA_FOLDER, "icons")
+INDEX_PATH = os.path.join(ICON_FOLDER, "index.json")
+ICON_SIZE = 60
+EXTRACT_SIZE = 256
+MEMORY_LIMIT_KB = 20 * 1024   # tier mémoire (QPixmapCache, LRU) : ~1400 icônes de 60px
+
+
+def extract_icon_image(exe_path, size=ICON_SIZE):
+    """Extrait l'icône principale d'un exe en QImage (utilisable hors du thread UI).
+
+    QFileIconProvider / QPixmap ne sont pas sûrs hors du thread UI : on passe par
+    SHDefExtractIconW + QImage.fromHICON. None si l'exe n'a pas d'icône.
+    """
+    if sys.platform != "win32":
+        return None
+    import ctypes
+    from ctypes import wintypes
+    hicon = wintypes.HICON()
+    # nIconSize : mot bas = taille de la grande icône, mot haut = petite icône (non demandée)
+    hr = ctypes.windll.shell32.SHDefExtractIconW(exe_path, 0, 0, ctypes.byref(hicon), None, EXTRACT_SIZE)
+    if hr != 0 or not hicon:
+        return None
+    try:
+        image = QImage.fromHICON(hicon.value)
+    finally:
+        ctypes.windll.user32.DestroyIcon(hicon)
+    if image.isNull():
+        return None
+    return image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+class IconCache:
+    """Cache d'icônes à deux niveaux : PNG sur disque (clé chemin + mtime de l'exe) et QPixmapCache en mémoire.
+
+    Le thread UI ne lit que l'index et le tier mémoire. Le chargement des PNG, l'extraction et
+    la validation des mtime se font dans des threads de travail (IconLoader, warm()).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = {}   # {chemin normalisé: [mtime_ns, fichier png ou None si pas d'icône]}
+        self._dirty = False
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), MEMORY_LIMIT_KB))
+        try:
+            with open(INDEX_PATH, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _key(exe_path):
+        return os.path.normcase(os.path.normpath(exe_path))
+
+    def pixmap(self, exe_path):
+        """Icône du tier mémoire uniquement (aucun accès disque), sinon None."""
+        if not exe_path:
+            return None
+        with self._lock:
+            entry = self._index.get(self._key(exe_path))
+        if not entry or not entry[1]:
+            return None
+        return QPixmapCache.find(f"icon:{entry[1]}")
+
+    def has_no_icon(self, exe_path):
+        """True si l'exe a déjà été examiné et n'a pas d'icône exploitable."""
+        with self._lock:
+            entry = self._index.get(self._key(exe_path))
+        return bool(entry) and entry[1] is None
+
+    def load_image(self, exe_path):
+        """Icône en QImage depuis le PNG (extrait d'abord si inconnu). Thread de travail uniquement."""
+        key = self._key(exe_path)
+        with self._lock:
+            entry = self._index.get(key)
+        if not entry or (entry[1] and not os.path.exists(os.path.join(ICON_FOLDER, entry[1]))):
+            self.extract(exe_path)
+            with self._lock:
+                entry = self._index.get(key)
+        if not entry or not entry[1]:
+            return None
+        image = QImage(os.path.join(ICON_FOLDER, entry[1]))
+        return None if image.isNull() else image
+
+    def store_pixmap(self, exe_path, image):
+        """Place une icône chargée dans le tier mémoire (thread UI). Retourne le QPixmap."""
+        with self._lock:
+            entry = self._index.get(self._key(exe_path))
+        pix = QPixmap.fromImage(image)
+        if entry and entry[1]:
+            QPixmapCache.insert(f"icon:{entry[1]}", pix)
+        return pix
+
+    def extract(self, exe_path):
+        """Extrait (si besoin) l'icône de l'exe vers le disque. Retourne True si l'index a changé.
+
+        À appeler hors du thread UI : lit le mtime de l'exe et, s'il a changé, ré-extrait l'icône.
+        """
+        key = self._key(exe_path)
+        try:
+            mtime = os.stat(exe_path).st_mtime_ns
+        except OSError:
+            return False
+        with self._lock:
+            entry = self._index.get(key)
+        if entry and entry[0] == mtime and (entry[1] is None or os.path.exists(os.path.join(ICON_FOLDER, entry[1]))):
+            return False
+
+        filename = None
+        image = extract_icon_image(exe_path)
+        if image is not None:
+            os.makedirs(ICON_FOLDER, exist_ok=True)
+            filename = hashlib.sha1(f"{key}|{mtime}".encode("utf-8")).hexdigest() + ".png"
+            if not image.save(os.path.join(ICON_FOLDER, filename), "PNG"):
+                filename = None
+        with self._lock:
+            old = self._index.get(key)
+            self._index[key] = [mtime, filename]
+            self._dirty = True
+        if old and old[1] and old[1] != filename:
+            try:
+                os.remove(os.path.join(ICON_FOLDER, old[1]))
+            except OSError:
+                pass
+        return True
+
+    def warm(self, exe_paths):
+        """Extrait les icônes manquantes ou périmées puis sauvegarde l'index. Retourne le nombre mis à jour."""
+        updated = sum(1 for exe in exe_paths if exe and self.extract(exe))
+        self.save()
+        return updated
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data, self._dirty = dict(self._index), False
+        try:
+            os.makedirs(ICON_FOLDER, exist_ok=True)
+            tmp_path = INDEX_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, INDEX_PATH)
+        except OSError as e:
+            logger.error(f"IconCache: Could not save index: {e}")
+
+
+_icon_cache = None
+_icon_cache_lock = threading.Lock()
+
+def get_icon_cache():
+    """Instance partagée du cache d'icônes."""
+    global _icon_cache
+    with _icon_cache_lock:
+        if _icon_cache is None:
+            _icon_cache = IconCache()
+        return _icon_cache
@@ -0,0 +1,85 @@
+import itertools
+import threading
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from app_ui.icon_cache import get_icon_cache
+from core.logger import logger
+
+# Threads dédiés aux icônes (lecture PNG / extraction shell), séparés du pool global de Qt
+MAX_WORKERS = 3
+
+
+class _IconJob(QRunnable):
+    def __init__(self, loader, exe_path):
+        super().__init__()
+        self.loader = loader
+        self.exe_path = exe_path
+
+    def run(self):
+        try:
+            image = get_icon_cache().load_image(self.exe_path)
+        except Exception as e:
+            logger.debug(f"IconLoader: {self.exe_path}: {e}")
+            image = None
+        try:
+            self.loader._loaded.emit(self.exe_path, image)
+        except RuntimeError:
+            pass  # service détruit pendant la fermeture de l'application
+
+
+class IconLoader(QObject):
+    """Charge les icônes d'exe en arrière-plan pour les cartes visibles.
+
+    Une seule requête par exe est en vol à la fois ; les plus récentes (cellules visibles
+    à l'instant) passent en priorité. icon_ready(exe) est émis dans le thread UI une fois
+    l'icône placée dans le tier mémoire du cache.
+    """
+    icon_ready = Signal(str)
+    _loaded = Signal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(MAX_WORKERS)
+        self._in_flight = set()
+        self._failed = set()
+        self._priority = itertools.count()
+        self._loaded.connect(self._on_loaded)
+
+    def request(self, exe_path):
+        """Demande l'icône d'un exe (sans effet si déjà en cours ou connue sans icône)."""
+        if not exe_path or exe_path in self._in_flight or exe_path in self._failed:
+            return
+        if get_icon_cache().has_no_icon(exe_path):
+            self._failed.add(exe_path)
+            return
+        self._in_flight.add(exe_path)
+        self._pool.start(_IconJob(self, exe_path), next(self._priority) % (1 << 30))
+
+    def reset_failures(self):
+        """Autorise une nouvelle tentative (après un scan qui a pu extraire de nouvelles icônes)."""
+        self._failed.clear()
+
+    def shutdown(self, timeout_ms=1000):
+        """Abandonne les requêtes en attente et laisse les tâches en cours se terminer."""
+        self._pool.clear()
+        self._pool.waitForDone(timeout_ms)
+
+    def _on_loaded(self, exe_path, image):
+        self._in_flight.discard(exe_path)
+        if image is None:
+            self._failed.add(exe_path)
+            return
+        get_icon_cache().store_pixmap(exe_path, image)
+        self.icon_ready.emit(exe_path)
+
+
+_icon_loader = None
+_icon_loader_lock = threading.Lock()
+
+def get_icon_loader():
+    """Service partagé (à créer depuis le thread UI)."""
+    global _icon_loader
+    with _icon_loader_lock:
+        if _icon_loader is None:
+            _icon_loader = IconLoader()
+        return _icon_loader
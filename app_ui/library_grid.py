@@ -0,0 +1,287 @@
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import Qt, QSize, QRect, QRectF, QAbstractListModel, QModelIndex, QSortFilterProxyModel, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QFontMetrics
+import qtawesome as qta
+from plugins.orchestrator import item_key
+from app_ui.icon_cache import get_icon_cache
+from app_ui.icon_loader import get_icon_loader
+
+# Rôles exposés par GameListModel
+TitleRole = Qt.UserRole + 1
+LauncherRole = Qt.UserRole + 2
+ExeRole = Qt.UserRole + 3
+FavoriteRole = Qt.UserRole + 4
+KeyRole = Qt.UserRole + 5
+ItemRole = Qt.UserRole + 6
+
+CARD_SIZE = QSize(110, 145)
+CARD_SPACING = 25
+ICON_FRAME = 95
+
+# Icônes de marque quand l'exe n'a pas d'icône exploitable
+LAUNCHER_BRAND_ICONS = {
+    "STEAM": ("fa5b.steam", "#171a21"),
+    "EPIC": ("si.epicgames", "#ffffff"),
+    "DISCORD": ("fa5b.discord", "#5865F2"),
+    "BATTLE.NET": ("fa5b.battle-net", "#009ae4"),
+    "UBISOFT": ("si.ubisoft", "#ffffff"),
+    "EA": ("fa5s.play", "#ff4747"),
+    "RIOT": ("si.riotgames", "#d32936")
+}
+
+# Palette des cartes par thème : (fond, fond survol, bordure, bordure survol, cadre icône, bord cadre, titre, badge fond, badge bord, badge texte)
+CARD_THEMES = {
+    "arctic": (QColor(255, 255, 255, 191), QColor(255, 255, 255, 224), QColor(0, 209, 255, 89), QColor(0, 209, 255, 242),
+               QColor("white"), QColor("#e2e8f0"), QColor("#1e293b"), QColor(15, 23, 42, 166), QColor(0, 209, 255, 140), QColor("#e2f8ff")),
+    "dark": (QColor(15, 23, 42, 199), QColor(15, 23, 42, 230), QColor(0, 209, 255, 71), QColor(0, 209, 255, 242),
+             QColor("#1e293b"), QColor("#334155"), QColor("#94a3b8"), QColor(15, 23, 42, 166), QColor(0, 209, 255, 140), QColor("#e2f8ff")),
+    "cyberpunk": (QColor(15, 11, 26, 204), QColor(15, 11, 26, 230), QColor(255, 0, 191, 89), QColor(255, 0, 191, 242),
+                  QColor("#000000"), QColor("#f0abfc"), QColor("#f0abfc"), QColor(0, 0, 0, 140), QColor(255, 0, 191, 140), QColor("#e2f8ff")),
+    "girly": (QColor(255, 255, 255, 191), QColor(255, 255, 255, 224), QColor(255, 77, 166, 89), QColor(255, 77, 166, 242),
+              QColor("#fff1f2"), QColor("#fbcfe8"), QColor("#be185d"), QColor(255, 77, 166, 51), QColor(255, 77, 166, 140), QColor("#4a0033")),
+}
+
+
+class GameListModel(QAbstractListModel):
+    """Bibliothèque complète ({title, launcher, exe}) ; les icônes sont résolues à l'affichage."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
+        self._rows = {}        # {item_key: ligne}
+        self._favorites = set()
+        self._loader = get_icon_loader()
+        self._loader.icon_ready.connect(self._on_icon_ready)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role in (Qt.DisplayRole, TitleRole):
+            return item["title"]
+        if role == LauncherRole:
+            return item["launcher"]
+        if role == ExeRole:
+            return item.get("exe")
+        if role == FavoriteRole:
+            return self.is_favorite(item["title"])
+        if role == KeyRole:
+            return item_key(item)
+        if role == ItemRole:
+            return item
+        if role == Qt.DecorationRole:
+            return self._icon(item)
+        return None
+
+    def _icon(self, item):
+        # Tier mémoire uniquement : sinon l'icône de marque sert de substitut pendant le chargement
+        # en arrière-plan (seules les cellules peintes, donc visibles, demandent leur icône)
+        exe_path = item.get("exe")
+        pix = get_icon_cache().pixmap(exe_path)
+        if pix is None:
+            self._loader.request(exe_path)
+            return brand_icon(item.get("launcher"))
+        return pix
+
+    def _on_icon_ready(self, exe_path):
+        row = self._rows.get(item_key({"exe": exe_path}))
+        if row is not None:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
+
+    def refresh_icons(self):
+        """Signale aux vues que des icônes ont été extraites (les cellules visibles se repeignent)."""
+        self._loader.reset_failures()
+        if self._items:
+            self.dataChanged.emit(self.index(0), self.index(len(self._items) - 1), [Qt.DecorationRole])
+
+    def items(self):
+        return list(self._items)
+
+    def has_item(self, item):
+        return item_key(item) in self._rows
+
+    def set_items(self, items):
+        self.beginResetModel()
+        self._items = list(items)
+        self._rows = {item_key(it): i for i, it in enumerate(self._items)}
+        self.endResetModel()
+
+    def append_items(self, items):
+        """Ajoute les jeux encore inconnus en fin de liste. Retourne le nombre ajouté."""
+        new_items = []
+        for it in items:
+            key = item_key(it)
+            if key not in self._rows:
+                self._rows[key] = len(self._items) + len(new_items)
+                new_items.append(it)
+        if new_items:
+            first = len(self._items)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_items) - 1)
+            self._items.extend(new_items)
+            self.endInsertRows()
+        return len(new_items)
+
+    def is_favorite(self, title):
+        return title in self._favorites
+
+    def set_favorites(self, titles):
+        """Met à jour les favoris ; seules les lignes qui changent sont signalées aux vues."""
+        titles = set(titles)
+        changed = self._favorites ^ titles
+        self._favorites = titles
+        for row, it in enumerate(self._items):
+            if it["title"] in changed:
+                idx = self.index(row)
+                self.dataChanged.emit(idx, idx, [FavoriteRole])
+
+
+_brand_icons = {}
+
+def brand_icon(launcher):
+    """Icône de marque du launcher (manette par défaut), rendue une seule fois."""
+    l_upper = str(launcher).upper()
+    pix = _brand_icons.get(l_upper)
+    if pix is None:
+        if l_upper in LAUNCHER_BRAND_ICONS:
+            icon_name, icon_color = LAUNCHER_BRAND_ICONS[l_upper]
+            pix = qta.icon(icon_name, color=icon_color).pixmap(55, 55)
+        else:
+            pix = qta.icon("fa5s.gamepad", color="#00d1ff").pixmap(50, 50)
+        _brand_icons[l_upper] = pix
+    return pix
+
+
+class GameFilterProxy(QSortFilterProxyModel):
+    """Filtre launcher / favoris : changer de filtre ne fait que recalculer les lignes visibles."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.launcher_filter = "TOUS"
+        self.setDynamicSortFilter(True)
+
+    def set_launcher_filter(self, launcher):
+        self.launcher_filter = launcher
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        flt = self.launcher_filter
+        if flt == "TOUS":
+            return True
+        idx = self.sourceModel().index(source_row, 0, source_parent)
+        if flt == "FAVORIS":
+            return bool(idx.data(FavoriteRole))
+        return str(idx.data(LauncherRole)).upper() == flt
+
+
+class GameCardDelegate(QStyledItemDelegate):
+    """Dessine une carte de jeu (cadre, icône, badge launcher, étoile favori, titre) sans widget."""
+
+    def sizeHint(self, option, index):
+        return CARD_SIZE
+
+    def paint(self, painter, option, index):
+        theme = option.widget.property("theme") if option.widget else None
+        (bg, bg_hover, border, border_hover, frame_bg, frame_border,
+         title_color, badge_bg, badge_border, badge_text) = CARD_THEMES.get(theme or "arctic", CARD_THEMES["arctic"])
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        card = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+
+        if hovered:
+            glow = QColor(border_hover)
+            glow.setAlpha(50)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(glow)
+            painter.drawRoundedRect(card.adjusted(-2, 2, 2, 6), 12, 12)
+        painter.setPen(QPen(border_hover if hovered else border, 1))
+        painter.setBrush(bg_hover if hovered else bg)
+        painter.drawRoundedRect(card, 10, 10)
+
+        # Cadre de l'icône
+        frame = QRectF(option.rect.x() + (option.rect.width() - ICON_FRAME) / 2, option.rect.y() + 5, ICON_FRAME, ICON_FRAME)
+        painter.setPen(QPen(border_hover if hovered else frame_border, 2))
+        painter.setBrush(frame_bg)
+        painter.drawRoundedRect(frame.adjusted(1, 1, -1, -1), 20, 20)
+
+        pix = index.data(Qt.DecorationRole)
+        if pix is not None and not pix.isNull():
+            size = pix.deviceIndependentSize()
+            painter.drawPixmap(int(frame.center().x() - size.width() / 2), int(frame.center().y() - size.height() / 2 + 6), pix)
+
+        # Badge launcher (haut gauche) et étoile favori (haut droite)
+        launcher = str(index.data(LauncherRole)).upper()
+        if launcher != "LAUNCHER":
+            font = QFont(option.font)
+            font.setPixelSize(8)
+            font.setBold(True)
+            painter.setFont(font)
+            text_w = QFontMetrics(font).horizontalAdvance(launcher)
+            badge = QRectF(frame.x() + 6, frame.y() + 4, text_w + 12, 16)
+            painter.setPen(QPen(badge_border, 1))
+            painter.setBrush(badge_bg)
+            painter.drawRoundedRect(badge, 4, 4)
+            painter.setPen(badge_text)
+            painter.drawText(badge, Qt.AlignCenter, launcher)
+        if index.data(FavoriteRole):
+            font = QFont(option.font)
+            font.setPixelSize(14)
+            painter.setFont(font)
+            painter.setPen(QColor("#ffca28"))
+            painter.drawText(QRectF(frame.right() - 22, frame.y() + 2, 16, 18), Qt.AlignCenter, "★")
+
+        # Titre sous l'icône (2 lignes max)
+        font = QFont(option.font)
+        font.setPixelSize(9)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(title_color)
+        title_rect = QRect(option.rect.x() + 5, int(frame.bottom()) + 4, option.rect.width() - 10, option.rect.bottom() - int(frame.bottom()) - 6)
+        painter.drawText(title_rect, Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap, str(index.data(TitleRole)).upper())
+        painter.restore()
+
+
+class LibraryGrid(QListView):
+    """Grille virtualisée : seules les cartes visibles sont peintes, aucun widget par jeu."""
+    launch_requested = Signal(dict)
+    context_requested = Signal(dict, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setMovement(QListView.Static)
+        self.setResizeMode(QListView.Adjust)
+        self.setUniformItemSizes(True)
+        self.setSpacing(CARD_SPACING // 2)
+        self.setGridSize(CARD_SIZE + QSize(CARD_SPACING, CARD_SPACING))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setFrameShape(QListView.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover)
+        self.viewport().setAutoFillBackground(False)
+        self.setStyleSheet("QListView { background: transparent; }")
+        self.setItemDelegate(GameCardDelegate(self))
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._on_context_menu)
+        self.clicked.connect(self._on_clicked)
+
+    def _on_clicked(self, index):
+        self.launch_requested.emit(index.data(ItemRole))
+
+    def _on_context_menu(self, pos):
+        index = self.indexAt(pos)
+        if index.isValid():
+            self.context_requested.emit(index.data(ItemRole), self.viewport().mapToGlobal(pos))
+
+    def mouseMoveEvent(self, event):
+        index = self.indexAt(event.position().toPoint())
+        self.viewport().setCursor(Qt.PointingHandCursor if index.isValid() else Qt.ArrowCursor)
+        super().mouseMoveEvent(event)
@@ -1,30 +1,33 @@
 import sys
 import os
 import json
+import time
+from contextlib import ExitStack
 from core.logger import logger
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QPushButton, QLabel, QLineEdit, 
                                QStackedWidget, QFrame, QScrollArea, QGridLayout,
                                QSizePolicy, QGraphicsDropShadowEffect, QProgressBar,
                                QSplitter, QFileDialog, QInputDialog, QSpacerItem,
-                               QFileIconProvider, QMenu)
-from PySide6.QtCore import Qt, QSize, QTimer, QFileInfo, QThread, Signal, QPoint
-from PySide6.QtGui import QIcon, QColor, QFontDatabase, QFont, QPainter, QPainterPath, QPen, QLinearGradient, QPixmap
+                               QMenu)
+from PySide6.QtCore import Qt, QSize, QRect, QTimer, QThread, Signal, QPoint, QEvent
+from PySide6.QtGui import QIcon, QColor, QFont, QPainter, QPainterPath, QPen, QLinearGradient, QPixmap
 import qtawesome as qta
 from core.database import get_session, GameSession, HardwareSnapshot, CustomGame, Favorite
 from core.telemetry.collector import TelemetryCollector
+from core.telemetry.sampler import IDLE_PERIOD, SampleClock, high_frequency_hz, timer_resolution
 from core.ai.nexus_agent import NexusAgent, load_key
 from core.telemetry.session_manager import SessionManager
-from app_ui.optimization_view import OptimizationView
-
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+from core.telemetry.writer import get_telemetry_writer, shutdown_telemetry_writer
+from core.telemetry.retention import RetentionEngine
+from plugins.scan_cache import ScanCache, load_cached_library
+from plugins.orchestrator import run_scanners, merge_results, LibraryMerger, SOURCE_LABELS
+from app_ui.library_grid import GameListModel, GameFilterProxy, LibraryGrid
+from app_ui.icon_cache import get_icon_cache
+from app_ui.icon_loader import get_icon_loader
+from app_ui import assets
+from app_ui.assets import resource_path
+from core.startup import timeline
 
 class OptimizationWorker(QThread):
     finished = Signal(dict)
@@ -83,7 +86,7 @@ class Sidebar(QFrame):
         self.logo_icon = QLabel()
         self.logo_icon.setObjectName("LogoIcon")
         self.logo_icon.setFixedSize(180, 180)
-        logo_pix = QPixmap(resource_path("assets/logonexuscore.png"))
+        logo_pix = assets.pixmap("assets/logonexuscore.png")
         if not logo_pix.isNull():
             self.logo_icon.setPixmap(logo_pix.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation))
         else:
@@ -235,275 +238,63 @@ class Header(QFrame):
             self.toggle_maximize()
             event.accept()
 
-class GameCard(QFrame):
-
-    def __init__(self, title, launcher, exe_path=None, parent_view=None, is_favorite=False):
-
-        super().__init__(parent_view)
-
-        self.setFixedSize(110, 145) # Juste un peu plus haut pour le badge
-
-        self.setObjectName("GameIcon")
-        self.is_favorite = is_favorite
-        self.setProperty("hovered", False)
-        self._hover_fx = QGraphicsDropShadowEffect(self)
-        self._hover_fx.setBlurRadius(18)
-        self._hover_fx.setOffset(0, 10)
-        # color set in apply_theme via stylesheet (fallback here)
-        self._hover_fx.setColor(QColor(0, 209, 255, 90))
-        self.setGraphicsEffect(self._hover_fx)
-
-        self.exe_path = exe_path
-
-        self.title = title
-
-        self.parent_view = parent_view
-
-        self.setCursor(Qt.PointingHandCursor)
-
-        self.setContextMenuPolicy(Qt.CustomContextMenu)
-
-        self.customContextMenuRequested.connect(self.show_context_menu)
-
-        
-
-        layout = QVBoxLayout(self)
-
-        layout.setContentsMargins(5, 5, 5, 5)
-
-        
-
-        self.icon_frame = QFrame()
-
-        self.icon_frame.setObjectName("IconContainer")
-
-        self.icon_frame.setFixedSize(95, 95)
-
-        # Launcher badge (top-left)
-        l_text = str(launcher).upper()
-        self.launcher_badge = QLabel(l_text)
-        self.launcher_badge.setObjectName("LauncherBadge")
-        self.launcher_badge.setAlignment(Qt.AlignCenter)
-        self.launcher_badge.setFixedHeight(18)
-        if l_text == "LAUNCHER":
-            self.launcher_badge.hide()
-
-        # Favorite star
-        self.fav_lbl = QLabel("★" if is_favorite else "")
-        self.fav_lbl.setStyleSheet("color: #ffca28; font-size: 14px;")
-
-        icon_layout = QVBoxLayout(self.icon_frame)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-
-        badge_row = QHBoxLayout()
-        badge_row.setContentsMargins(5, 2, 5, 0)
-        badge_row.addWidget(self.launcher_badge, alignment=Qt.AlignLeft | Qt.AlignTop)
-        badge_row.addStretch()
-        badge_row.addWidget(self.fav_lbl, alignment=Qt.AlignRight | Qt.AlignTop)
-        icon_layout.addLayout(badge_row)
-
-        # Icon holder
-        self.icon_lbl = QLabel()
-        self.icon_lbl.setAlignment(Qt.AlignCenter)
-
-        # Map for launcher icons if EXE fails or to have a cleaner look
-        launcher_brand_icons = {
-            "STEAM": ("fa5b.steam", "#171a21"),
-            "EPIC": ("si.epicgames", "#ffffff"),
-            "DISCORD": ("fa5b.discord", "#5865F2"),
-            "BATTLE.NET": ("fa5b.battle-net", "#009ae4"),
-            "UBISOFT": ("si.ubisoft", "#ffffff"),
-            "EA": ("fa5s.play", "#ff4747"),
-            "RIOT": ("si.riotgames", "#d32936")
-        }
-
-        icon_set = False
-        l_upper = str(launcher).upper()
-        
-        # Priority 1: High quality EXE icon
-        if self.exe_path and os.path.exists(self.exe_path):
-            try:
-                file_info = QFileInfo(self.exe_path)
-                icon = QFileIconProvider().icon(file_info)
-                pix = icon.pixmap(256, 256) 
-                if not pix.isNull():
-                    self.icon_lbl.setPixmap(pix.scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                    icon_set = True
-            except: pass
-
-        # Priority 2: Brand Icon for launchers or fallback
-        if not icon_set:
-            if l_upper in launcher_brand_icons:
-                icon_name, icon_color = launcher_brand_icons[l_upper]
-                self.icon_lbl.setPixmap(qta.icon(icon_name, color=icon_color).pixmap(55, 55))
-            else:
-                self.icon_lbl.setPixmap(qta.icon("fa5s.gamepad", color="#00d1ff").pixmap(50, 50))
-
-            
-
-        icon_layout.addWidget(self.icon_lbl)
-
-        
-
-        self.title_lbl = QLabel(title)
-
-        self.title_lbl.setObjectName("GameIconTitle")
-
-        self.title_lbl.setAlignment(Qt.AlignCenter)
-
-        self.title_lbl.setWordWrap(True)
-
-        
-
-        layout.addWidget(self.icon_frame, alignment=Qt.AlignCenter)
-
-        layout.addWidget(self.title_lbl)
-
-
-
-    def show_context_menu(self, pos):
-
-        menu = QMenu(self)
-
-        menu.setObjectName("HUDMenu")
-
-        # Optimize Action
-        opt_action = menu.addAction(self.parent_view.parent_win.tr("ctx_optimize"))
-        opt_action.setIcon(qta.icon("fa5s.magic", color="#00d1ff"))
-        
-        menu.addSeparator()
-
-        fav_text = "RETIRER DES FAVORIS" if self.is_favorite else "AJOUTER AUX FAVORIS"
-        fav_action = menu.addAction(fav_text)
-        
-        menu.addSeparator()
-        delete_action = menu.addAction("RETIRER DU NEXUS")
-
-        action = menu.exec(self.mapToGlobal(pos))
-
-        if action == delete_action:
-            self.parent_view.delete_game(self.title)
-        elif action == fav_action:
-            self.parent_view.toggle_favorite(self.title)
-        elif action == opt_action:
-            self.parent_view.parent_win.run_optimization(self.title)
-
-
-
-    def enterEvent(self, event):
-        self.setProperty("hovered", True)
-        self.style().unpolish(self)
-        self.style().polish(self)
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.setProperty("hovered", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
-        super().leaveEvent(event)
-
-    def mousePressEvent(self, event):
-
-        if event.button() == Qt.LeftButton:
-
-            if self.exe_path and os.path.exists(self.exe_path):
-
-                try: os.startfile(self.exe_path)
-
-                except: pass
-
-        super().mousePressEvent(event)
-
-
-
 class ScanWorker(QThread):
+    batch_found = Signal(list)
     finished = Signal(list)
+    icons_ready = Signal()
+
+    BATCH_SIZE = 24
 
     def run(self):
         all_items = []
-        seen_exes = set()
-        seen_titles = set()
         logger.info("Library: Starting system-wide game scan...")
-        
-        def add_item(title, launcher, exe):
-            title_norm = title.lower().strip()
-            if not exe:
-                if title_norm not in seen_titles:
-                    all_items.append({"title": title, "launcher": launcher, "exe": None})
-                    seen_titles.add(title_norm)
-                return
-            
-            normalized_exe = os.path.normpath(exe).lower()
-            if normalized_exe not in seen_exes:
-                all_items.append({"title": title, "launcher": launcher, "exe": exe})
-                seen_exes.add(normalized_exe)
-                seen_titles.add(title_norm)
+        t0 = time.perf_counter()
 
         try:
-            # Launchers
-            from plugins.scanner_launchers.scanner import scan_launchers
-            launchers = scan_launchers()
-            for l in launchers:
-                add_item(l['title'], "Launcher", l['exe'])
-            
-            # Steam
-            from plugins.scanner_steam.scanner import scan_steam_games
-            for g in scan_steam_games():
-                exe_p = None
-                if os.path.exists(g['install_dir']):
-                    for f in os.listdir(g['install_dir']):
-                        if f.endswith(".exe") and not any(x in f.lower() for x in ["unity", "crash", "helper", "redist", "setup"]):
-                            exe_p = os.path.join(g['install_dir'], f)
-                            break
-                add_item(g['title'], "Steam", exe_p)
-
-            # Epic
-            from plugins.scanner_epic import scan_epic_games
-            for g in scan_epic_games():
-                add_item(g['title'], "Epic", g['exe'])
-
-            # Ubisoft
-            try:
-                from plugins.scanner_ubisoft import scan_ubisoft_games
-                for g in scan_ubisoft_games():
-                    add_item(g['title'], "Ubisoft", g['exe'])
-            except: pass
-
-            # EA
-            try:
-                from plugins.scanner_ea import scan_ea_games
-                for g in scan_ea_games():
-                    add_item(g['title'], "EA", g['exe'])
-            except: pass
+            # Cache persistant : seuls les manifests / clés de registre modifiés sont re-parsés
+            cache = ScanCache()
 
-            # Battle.net
-            try:
-                from plugins.scanner_battlenet import scan_battlenet_games
-                for g in scan_battlenet_games():
-                    add_item(g['title'], "Battle.net", g['exe'])
-            except: pass
+            # Scanners en parallèle : les jeux de chaque source terminée sont publiés aussitôt
+            # par petits lots (dédup provisoire, dans l'ordre d'arrivée). La liste finale est
+            # refusionnée dans l'ordre canonique et sert à la réconciliation de la grille.
+            stream = LibraryMerger()
+            def on_result(source, games, elapsed_ms):
+                label = SOURCE_LABELS[source]
+                new_items = [stream.items[-1] for g in games if stream.add_item(g['title'], label, g.get('exe'))]
+                for i in range(0, len(new_items), self.BATCH_SIZE):
+                    self.batch_found.emit(new_items[i:i + self.BATCH_SIZE])
 
-            # Riot
-            try:
-                from plugins.scanner_riot import scan_riot_games
-                for g in scan_riot_games():
-                    add_item(g['title'], "Riot", g['exe'])
-            except: pass
+            results, status = run_scanners(cache=cache, on_result=on_result)
 
             # Custom
             db = get_session()
-            custom_games = db.query(CustomGame).all()
-            for g in custom_games:
-                add_item(g.title, "Custom", g.exe_path)
+            custom_games = [(g.title, "Custom", g.exe_path) for g in db.query(CustomGame).all()]
             db.close()
+            all_items = merge_results(results, extra=custom_games)
+
+            cache.set_library(all_items)
+            cache.save(sources=list(results))
             
-            logger.info(f"Library: Scan complete. Deduplicated total: {len(all_items)}")
+            timings = [f"{source} {state}" + (f" ({cache.summary(source)})" if source in results else "")
+                       for source, state in status.items()]
+            logger.info(f"Library: Source timings -> {' | '.join(timings)}")
+            logger.info(f"Library: Scan complete in {(time.perf_counter() - t0) * 1000:.0f}ms. Deduplicated total: {len(all_items)}")
             
         except Exception as e:
             logger.error(f"Library: Fatal error during scan: {e}", exc_info=True)
             
         self.finished.emit(all_items)
 
+        # Icônes : extraites une seule fois ici (hors thread UI), puis relues depuis data/icons
+        try:
+            t0 = time.perf_counter()
+            updated = get_icon_cache().warm(it.get("exe") for it in all_items)
+            if updated:
+                logger.info(f"Library: {updated} icons extracted in {(time.perf_counter() - t0) * 1000:.0f}ms.")
+                self.icons_ready.emit()
+        except Exception as e:
+            logger.error(f"Library: Icon extraction failed: {e}")
+
 class AIWorker(QThread):
     response_ready = Signal(str)
 
@@ -518,65 +309,125 @@ class AIWorker(QThread):
         response = self.agent.get_response(self.user_input, hardware_stats=self.stats, is_gaming=self.is_gaming)
         self.response_ready.emit(response)
 
+# Mesures LHM lues par les cartes du tableau de bord et par l'enregistreur de sessions
+DASHBOARD_METRICS = ("cpu_temp", "gpu_temp", "gpu_load")
+RECORDER_METRICS = ("gpu_temp", "gpu_load")
+
 class TelemetryWorker(QThread):
     stats_ready = Signal(dict, bool) # sends stats and is_gaming status
 
-    def __init__(self, collector, session_mgr):
+    # Échéances en temps d'échantillonnage (ms), indépendantes de la cadence des relevés
+    UI_INTERVAL_MS = 1000
+    GAME_CHECK_INTERVAL_MS = 5000
+    LOG_INTERVAL_GAMING_MS = 2000
+    LOG_INTERVAL_IDLE_MS = 15000
+
+    def __init__(self, collector, session_mgr, speed=1.0):
         super().__init__()
         self.collector = collector
         self.session_mgr = session_mgr
+        # speed > 1 : horloge accélérée (rejeu d'un enregistrement, benchs)
+        self.speed = speed
         self.running = True
-        self.db_counter = 0
+        self.writer = get_telemetry_writer()
+        self.dashboard_visible = True
+        # Mode haute fréquence pendant les sessions de jeu (opt-in, voir core.telemetry.sampler)
+        self.hf_hz = high_frequency_hz()
+        self.high_frequency = False
+        self.sampler = SampleClock(speed=speed)
+        self._timer_resolution = ExitStack()
+
+    def _set_high_frequency(self, enabled):
+        if enabled == self.high_frequency:
+            return
+        self.high_frequency = enabled
+        if enabled:
+            self.sampler.set_period(1.0 / self.hf_hz)
+            self.collector.set_sample_period(self.sampler.period)
+            self.writer.set_expected_rate(self.hf_hz)
+            self._timer_resolution.enter_context(timer_resolution())
+            logger.info(f"TelemetryWorker: High-frequency capture on ({self.hf_hz} Hz).")
+        else:
+            self.sampler.set_period(IDLE_PERIOD)
+            self.collector.set_sample_period(self.sampler.period)
+            self.writer.set_expected_rate(0)
+            self._timer_resolution.close()
+            logger.info(f"TelemetryWorker: High-frequency capture off ({self.sampler.overruns} overruns so far).")
 
     def run(self):
-        logger.info("TelemetryWorker: Background thread started.")
+        logger.info(f"TelemetryWorker: Background thread started (high frequency: {self.hf_hz or 'off'} Hz).")
+        if self.dashboard_visible:
+            self.collector.subscribe("dashboard", DASHBOARD_METRICS, 1)
+        next_ui = next_game_check = next_log = 0
+        is_gaming = False
         while self.running:
+            now_ms = self.sampler.sampled_ms
             try:
-                # 1. Collect Stats (every 1s)
+                # 1. Collect Stats (every tick: 1s, or 1/hf_hz during a session in high frequency)
                 stats = self.collector.get_stats()
                 
                 # 2. Check for gaming (Every 5s)
-                if self.db_counter % 5 == 0:
+                if now_ms >= next_game_check:
                     is_gaming = self.session_mgr.check_running_games()
+                    next_game_check = now_ms + self.GAME_CHECK_INTERVAL_MS
                 else:
                     is_gaming = self.session_mgr.current_session is not None
                 
-                # 3. Send to UI
-                self.stats_ready.emit(stats, is_gaming)
+                # 3. Send to UI (1 Hz whatever the sampling rate)
+                if now_ms >= next_ui:
+                    self.stats_ready.emit(stats, is_gaming)
+                    next_ui = now_ms + self.UI_INTERVAL_MS
                 
                 # 4. Database Writing
                 session_id = self.session_mgr.get_current_session_id()
-                log_interval = 2 if is_gaming else 15
+                high_frequency = bool(self.hf_hz) and is_gaming
+                if high_frequency:
+                    log_interval = round(1000 / self.hf_hz)
+                else:
+                    log_interval = self.LOG_INTERVAL_GAMING_MS if is_gaming else self.LOG_INTERVAL_IDLE_MS
+                self.collector.subscribe("recorder", RECORDER_METRICS, log_interval / 1000)
                 
-                if self.db_counter % log_interval == 0:
-                    db_session = get_session()
-                    snapshot = HardwareSnapshot(
-                        cpu_usage=stats["cpu"],
+                if now_ms >= next_log:
+                    # Écriture différée : le writer regroupe les lignes en une transaction.
+                    # En haute fréquence, valeurs brutes : le lissage effacerait les pics recherchés
+                    suffix = "_raw" if high_frequency else ""
+                    self.writer.submit(
+                        cpu_usage=stats.get(f"cpu{suffix}", stats["cpu"]),
                         ram_usage=stats["ram"],
-                        gpu_usage=stats.get("gpu", 0),
+                        gpu_usage=stats.get(f"gpu{suffix}", stats.get("gpu", 0)),
                         gpu_temp=stats.get("gpu_temp", 0),
                         session_id=session_id
                     )
-                    db_session.add(snapshot)
-                    db_session.commit()
-                    db_session.close()
-                
-                self.db_counter += 1
-                if self.db_counter > 1000: self.db_counter = 0
+                    next_log = now_ms + log_interval
+
+                self._set_high_frequency(high_frequency)
                 
             except Exception as e:
                 logger.error(f"TelemetryWorker Error: {e}")
             
-            self.msleep(1000)
+            # Échéance suivante sur horloge monotone : le temps de relevé est déduit de l'attente
+            self.sampler.wait()
+        self._timer_resolution.close()
+
+    def set_dashboard_visible(self, visible):
+        """Fenêtre réduite : les cartes ne sont plus peintes, leurs capteurs ne sont plus interrogés."""
+        self.dashboard_visible = visible
+        if visible:
+            self.collector.subscribe("dashboard", DASHBOARD_METRICS, 1)
+        else:
+            self.collector.unsubscribe("dashboard")
 
     def stop(self):
         self.running = False
 
 class GamesView(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, cached_library=None):
         super().__init__(parent)
         self.parent_win = parent
-        self.full_games_list = [] # Cache for filtering
+        # Bibliothèque complète (modèle) et vue filtrée (proxy) : la grille ne peint que les cartes visibles
+        self.games_model = GameListModel(self)
+        self.games_proxy = GameFilterProxy(self)
+        self.games_proxy.setSourceModel(self.games_model)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(40, 40, 40, 40)
@@ -649,56 +500,67 @@ class GamesView(QWidget):
         self.filter_buttons["TOUS"].setChecked(True)
         layout.addLayout(filter_layout)
         
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.content_widget = QWidget()
-        self.grid = QGridLayout(self.content_widget)
-        self.grid.setSpacing(25)
-        self.grid.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        scroll.setWidget(self.content_widget)
-        layout.addWidget(scroll)
+        self.grid = LibraryGrid()
+        self.grid.setModel(self.games_proxy)
+        self.grid.launch_requested.connect(self.launch_game)
+        self.grid.context_requested.connect(self.show_game_menu)
+        layout.addWidget(self.grid)
 
         self.scan_thread = None
+        # Affichage immédiat de la dernière bibliothèque connue, puis rescan incrémental
+        self.games_model.set_items(cached_library if cached_library is not None else load_cached_library())
+        self.update_display()
         self.refresh_games()
 
     def set_launcher_filter(self, launcher):
         self.active_launcher = launcher
         for name, btn in self.filter_buttons.items():
             btn.setChecked(name == launcher)
-        self.update_display() # No full scan here
+        self.games_proxy.set_launcher_filter(launcher) # No full scan here
+        self.update_count()
 
     def update_display(self):
-        """Updates the grid based on cached list and filter."""
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-            
-        flt = self.active_launcher
-        
-        # Récupérer les favoris depuis la DB
+        """Recharge les favoris depuis la DB ; le proxy ne refiltre que les lignes concernées."""
         db = get_session()
-        fav_titles = [f.game_title for f in db.query(Favorite).all()]
+        fav_titles = {f.game_title for f in db.query(Favorite).all()}
         db.close()
+        self.games_model.set_favorites(fav_titles)
+        self.update_count()
 
-        if flt == "TOUS":
-            filtered = self.full_games_list
-        elif flt == "FAVORIS":
-            filtered = [it for it in self.full_games_list if it["title"] in fav_titles]
-        else:
-            filtered = [it for it in self.full_games_list if it.get("launcher", "").upper() == flt]
+    def update_count(self, scanning=False):
+        count = self.games_proxy.rowCount()
+        self.count_lbl.setText(f"SCANNING... {count} ELEMENTS" if scanning else f"{count} ELEMENTS")
 
-        # CALCUL DYNAMIQUE DES COLONNES
-        available_width = self.width() - 260 - 300 # Fenêtre - Sidebar - Chat approx
-        cols = max(1, available_width // 135) # 110px card + 25px spacing
+    def launch_game(self, item):
+        exe_path = item.get("exe")
+        if exe_path and os.path.exists(exe_path):
+            try: os.startfile(exe_path)
+            except: pass
 
-        for i, item in enumerate(filtered):
-            is_fav = item["title"] in fav_titles
-            card = GameCard(item["title"], item["launcher"], exe_path=item.get("exe"), parent_view=self, is_favorite=is_fav)
-            self.grid.addWidget(card, i // cols, i % cols) 
+    def show_game_menu(self, item, global_pos):
+        menu = QMenu(self)
+        menu.setObjectName("HUDMenu")
+
+        # Optimize Action
+        opt_action = menu.addAction(self.parent_win.tr("ctx_optimize"))
+        opt_action.setIcon(qta.icon("fa5s.magic", color="#00d1ff"))
         
-        self.count_lbl.setText(f"{len(filtered)} ELEMENTS")
+        menu.addSeparator()
+
+        fav_text = "RETIRER DES FAVORIS" if self.games_model.is_favorite(item["title"]) else "AJOUTER AUX FAVORIS"
+        fav_action = menu.addAction(fav_text)
+        
+        menu.addSeparator()
+        delete_action = menu.addAction("RETIRER DU NEXUS")
+
+        action = menu.exec(global_pos)
+
+        if action == delete_action:
+            self.delete_game(item["title"])
+        elif action == fav_action:
+            self.toggle_favorite(item["title"])
+        elif action == opt_action:
+            self.parent_win.run_optimization(item["title"])
 
     def add_custom_game(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Sélectionner l'exécutable", "", "Exécutables (*.exe)")
@@ -720,14 +582,23 @@ class GamesView(QWidget):
         self.scan_btn.setEnabled(False)
         
         self.scan_thread = ScanWorker()
+        self.scan_thread.batch_found.connect(self.on_scan_batch)
         self.scan_thread.finished.connect(self.on_scan_finished)
+        self.scan_thread.icons_ready.connect(self.games_model.refresh_icons)
         self.scan_thread.start()
 
+    def on_scan_batch(self, items):
+        """Ajoute en fin de grille les jeux découverts qui ne sont pas encore affichés."""
+        self.games_model.append_items(items)
+        self.update_count(scanning=True)
+
     def on_scan_finished(self, all_items):
         self.scan_btn.setEnabled(True)
-        self.full_games_list = all_items
         self.parent_win.session_mgr.update_games_list(all_items)
-        self.update_display()
+        # Réconciliation : la liste finale (ordre canonique, entrées périmées retirées) remplace le modèle
+        if all_items != self.games_model.items():
+            self.games_model.set_items(all_items)
+        self.update_count()
 
     def toggle_favorite(self, title):
         db = get_session()
@@ -756,23 +627,44 @@ class GamesView(QWidget):
 # --- TECH GEOMETRY COMPONENTS ---
 
 class TechFrame(QFrame):
-    """Un cadre avec des angles coupés et des bordures néon style HUD."""
+    """Un cadre avec des angles coupés et des bordures néon style HUD.
+
+    Le décor (fond, bordures, texture) est rendu une fois par taille / thème / survol dans un
+    pixmap ; les repaints (valeurs qui changent chaque seconde) ne recopient que la zone modifiée.
+    """
+    chrome_image = None   # texture étirée sur tout le cadre (assets/...) ; sinon cadre vectoriel
+
     def __init__(self, parent=None, color="#00d1ff"):
         super().__init__(parent)
         self.color = QColor(color)
         self.bg_color = QColor(255, 255, 255, 240)
         self.hover = False
+        self._chrome = None
+        self._chrome_key = None
 
-    def paintEvent(self, event):
-        # If we have an object name, we might want to let QSS handle the styling (PNG textures)
-        if self.objectName() in ["StatCard", "ThermalCard"]:
-            return super().paintEvent(event)
+    def chrome_pixmap(self):
+        w, h = self.width(), self.height()
+        dpr = self.devicePixelRatioF()
+        key = (w, h, dpr, self.color.rgba(), self.bg_color.rgba(), self.hover and not self.chrome_image)
+        if key != self._chrome_key:
+            pix = QPixmap(max(1, int(w * dpr)), max(1, int(h * dpr)))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            painter = QPainter(pix)
+            self.paint_chrome(painter, w, h)
+            painter.end()
+            self._chrome, self._chrome_key = pix, key
+        return self._chrome
+
+    def paint_chrome(self, painter, w, h):
+        if self.chrome_image:
+            texture = assets.pixmap(self.chrome_image)
+            if not texture.isNull():
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.drawPixmap(QRect(0, 0, w, h), texture)
+            return
 
-        painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Dimensions
-        w, h = self.width(), self.height()
         cut = 15 
         
         path = QPainterPath()
@@ -804,10 +696,18 @@ class TechFrame(QFrame):
         painter.drawLine(0, 0, 0, cut)
         painter.drawLine(w, h, w - cut, h)
         painter.drawLine(w, h, w, h - cut)
-        
+
+    def paintEvent(self, event):
+        chrome = self.chrome_pixmap()
+        dpr = chrome.devicePixelRatio()
+        r = event.rect()
+        painter = QPainter(self)
+        painter.drawPixmap(r, chrome, QRect(int(r.x() * dpr), int(r.y() * dpr), int(r.width() * dpr), int(r.height() * dpr)))
         painter.end()
 
 class StatCard(TechFrame):
+    chrome_image = "assets/telemetrycard1.png"
+
     def __init__(self, title, icon_name, color_hex, progress_type, parent=None):
         super().__init__(parent, color_hex)
         self.setObjectName("StatCard")
@@ -854,10 +754,15 @@ class StatCard(TechFrame):
         super().leaveEvent(event)
 
     def update_data(self, value_text, usage_percent):
-        self.value_lbl.setText(value_text)
-        self.progress.setValue(int(usage_percent))
+        # Seules les zones réellement modifiées sont repeintes
+        if value_text != self.value_lbl.text():
+            self.value_lbl.setText(value_text)
+        if int(usage_percent) != self.progress.value():
+            self.progress.setValue(int(usage_percent))
 
 class ThermalCard(TechFrame):
+    chrome_image = "assets/telemetrycard2.png"
+
     def __init__(self, title, temp_val, parent=None):
         super().__init__(parent, color="#00d1ff")
         self.setObjectName("ThermalCard")
@@ -889,7 +794,9 @@ class ThermalCard(TechFrame):
         layout.addWidget(self.badge)
         
     def update_temp(self, temp):
-        self.temp_lbl.setText(f"{temp:.1f}°C")
+        text = f"{temp:.1f}°C"
+        if text != self.temp_lbl.text():
+            self.temp_lbl.setText(text)
 
     def enterEvent(self, event):
         self.hover = True
@@ -903,7 +810,14 @@ class ThermalCard(TechFrame):
 
 
 class BackgroundGrid(QWidget):
-    """Futuristic layered background driven by images and theme tokens."""
+    """Futuristic layered background driven by images and theme tokens.
+
+    Les trois calques sont composés une seule fois par taille / thème dans un pixmap :
+    un repaint se résume à un blit. Pendant un redimensionnement, le dernier calque est
+    étiré en transformation rapide, puis recomposé en qualité lissée une fois la taille stable.
+    """
+    RESIZE_SETTLE_MS = 150
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.theme_name = "arctic"
@@ -912,60 +826,66 @@ class BackgroundGrid(QWidget):
         self.hud_pixmap = None
         self.noise_pixmap = None
         self.mask_path = None # Will be set by parent resizeEvent
-        self.load_assets()
+        self._layer = None
+        self._layer_key = None
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self._settle_timer.timeout.connect(self.update)
+        self._assets_loaded = False
 
     def load_assets(self):
+        """Calques chargés au premier rendu (cache partagé avec le splash)."""
         # Layer 1: Base (100% opacity)
-        base_p = resource_path("assets/backgroundmain.png")
-        if os.path.exists(base_p):
-            self.base_pixmap = QPixmap(base_p)
-        
+        self.base_pixmap = assets.pixmap("assets/backgroundmain.png")
         # Layer 2: HUD Overlay (~40% opacity)
-        hud_p = resource_path("assets/background2.png")
-        if os.path.exists(hud_p):
-            self.hud_pixmap = QPixmap(hud_p)
-            
+        self.hud_pixmap = assets.pixmap("assets/background2.png")
         # Layer 3: Noise / Grid (~6% opacity)
-        noise_p = resource_path("assets/background3.png")
-        if os.path.exists(noise_p):
-            self.noise_pixmap = QPixmap(noise_p)
+        self.noise_pixmap = assets.pixmap("assets/background3.png")
+        self._assets_loaded = True
+        self._layer_key = None
 
     def set_theme(self, theme_name: str, accent_hex: str, base_bg: QColor):
         self.theme_name = theme_name
         self.theme_color = QColor(accent_hex)
         # We could potentially swap base_pixmap here if themes have different bases
         # but following conseildegpt.txt, we focus on the 3-layer structure.
+        self._layer_key = None
         self.update()
 
-    def paintEvent(self, event):
+    def resizeEvent(self, event):
+        self._settle_timer.start()
+        super().resizeEvent(event)
+
+    def _render_layers(self):
+        """Compose base + HUD + bruit à la taille courante (rendu lissé, une fois par taille / thème)."""
+        if not self._assets_loaded:
+            self.load_assets()
         w, h = self.width(), self.height()
-        painter = QPainter(self)
+        dpr = self.devicePixelRatioF()
+        layer = QPixmap(max(1, int(w * dpr)), max(1, int(h * dpr)))
+        layer.setDevicePixelRatio(dpr)
+        layer.fill(Qt.transparent)
+
+        painter = QPainter(layer)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
         painter.setRenderHint(QPainter.Antialiasing)
-
-        # Apply Rounded Mask if available
-        if self.mask_path:
-            painter.setClipPath(self.mask_path)
-        else:
-            # Fallback default rounding
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, w, h, 15, 15)
-            painter.setClipPath(path)
+        rect = QRect(0, 0, w, h)
 
         # --- Layer 1: Background BASE (100% opacity) ---
         if self.base_pixmap and not self.base_pixmap.isNull():
             painter.setOpacity(1.0)
-            painter.drawPixmap(self.rect(), self.base_pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
+            painter.drawPixmap(rect, self.base_pixmap.scaled(layer.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
         else:
             # Fallback gradient
             grad = QLinearGradient(0, 0, w, h)
             grad.setColorAt(0, QColor(255, 255, 255)); grad.setColorAt(1, QColor(226, 244, 255))
-            painter.fillRect(self.rect(), grad)
+            painter.fillRect(rect, grad)
 
         # --- Layer 2: HUD Overlay (~20% opacity) ---
         if self.hud_pixmap and not self.hud_pixmap.isNull():
             painter.setOpacity(0.40)
-            painter.drawPixmap(self.rect(), self.hud_pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
+            painter.drawPixmap(rect, self.hud_pixmap.scaled(layer.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
         else:
             # Fallback HUD lines if image is missing
             painter.setOpacity(0.15)
@@ -980,14 +900,43 @@ class BackgroundGrid(QWidget):
         if self.noise_pixmap and not self.noise_pixmap.isNull():
             painter.setOpacity(0.06)
             # Tiling logic
-            painter.drawTiledPixmap(self.rect(), self.noise_pixmap)
+            painter.drawTiledPixmap(rect, self.noise_pixmap)
         else:
-            # Fallback dots
+            # Fallback dots : une seule tuile rendue puis répétée
             painter.setOpacity(0.05)
             dot_gap = 40
-            for x in range(0, w, dot_gap):
-                for y in range(0, h, dot_gap):
-                    painter.drawPoint(x, y)
+            tile = QPixmap(dot_gap, dot_gap)
+            tile.fill(Qt.transparent)
+            tile_painter = QPainter(tile)
+            tile_painter.drawPoint(0, 0)
+            tile_painter.end()
+            painter.drawTiledPixmap(rect, tile)
+        painter.end()
+        return layer
+
+    def paintEvent(self, event):
+        w, h = self.width(), self.height()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Apply Rounded Mask if available
+        if self.mask_path:
+            painter.setClipPath(self.mask_path)
+        else:
+            # Fallback default rounding
+            path = QPainterPath()
+            path.addRoundedRect(0, 0, w, h, 15, 15)
+            painter.setClipPath(path)
+
+        key = (w, h, self.devicePixelRatioF(), self.theme_name, self.theme_color.rgba())
+        if self._layer is not None and self._layer_key != key and self._settle_timer.isActive():
+            # Redimensionnement en cours : ancien calque étiré sans lissage
+            painter.drawPixmap(self.rect(), self._layer)
+        else:
+            if self._layer_key != key:
+                self._layer = self._render_layers()
+                self._layer_key = key
+            painter.drawPixmap(0, 0, self._layer)
         
         # Border stroke to clean edges
         painter.setClipping(False) # Disable clipping to draw the border ON TOP
@@ -1184,7 +1133,8 @@ class SideGrip(QWidget):
             event.accept()
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, collector=None, cached_library=None):
+        """collector / cached_library : services déjà préparés par le bootstrap (sinon créés ici)."""
         super().__init__()
         self.setObjectName("MainWin")
         
@@ -1209,10 +1159,8 @@ class MainWindow(QMainWindow):
         # Thème initial
         self.setProperty("theme", "arctic")
         
-        self.collector = TelemetryCollector()
-
-
-        self.nexus_ai = NexusAgent(api_key=load_key())
+        self.collector = collector or TelemetryCollector()
+        self._nexus_ai = None   # créé au premier usage (voir nexus_ai)
         self.session_mgr = SessionManager()
         
         # Central Widget
@@ -1244,7 +1192,8 @@ class MainWindow(QMainWindow):
         self.stack = QStackedWidget()
         
         # 1. Library View
-        self.games_view = GamesView(self)
+        with timeline.phase("window.library"):
+            self.games_view = GamesView(self, cached_library)
         self.stack.addWidget(self.games_view)
         
         # 2. Telemetry View
@@ -1383,11 +1332,18 @@ class MainWindow(QMainWindow):
         self.clock_timer.start(1000) 
         
         # Start Telemetry Worker
+        # Dernier relevé reçu du worker : l'UI le réutilise au lieu d'échantillonner elle-même
+        self.last_stats = None
         self.tele_worker = TelemetryWorker(self.collector, self.session_mgr)
         self.tele_worker.stats_ready.connect(self.update_telemetry_ui)
         self.tele_worker.start()
+
+        # Agrégation 1 min / 1 h et purge des anciens relevés (arrière-plan)
+        self.retention = RetentionEngine()
+        self.retention.start()
         
-        self.load_styles()
+        with timeline.phase("window.styles"):
+            self.load_styles()
         self.retranslate_ui() # Apply initial language
         
         # FINAL SETUP: Grips for resizing (Ensures they are on top of everything)
@@ -1400,6 +1356,13 @@ class MainWindow(QMainWindow):
             
         logger.info(f"UI Initialized: {self.width()}x{self.height()} | Theme: arctic | Lang: {self.current_lang}")
 
+    @property
+    def nexus_ai(self):
+        """Agent IA créé au premier message / optimisation : client Groq et profils chargés à la demande."""
+        if self._nexus_ai is None:
+            self._nexus_ai = NexusAgent(api_key=load_key())
+        return self._nexus_ai
+
     def update_clock(self):
         from datetime import datetime
         self.header.time_lbl.setText(f"LCL {datetime.now().strftime('%H:%M:%S')}")
@@ -1432,7 +1395,7 @@ class MainWindow(QMainWindow):
         self.chat_vbox.addWidget(self.ai_thinking_lbl)
         
         # Start background task
-        stats = self.collector.get_stats()
+        stats = self.current_stats()
         is_gaming = self.session_mgr.check_running_games()
         self.ai_thread = AIWorker(self.nexus_ai, msg, stats, is_gaming)
         self.ai_thread.response_ready.connect(self.on_ai_response)
@@ -1447,7 +1410,14 @@ class MainWindow(QMainWindow):
         # Scroll to bottom
         self.chat_history.verticalScrollBar().setValue(self.chat_history.verticalScrollBar().maximum())
 
+    def current_stats(self):
+        """Stats matérielles pour l'IA : dernier relevé du TelemetryWorker (relevé direct avant le premier)."""
+        if self.last_stats is not None:
+            return dict(self.last_stats)
+        return self.collector.get_stats()
+
     def update_telemetry_ui(self, stats, is_gaming):
+        self.last_stats = stats
         # Update UI Cards
         self.card_cpu.update_data(f"{stats['cpu']}%", stats['cpu'])
         self.card_ram.update_data(f"{stats['ram']}%", stats['ram'])
@@ -1462,6 +1432,23 @@ class MainWindow(QMainWindow):
         if stats.get('gpu_temp'):
             self.temp_gpu_card.update_temp(stats['gpu_temp'])
 
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange and hasattr(self, "tele_worker"):
+            self.tele_worker.set_dashboard_visible(not self.isMinimized())
+        super().changeEvent(event)
+
+    def closeEvent(self, event):
+        # Arrêt propre : plus de relevés, session clôturée, buffer télémétrie vidé sur disque
+        self.tele_worker.stop()
+        self.tele_worker.wait(3000)
+        self.session_mgr.end_session()
+        self.retention.stop()
+        shutdown_telemetry_writer()
+        self.collector.close()
+        get_icon_loader().shutdown()
+        get_icon_cache().save()
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         self.bg.setGeometry(0, 0, self.width(), self.height())
         
@@ -1484,20 +1471,11 @@ class MainWindow(QMainWindow):
         path = QPainterPath()
         path.addRoundedRect(self.rect(), 15, 15)
         self.bg.mask_path = path
-        
-        # Mettre à jour la grille de jeux si on est sur l'onglet bibliothèque
-        if hasattr(self, 'stack') and self.stack.currentIndex() == 0:
-            self.games_view.update_display()
         super().resizeEvent(event)
 
     def load_styles(self):
-        # Load custom font
-        font_path = resource_path("assets/Orbitron-Bold.ttf")
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                family = QFontDatabase.applicationFontFamilies(font_id)[0]
-                logger.info(f"UI: Loaded custom font -> {family}")
+        # Load custom font (déjà enregistrée si le splash l'a utilisée)
+        assets.font_family()
         
         try:
             qss_path = resource_path("app_ui/styles.qss")
@@ -1613,11 +1591,12 @@ class MainWindow(QMainWindow):
         logger.info(f"Optimization: Starting analysis for {game_title}")
         
         # 1. Open Window Immediately (Loading State)
+        from app_ui.optimization_view import OptimizationView
         self.opt_view = OptimizationView(self, game_title)
         self.opt_view.show()
         
         # 2. Get Hardware & Config (Async simulation for UI fluidity)
-        hardware = self.collector.get_stats()
+        hardware = self.current_stats()
         current_config = self.nexus_ai.config_reader.get_settings(game_title)
         
         if not current_config:
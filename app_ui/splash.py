@@ -1,15 +1,8 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGraphicsDropShadowEffect
 from PySide6.QtCore import Qt, QTimer, QRect, QSize, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QPixmap, QPainter, QColor, QFont, QFontDatabase, QLinearGradient, QPen, QPainterPath
-import os
-import sys
-
-def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+from PySide6.QtGui import QPixmap, QPainter, QColor, QFont, QLinearGradient, QPen, QPainterPath
+from app_ui import assets
+from app_ui.assets import resource_path
 
 class NexusSplash(QWidget):
     def __init__(self):
@@ -27,17 +20,19 @@ class NexusSplash(QWidget):
         self.refresh_timer.timeout.connect(self.update_animation)
         self.refresh_timer.start(16) # ~60 FPS
         
-        # Assets Loading
-        self.base_bg = QPixmap(resource_path("assets/backgroundmain.png"))
-        self.hud_bg = QPixmap(resource_path("assets/background2.png"))
-        self.noise_bg = QPixmap(resource_path("assets/background3.png"))
-        self.logo = QPixmap(resource_path("assets/logonexuscore.png"))
+        # Assets Loading (cache partagé avec la fenêtre principale)
+        self.base_bg = assets.pixmap("assets/backgroundmain.png")
+        self.hud_bg = assets.pixmap("assets/background2.png")
+        self.noise_bg = assets.pixmap("assets/background3.png")
+        self.logo = assets.pixmap("assets/logonexuscore.png")
+        # Fond et logo mis à l'échelle une seule fois (le splash a une taille fixe) : l'animation
+        # à 60 FPS ne doit pas prendre le CPU aux tâches de démarrage
+        self._backdrop = None
+        self._scaled_logo = None
         
         # Font Loading
-        font_path = resource_path("assets/Orbitron-Bold.ttf")
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
+        family = assets.font_family()
+        if family:
             self.title_font = QFont(family, 28, QFont.Bold)
             self.status_font = QFont(family, 8)
         else:
@@ -74,14 +69,16 @@ class NexusSplash(QWidget):
         self.current_status = message.upper()
         # On ne force pas le repaint ici, le timer s'en occupe
         
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def _render_backdrop(self, w, h):
+        """Compose fond, calques et bordure dans un pixmap."""
+        dpr = self.devicePixelRatioF()
+        backdrop = QPixmap(int(w * dpr), int(h * dpr))
+        backdrop.setDevicePixelRatio(dpr)
+        backdrop.fill(Qt.transparent)
+        painter = QPainter(backdrop)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        
-        w, h = self.width(), self.height()
-        
-        # --- 1. Background Composition ---
+
         path = QPainterPath()
         path.addRoundedRect(0, 0, w, h, 15, 15)
         painter.setClipPath(path)
@@ -103,11 +100,32 @@ class NexusSplash(QWidget):
         painter.setOpacity(1.0)
         painter.setPen(QPen(QColor(40, 40, 60), 2))
         painter.drawRoundedRect(1, 1, w-2, h-2, 15, 15)
+        painter.end()
+        return backdrop
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        
+        w, h = self.width(), self.height()
+        
+        # --- 1. Background Composition ---
+        if self._backdrop is None:
+            self._backdrop = self._render_backdrop(w, h)
+        painter.drawPixmap(0, 0, self._backdrop)
+
+        path = QPainterPath()
+        path.addRoundedRect(0, 0, w, h, 15, 15)
+        painter.setClipPath(path)
         
         # --- 2. Logo (Centered Exactly) ---
         logo_size = 280
+        ly = (h - logo_size) // 2 - 20
         if not self.logo.isNull():
-            scaled_logo = self.logo.scaled(logo_size, logo_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if self._scaled_logo is None:
+                self._scaled_logo = self.logo.scaled(logo_size, logo_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            scaled_logo = self._scaled_logo
             lx = (w - scaled_logo.width()) // 2
             ly = (h - scaled_logo.height()) // 2 - 20 
             painter.drawPixmap(lx, ly, scaled_logo)
@@ -163,6 +181,4 @@ class NexusSplash(QWidget):
         painter.restore()
         
         painter.end()
-        
-        painter.end()
 
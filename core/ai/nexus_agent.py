@@ -1,9 +1,9 @@
-from groq import Groq
 import json
 import os
-from core.database import get_session, GameSession, HardwareSnapshot
+from core.database import get_session, normalize_title, GameSession
+from core.telemetry.stats import get_session_stats
 from sqlalchemy import desc
-from core.optimizers.universal_reader import UniversalConfigReader
+from core.optimizers.universal_reader import get_config_reader
 from core.logger import logger
 
 class NexusAgent:
@@ -12,7 +12,7 @@ class NexusAgent:
         self.client = None
         self.model_id = "llama-3.3-70b-versatile"
         self.chat_history = [] 
-        self.config_reader = UniversalConfigReader() # New Universal system
+        self.config_reader = get_config_reader() # Instance partagée (profils lus une seule fois)
         logger.info("AI: NexusAgent initialized.")
         
         self.system_instruction = (
@@ -34,6 +34,7 @@ class NexusAgent:
 
     def setup_model(self, api_key):
         try:
+            from groq import Groq   # import lourd (~250 ms) : seulement quand une clé est configurée
             self.client = Groq(api_key=api_key)
             logger.info("AI: Groq client setup successful.")
         except Exception as e:
@@ -41,34 +42,34 @@ class NexusAgent:
 
     def analyze_last_session(self, game_name):
         """Cherche et analyse les stats de la dernière session pour un jeu."""
+        title_norm = normalize_title(game_name)
+        if not title_norm:
+            return None
+
         db = get_session()
-        session = db.query(GameSession).filter(GameSession.game_title.ilike(f"%{game_name}%")).order_by(desc(GameSession.start_time)).first()
-        
+        # 1. Titre exact (index game_title_norm/start_time), 2. titre contenant le mot
+        session = db.query(GameSession).filter(GameSession.game_title_norm == title_norm).order_by(desc(GameSession.start_time)).first()
         if not session:
-            db.close()
-            return None
+            session = db.query(GameSession).filter(GameSession.game_title_norm.like(f"%{title_norm}%")).order_by(desc(GameSession.start_time)).first()
+        db.close()
 
-        snapshots = db.query(HardwareSnapshot).filter(HardwareSnapshot.session_id == session.id).all()
-        if not snapshots:
-            db.close()
+        if not session:
             return None
 
-        cpu_avg = sum(s.cpu_usage for s in snapshots) / len(snapshots)
-        cpu_max = max(s.cpu_usage for s in snapshots)
-        gpu_temp_max = max((s.gpu_temp for s in snapshots if s.gpu_temp), default=0)
-        gpu_load_max = max((s.gpu_usage for s in snapshots if s.gpu_usage), default=0)
-        ram_max = max(s.ram_usage for s in snapshots)
+        # Agrégation côté SQL : une seule requête, aucun snapshot chargé en mémoire
+        stats = get_session_stats(session.id)
+        if not stats.count:
+            return None
 
-        db.close()
         return {
             "title": session.game_title,
             "duration_mins": (session.end_time - session.start_time).seconds // 60 if (session.start_time and session.end_time) else "En cours",
-            "cpu_avg": cpu_avg,
-            "cpu_max": cpu_max,
-            "gpu_temp_max": gpu_temp_max,
-            "gpu_load_max": gpu_load_max,
-            "ram_max": ram_max,
-            "snapshot_count": len(snapshots)
+            "cpu_avg": stats.get("cpu_usage", "avg"),
+            "cpu_max": stats.get("cpu_usage", "max"),
+            "gpu_temp_max": stats.get("gpu_temp", "max"),
+            "gpu_load_max": stats.get("gpu_usage", "max"),
+            "ram_max": stats.get("ram_usage", "max"),
+            "snapshot_count": stats.count
         }
 
     def get_response(self, user_input, hardware_stats=None, is_gaming=False):
@@ -0,0 +1,161 @@
+import queue
+import threading
+import time
+from core.logger import logger
+from core.startup import timeline
+
+
+class BootTask:
+    """Étape d'initialisation : func(results, progress) s'exécute dans un thread dédié.
+
+    results contient les valeurs renvoyées par les dépendances, progress(message) publie un
+    état intermédiaire. Une tâche non bloquante (blocking=False) n'est lancée qu'après
+    start_background() (fenêtre principale affichée) et ne retarde pas le démarrage.
+    """
+
+    def __init__(self, name, func, deps=(), label=None, weight=1, blocking=True):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.label = label or name.upper()
+        self.weight = weight
+        self.blocking = blocking
+
+
+class Bootstrap:
+    """Graphe de tâches de démarrage : chaque tâche part dès que ses dépendances ont réussi.
+
+    L'ordonnancement se fait dans le thread appelant via pump() (appelé par un timer jusqu'à
+    all_done, ou en boucle par run()) ; les tâches tournent dans des threads daemon. Une tâche
+    en échec est journalisée et ses dépendantes sont ignorées, le démarrage continue sans elles.
+
+    pump() renvoie les événements survenus depuis l'appel précédent :
+    ("started", nom, None), ("progress", nom, message), ("done", nom, ms), ("failed", nom, erreur),
+    ("skipped", nom, dépendance manquante).
+    """
+
+    def __init__(self, tasks):
+        self.tasks = {task.name: task for task in tasks}
+        for task in tasks:
+            missing = [dep for dep in task.deps if dep not in self.tasks]
+            if missing:
+                raise ValueError(f"Bootstrap: task '{task.name}' depends on unknown {missing}")
+        self._check_cycles()
+        self.results = {}
+        self.status = {name: "pending" for name in self.tasks}
+        self._events = queue.Queue()
+        self._started = False
+        self._background = False
+
+    def _check_cycles(self):
+        visiting, visited = set(), set()
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Bootstrap: dependency cycle through '{name}'")
+            visiting.add(name)
+            for dep in self.tasks[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+        for name in self.tasks:
+            visit(name)
+
+    @property
+    def finished(self):
+        """True quand toutes les tâches bloquantes sont terminées (réussies, en échec ou ignorées)."""
+        return all(self.status[name] not in ("pending", "running")
+                   for name, task in self.tasks.items() if task.blocking)
+
+    @property
+    def all_done(self):
+        """True quand plus aucune tâche n'est en attente ou en cours (non bloquantes comprises)."""
+        return all(state not in ("pending", "running") for state in self.status.values())
+
+    @property
+    def fraction(self):
+        """Avancement pondéré des tâches bloquantes (0.0 à 1.0)."""
+        blocking = [task for task in self.tasks.values() if task.blocking]
+        total = sum(task.weight for task in blocking)
+        done = sum(task.weight for task in blocking if self.status[task.name] not in ("pending", "running"))
+        return done / total if total else 1.0
+
+    def start(self):
+        self._started = True
+        return self._launch_ready()
+
+    def start_background(self):
+        """Autorise les tâches non bloquantes (à appeler une fois la fenêtre affichée)."""
+        self._background = True
+        return self._launch_ready()
+
+    def pump(self, timeout=0.0):
+        """Traite les fins de tâches et lance celles devenues prêtes. Non bloquant par défaut."""
+        if not self._started:
+            return self.start()
+        events = []
+        try:
+            item = self._events.get(timeout=timeout) if timeout else self._events.get_nowait()
+            while True:
+                events.extend(self._handle(item))
+                item = self._events.get_nowait()
+        except queue.Empty:
+            pass
+        return events
+
+    def run(self, timeout=None):
+        """Exécute le graphe jusqu'à la fin des tâches bloquantes (démarrage sans splash)."""
+        deadline = time.monotonic() + timeout if timeout else None
+        self.pump()
+        while not self.finished:
+            if deadline and time.monotonic() > deadline:
+                logger.warning("Bootstrap: Timed out waiting for startup tasks.")
+                break
+            self.pump(timeout=0.1)
+        return self.results
+
+    def _handle(self, item):
+        kind, name, payload = item
+        if kind == "progress":
+            return [item]
+        if kind == "done":
+            self.status[name] = "done"
+        else:
+            self.status[name] = "failed"
+        return [item] + self._launch_ready()
+
+    def _launch_ready(self):
+        events = []
+        progressed = True
+        while progressed:
+            progressed = False
+            for name, task in self.tasks.items():
+                if self.status[name] != "pending":
+                    continue
+                failed = [dep for dep in task.deps if self.status[dep] in ("failed", "skipped")]
+                if failed:
+                    self.status[name] = "skipped"
+                    logger.warning(f"Bootstrap: Skipping '{name}' ({failed[0]} unavailable).")
+                    events.append(("skipped", name, failed[0]))
+                    progressed = True
+                elif all(self.status[dep] == "done" for dep in task.deps) and (task.blocking or self._background):
+                    self.status[name] = "running"
+                    threading.Thread(target=self._run_task, args=(task,), name=f"Boot-{name}", daemon=True).start()
+                    events.append(("started", name, None))
+        return events
+
+    def _run_task(self, task):
+        t0 = time.perf_counter()
+        deps = {dep: self.results.get(dep) for dep in task.deps}
+        progress = lambda message: self._events.put(("progress", task.name, message))
+        try:
+            with timeline.phase(f"boot.{task.name}"):
+                self.results[task.name] = task.func(deps, progress)
+        except Exception as e:
+            logger.error(f"Bootstrap: Task '{task.name}' failed: {e}", exc_info=True)
+            self._events.put(("failed", task.name, str(e)))
+            return
+        elapsed = (time.perf_counter() - t0) * 1000
+        logger.info(f"Bootstrap: '{task.name}' ready in {elapsed:.0f}ms")
+        self._events.put(("done", task.name, elapsed))
@@ -1,12 +1,18 @@
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, ForeignKey
+from sqlalchemy import create_engine, event, update, bindparam, Column, Integer, Float, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 import datetime
+import json
 import os
 from core.logger import logger
+from core.titles import normalize_title
 
 Base = declarative_base()
 
+def _default_title_norm(context):
+    return normalize_title(context.get_current_parameters().get("game_title"))
+
 class HardwareSnapshot(Base):
     __tablename__ = 'hardware_snapshots'
     id = Column(Integer, primary_key=True)
@@ -18,14 +24,74 @@ class HardwareSnapshot(Base):
     active_game_id = Column(String, nullable=True)
     session_id = Column(Integer, ForeignKey('game_sessions.id'), nullable=True)
 
+    __table_args__ = (
+        Index('ix_hardware_snapshots_session_time', 'session_id', 'timestamp'),
+        Index('ix_hardware_snapshots_timestamp', 'timestamp'),
+    )
+
 class GameSession(Base):
     __tablename__ = 'game_sessions'
     id = Column(Integer, primary_key=True)
     game_id = Column(String)
     game_title = Column(String)
+    game_title_norm = Column(String, default=_default_title_norm)
     start_time = Column(DateTime, default=datetime.datetime.utcnow)
     end_time = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        Index('ix_game_sessions_title_start', 'game_title', 'start_time'),
+        Index('ix_game_sessions_title_norm_start', 'game_title_norm', 'start_time'),
+    )
+
+class SnapshotRollupMixin:
+    """Colonnes communes aux tables d'agrégats (une ligne par tranche de temps et par session,
+    plus une par lot de relevés arrivés en retard : les lecteurs pondèrent par sample_count)."""
+    id = Column(Integer, primary_key=True)
+    bucket_start = Column(DateTime, nullable=False)
+    session_id = Column(Integer, nullable=True)
+    sample_count = Column(Integer)
+    cpu_usage_avg = Column(Float)
+    cpu_usage_min = Column(Float)
+    cpu_usage_max = Column(Float)
+    cpu_usage_p95 = Column(Float)
+    ram_usage_avg = Column(Float)
+    ram_usage_min = Column(Float)
+    ram_usage_max = Column(Float)
+    ram_usage_p95 = Column(Float)
+    gpu_usage_avg = Column(Float, nullable=True)
+    gpu_usage_min = Column(Float, nullable=True)
+    gpu_usage_max = Column(Float, nullable=True)
+    gpu_usage_p95 = Column(Float, nullable=True)
+    gpu_temp_avg = Column(Float, nullable=True)
+    gpu_temp_min = Column(Float, nullable=True)
+    gpu_temp_max = Column(Float, nullable=True)
+    gpu_temp_p95 = Column(Float, nullable=True)
+
+class SnapshotRollupMinute(SnapshotRollupMixin, Base):
+    __tablename__ = 'hardware_snapshots_1m'
+    __table_args__ = (
+        Index('ix_hardware_snapshots_1m_bucket', 'bucket_start'),
+        Index('ix_hardware_snapshots_1m_session', 'session_id', 'bucket_start'),
+    )
+
+class SnapshotRollupHour(SnapshotRollupMixin, Base):
+    __tablename__ = 'hardware_snapshots_1h'
+    __table_args__ = (
+        Index('ix_hardware_snapshots_1h_bucket', 'bucket_start'),
+        Index('ix_hardware_snapshots_1h_session', 'session_id', 'bucket_start'),
+    )
+
+class SessionArchiveEntry(Base):
+    """Index des archives colonnaires des sessions terminées (voir core/telemetry/archive.py)."""
+    __tablename__ = 'session_archives'
+    session_id = Column(Integer, ForeignKey('game_sessions.id'), primary_key=True)
+    path = Column(String)
+    row_count = Column(Integer)
+    start_time = Column(DateTime, nullable=True)
+    end_time = Column(DateTime, nullable=True)
+    byte_size = Column(Integer)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
 class CustomGame(Base):
     __tablename__ = 'custom_games'
     id = Column(Integer, primary_key=True)
@@ -34,6 +100,20 @@ class CustomGame(Base):
     icon_path = Column(String, nullable=True)
     added_date = Column(DateTime, default=datetime.datetime.utcnow)
 
+class ScanCacheEntry(Base):
+    """Résultat de scan mis en cache, invalidé quand l'empreinte de la source change (mtime/taille, registre)."""
+    __tablename__ = 'scan_cache'
+    id = Column(Integer, primary_key=True)
+    source = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    fingerprint = Column(String)
+    payload = Column(Text)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+    __table_args__ = (
+        Index('ix_scan_cache_source_key', 'source', 'key', unique=True),
+    )
+
 class Favorite(Base):
     __tablename__ = 'favorites'
     id = Column(Integer, primary_key=True)
@@ -56,13 +136,151 @@ DATA_FOLDER = os.path.join(BASE_DIR, 'data')
 if not os.path.exists(DATA_FOLDER):
     os.makedirs(DATA_FOLDER)
 
+# --- Profils SQLite : durabilité vs débit ---
+# Tous les profils utilisent le journal WAL : les lectures (dashboard, IA, scan)
+# ne sont jamais bloquées par l'écriture de la télémétrie, et inversement.
+# - "durability" : synchronous=FULL, chaque commit est fsync'd. Aucune perte même sur coupure de courant.
+# - "balanced"   : synchronous=NORMAL (défaut). Une coupure de courant peut perdre les derniers
+#                  commits, mais la base n'est jamais corrompue. Recommandé en WAL.
+# - "throughput" : synchronous=OFF. Le plus rapide, l'OS décide quand écrire sur le disque.
+#                  Un crash système peut corrompre la base : à réserver aux benchs.
+# Sélection : variable d'env NEXUS_DB_PROFILE, sinon clé "db_profile" de data/config.json.
+# La clé "db_synchronous" (OFF/NORMAL/FULL/EXTRA) permet de surcharger le niveau du profil.
+DB_PROFILES = {
+    "durability": {"journal_mode": "WAL", "synchronous": "FULL"},
+    "balanced": {"journal_mode": "WAL", "synchronous": "NORMAL"},
+    "throughput": {"journal_mode": "WAL", "synchronous": "OFF"},
+}
+DEFAULT_DB_PROFILE = "balanced"
+# Valeurs acceptées pour "db_synchronous" (SQLite convertit silencieusement toute autre valeur)
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Pragmas appliqués à chaque connexion, quel que soit le profil
+COMMON_PRAGMAS = {
+    "cache_size": -16000,       # 16 Mo de cache de pages par connexion (valeur négative = Kio)
+    "mmap_size": 268435456,     # Lectures via mmap jusqu'à 256 Mo
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,       # Attente max (ms) si un autre thread écrit
+}
+
+# Pool dimensionné pour nos threads : UI, TelemetryWorker, TelemetryWriter, ScanWorker, AIWorker
+POOL_SIZE = 5
+POOL_MAX_OVERFLOW = 5
+POOL_TIMEOUT = 10
+
+def load_config():
+    """Lit data/config.json (dictionnaire vide si absent ou invalide)."""
+    config_path = os.path.join(DATA_FOLDER, "config.json")
+    if os.path.exists(config_path):
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            pass
+    return {}
+
+def _load_db_settings():
+    """Retourne (nom du profil, pragmas) selon l'env et data/config.json."""
+    config = load_config()
+    name = os.environ.get("NEXUS_DB_PROFILE") or config.get("db_profile") or DEFAULT_DB_PROFILE
+    if name not in DB_PROFILES:
+        logger.warning(f"Database: Unknown profile '{name}', falling back to '{DEFAULT_DB_PROFILE}'.")
+        name = DEFAULT_DB_PROFILE
+
+    pragmas = dict(DB_PROFILES[name])
+    if config.get("db_synchronous"):
+        synchronous = str(config["db_synchronous"]).strip().upper()
+        if synchronous in SYNCHRONOUS_MODES:
+            pragmas["synchronous"] = synchronous
+        else:
+            logger.warning(f"Database: Unknown db_synchronous '{config['db_synchronous']}', keeping '{pragmas['synchronous']}' from profile '{name}'.")
+    pragmas.update(COMMON_PRAGMAS)
+    return name, pragmas
+
+def create_tuned_engine(db_path, pragmas):
+    """Crée un engine SQLite thread-safe qui applique les pragmas à chaque nouvelle connexion."""
+    tuned_engine = create_engine(
+        f'sqlite:///{db_path}',
+        poolclass=QueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        connect_args={"check_same_thread": False, "timeout": COMMON_PRAGMAS["busy_timeout"] / 1000},
+    )
+
+    @event.listens_for(tuned_engine, "connect")
+    def _apply_pragmas(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        for key, value in pragmas.items():
+            cursor.execute(f"PRAGMA {key}={value}")
+        cursor.close()
+
+    return tuned_engine
+
+# --- Migrations de schéma ---
+# create_all() ne crée que les tables manquantes : toute modification d'une table
+# existante passe par une migration numérotée, suivie via PRAGMA user_version.
+def _migrate_v1(conn):
+    """Colonne game_title_norm + index de recherche des sessions/snapshots."""
+    columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(game_sessions)")]
+    if "game_title_norm" not in columns:
+        conn.exec_driver_sql("ALTER TABLE game_sessions ADD COLUMN game_title_norm VARCHAR")
+
+    rows = conn.exec_driver_sql("SELECT id, game_title FROM game_sessions WHERE game_title_norm IS NULL").fetchall()
+    if rows:
+        conn.execute(
+            update(GameSession.__table__).where(GameSession.__table__.c.id == bindparam("sid")),
+            [{"sid": sid, "game_title_norm": normalize_title(title)} for sid, title in rows]
+        )
+
+    for table in (HardwareSnapshot.__table__, GameSession.__table__):
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+def _migrate_v2(conn):
+    """Index temporel pour le rollup incrémental et la purge des snapshots bruts."""
+    for index in HardwareSnapshot.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+def _migrate_v3(conn):
+    """Recalcule game_title_norm : l'ancienne normalisation supprimait tout caractère non ASCII."""
+    rows = conn.exec_driver_sql("SELECT id, game_title FROM game_sessions").fetchall()
+    if rows:
+        conn.execute(
+            update(GameSession.__table__).where(GameSession.__table__.c.id == bindparam("sid")),
+            [{"sid": sid, "game_title_norm": normalize_title(title)} for sid, title in rows]
+        )
+
+MIGRATIONS = [
+    (1, _migrate_v1),
+    (2, _migrate_v2),
+    (3, _migrate_v3),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def migrate_schema(target_engine):
+    """Applique les migrations manquantes (idempotent)."""
+    with target_engine.begin() as conn:
+        current = conn.exec_driver_sql("PRAGMA user_version").scalar() or 0
+        if current >= SCHEMA_VERSION:
+            return
+        for version, migration in MIGRATIONS:
+            if version > current:
+                logger.info(f"Database: Applying schema migration v{version}...")
+                migration(conn)
+                conn.exec_driver_sql(f"PRAGMA user_version = {version}")
+        # Met à jour les statistiques du planificateur pour les nouveaux index
+        conn.exec_driver_sql("PRAGMA optimize")
+
 try:
-    engine = create_engine(f'sqlite:///{DB_PATH}')
+    DB_PROFILE, DB_PRAGMAS = _load_db_settings()
+    engine = create_tuned_engine(DB_PATH, DB_PRAGMAS)
     Base.metadata.create_all(engine)
+    migrate_schema(engine)
     Session = sessionmaker(bind=engine)
-    logger.info(f"Database: Connection established at {DB_PATH}")
+    logger.info(f"Database: Connection established at {DB_PATH} (profile: {DB_PROFILE}, synchronous={DB_PRAGMAS['synchronous']})")
 except Exception as e:
     logger.error(f"Database: Critical connection error: {e}", exc_info=True)
 
 def get_session():
-    return Session()
\ No newline at end of file
+    return Session()
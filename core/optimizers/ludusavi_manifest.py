@@ -0,0 +1,271 @@
+import json
+import os
+import sqlite3
+import time
+from core.titles import normalize_title
+from core.logger import logger
+
+# Jeux insérés par transaction pendant la conversion
+BATCH_SIZE = 2000
+# Version du schéma de ludusavi.db (PRAGMA user_version) : une base plus ancienne est reconstruite
+# (v3 : title_norm conserve les caractères non ASCII, voir core.titles.normalize_title)
+SCHEMA_VERSION = 3
+# Candidats renvoyés par search_titles() par défaut
+SEARCH_LIMIT = 5
+# Recherche raccourcie (mots de fin retirés) : nombre de mots minimal pour accepter un titre qui
+# commence par la recherche ; en dessous, seul un titre identique est retenu ("The" seul ne
+# doit pas désigner "The Witcher" à la place de "The Callisto Protocol")
+MIN_TRIMMED_WORDS = 2
+
+
+def _yaml_loader():
+    """Chargeur sûr de PyYAML, en version C (libyaml) si disponible."""
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _ManifestWalker:
+    """Parcourt le manifeste Ludusavi événement par événement.
+
+    Le manifeste est une table {titre du jeu: {files, registry, installDir, steam, ...}}.
+    Seule la section "files" de chaque jeu est construite en objets Python, le reste est
+    sauté sans rien allouer : la mémoire reste celle d'un seul jeu, quelle que soit la taille
+    du fichier.
+    """
+
+    def __init__(self, stream):
+        import yaml
+        self.yaml = yaml
+        self.loader = _yaml_loader()(stream)
+        self.resolver = yaml.resolver.Resolver()
+        self.constructor = yaml.constructor.SafeConstructor()
+
+    def games(self):
+        """Génère (titre, files) pour chaque jeu du manifeste."""
+        yaml, loader = self.yaml, self.loader
+        try:
+            loader.get_event()   # StreamStart
+            if loader.check_event(yaml.StreamEndEvent):
+                return
+            loader.get_event()   # DocumentStart
+            if not loader.check_event(yaml.MappingStartEvent):
+                raise ValueError("manifest root is not a mapping")
+            loader.get_event()
+            while not loader.check_event(yaml.MappingEndEvent):
+                title = str(self._scalar(loader.get_event()))
+                files = None
+                if loader.check_event(yaml.MappingStartEvent):
+                    loader.get_event()
+                    while not loader.check_event(yaml.MappingEndEvent):
+                        key = self._build()
+                        if key == "files":
+                            files = self._build()
+                        else:
+                            self._skip()
+                    loader.get_event()
+                else:
+                    self._skip()
+                yield title, files if isinstance(files, dict) else {}
+        finally:
+            loader.dispose()
+
+    def _scalar(self, event):
+        if not isinstance(event, self.yaml.ScalarEvent):
+            raise ValueError(f"unexpected {type(event).__name__} at {event.start_mark}")
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = self.resolver.resolve(self.yaml.ScalarNode, event.value, event.implicit)
+        if tag == "tag:yaml.org,2002:str":
+            return event.value
+        node = self.yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style)
+        return self.constructor.yaml_constructors.get(tag, self.yaml.constructor.SafeConstructor.construct_scalar)(self.constructor, node)
+
+    def _build(self):
+        """Construit le prochain noeud (scalaire, liste ou table) en objets Python."""
+        yaml, loader = self.yaml, self.loader
+        event = loader.get_event()
+        if isinstance(event, yaml.AliasEvent):
+            raise ValueError(f"YAML aliases are not supported in the manifest ({event.start_mark})")
+        if isinstance(event, yaml.SequenceStartEvent):
+            items = []
+            while not loader.check_event(yaml.SequenceEndEvent):
+                items.append(self._build())
+            loader.get_event()
+            return items
+        if isinstance(event, yaml.MappingStartEvent):
+            mapping = {}
+            while not loader.check_event(yaml.MappingEndEvent):
+                key = self._build()
+                mapping[key] = self._build()
+            loader.get_event()
+            return mapping
+        return self._scalar(event)
+
+    def _skip(self):
+        """Consomme le prochain noeud sans le construire."""
+        yaml, loader = self.yaml, self.loader
+        depth = 0
+        while True:
+            event = loader.get_event()
+            if isinstance(event, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+                depth += 1
+            elif isinstance(event, (yaml.SequenceEndEvent, yaml.MappingEndEvent)):
+                depth -= 1
+            if depth == 0:
+                return
+
+
+def iter_manifest_games(stream):
+    """Génère (titre, files) depuis un flux YAML (fichier binaire ou texte) sans tout charger."""
+    return _ManifestWalker(stream).games()
+
+
+def convert_manifest(yaml_path, db_path, progress_callback=None):
+    """Convertit le manifeste YAML en base SQLite, en flux et par lots.
+
+    La base est construite dans un fichier temporaire puis mise en place d'un bloc : une
+    conversion interrompue ne laisse jamais une base partielle que l'on prendrait pour valide.
+    progress_callback(pourcentage) reçoit l'avancement réel (octets lus / taille du fichier).
+    Retourne le nombre de jeux insérés.
+    """
+    t0 = time.perf_counter()
+    total_bytes = os.path.getsize(yaml_path) or 1
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    count = 0
+    try:
+        # Base jetable jusqu'au os.replace final : pas de journal ni de fsync pendant la construction
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("CREATE TABLE games (title TEXT PRIMARY KEY, title_norm TEXT, files TEXT)")
+
+        last_percent = -1
+        with open(yaml_path, "rb") as f:
+            batch = []
+            for title, files in iter_manifest_games(f):
+                batch.append((title, normalize_title(title), json.dumps(files, default=str)))
+                if len(batch) >= BATCH_SIZE:
+                    with conn:
+                        conn.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?)", batch)
+                    count += len(batch)
+                    batch = []
+                    percent = min(99, f.tell() * 100 // total_bytes)
+                    if progress_callback and percent != last_percent:
+                        last_percent = percent
+                        progress_callback(percent)
+            if batch:
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?)", batch)
+                count += len(batch)
+
+        with conn:
+            conn.execute("CREATE INDEX idx_title_norm ON games(title_norm)")
+            _build_title_index(conn)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    if progress_callback:
+        progress_callback(100)
+    logger.info(f"Optimizer: {count} games converted in {time.perf_counter() - t0:.1f}s.")
+    return count
+
+
+def _build_title_index(conn):
+    """Index plein texte trigramme sur les titres normalisés (recherche de sous-chaîne indexée).
+
+    Sans FTS5 ou sans le tokenizer trigram (SQLite < 3.34), la recherche retombe sur un LIKE.
+    """
+    try:
+        conn.execute(
+            "CREATE VIRTUAL TABLE games_fts USING fts5("
+            "title_norm, content='games', content_rowid='rowid', tokenize='trigram')"
+        )
+        conn.execute("INSERT INTO games_fts(games_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Optimizer: Trigram index unavailable, title search will scan: {e}")
+
+
+def manifest_db_ready(db_path):
+    """True si la base existe et suit le schéma courant (sinon elle doit être reconstruite)."""
+    if not os.path.exists(db_path):
+        return False
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+
+
+def _has_title_index(conn):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'games_fts'").fetchone() is not None
+
+
+def _ranked_matches(conn, query, limit, use_fts):
+    """Titres contenant query, du plus pertinent au moins pertinent.
+
+    Ordre : titre identique, titre qui commence par query, query en mots entiers, puis le titre
+    le plus court (le moins d'écart avec la recherche).
+    """
+    ranking = (
+        "ORDER BY g.title_norm = :q DESC, g.title_norm LIKE :q || '%' DESC, "
+        "' ' || g.title_norm || ' ' LIKE '% ' || :q || ' %' DESC, length(g.title_norm), g.title "
+        "LIMIT :limit"
+    )
+    # Le tokenizer trigram ne sait pas chercher moins de 3 caractères
+    if use_fts and len(query) >= 3:
+        sql = ("SELECT g.title, g.files FROM games_fts JOIN games g ON g.rowid = games_fts.rowid "
+               "WHERE games_fts MATCH :match " + ranking)
+        params = {"q": query, "match": '"' + query + '"', "limit": limit}
+    else:
+        sql = "SELECT g.title, g.files FROM games g WHERE g.title_norm LIKE '%' || :q || '%' " + ranking
+        params = {"q": query, "limit": limit}
+    return conn.execute(sql, params).fetchall()
+
+
+def _prefix_matches(conn, query, limit):
+    """Titres qui commencent par query suivi d'un mot (plage sur idx_title_norm), les plus courts d'abord."""
+    return conn.execute(
+        "SELECT title, files FROM games WHERE title_norm >= ? AND title_norm < ? "
+        "ORDER BY length(title_norm), title LIMIT ?",
+        (query + " ", query + "!", limit)
+    ).fetchall()
+
+
+def search_titles(conn, game_name, limit=SEARCH_LIMIT):
+    """Jeux du manifeste correspondant à game_name, classés : [(titre, files JSON), ...].
+
+    Le titre exact (normalisé) est cherché d'abord via l'index ; sinon l'index trigramme donne
+    les titres qui contiennent la recherche. Si rien ne correspond, les mots de fin sont retirés
+    un à un ("Rust Staging Branch" -> "Rust Staging" -> "Rust"), mais une recherche raccourcie
+    n'accepte plus qu'un titre identique ou, à partir de MIN_TRIMMED_WORDS mots, un titre qui
+    commence par elle : un mot isolé ne désigne pas n'importe quel jeu qui le contient.
+    """
+    query = normalize_title(game_name)
+    if not query:
+        return []
+    use_fts = _has_title_index(conn)
+    words = query.split()
+    full_length = len(words)
+    while words:
+        query = " ".join(words)
+        matches = conn.execute(
+            "SELECT title, files FROM games WHERE title_norm = ? ORDER BY title LIMIT ?", (query, limit)
+        ).fetchall()
+        if not matches:
+            if len(words) == full_length:
+                matches = _ranked_matches(conn, query, limit, use_fts)
+            elif len(words) >= MIN_TRIMMED_WORDS:
+                matches = _prefix_matches(conn, query, limit)
+        if matches:
+            return matches
+        words.pop()
+    return []
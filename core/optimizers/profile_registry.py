@@ -0,0 +1,163 @@
+import json
+import os
+import sys
+import threading
+import time
+from core.logger import logger
+
+CLOUD_PROFILES_URL = "https://raw.githubusercontent.com/NexusCoreProtocol/Database/main/game_profiles.json"
+
+if getattr(sys, 'frozen', False):
+    _BASE_DIR = os.path.dirname(sys.executable)
+else:
+    _BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROFILES_PATH = os.path.join(_BASE_DIR, "data", "game_profiles.json")
+# ETag / Last-Modified de la dernière réponse du serveur et date de la dernière vérification
+META_PATH = os.path.join(_BASE_DIR, "data", "game_profiles.meta.json")
+
+REFRESH_TTL = 6 * 3600   # secondes entre deux vérifications du dépôt distant
+RETRY_DELAY = 300        # secondes avant de retenter une synchro échouée (hors ligne)
+HTTP_TIMEOUT = 3
+
+
+class ProfileRegistry:
+    """Profils de configuration des jeux, partagés par tout le processus.
+
+    Le JSON local est lu une seule fois, au premier accès. La synchronisation avec le dépôt
+    distant se fait en arrière-plan, au plus une fois par TTL (vérifié à chaque lecture des
+    profils), en requête conditionnelle (If-None-Match / If-Modified-Since) : un 304 ne
+    réécrit rien sur le disque.
+    """
+
+    def __init__(self, path=PROFILES_PATH, url=CLOUD_PROFILES_URL, meta_path=META_PATH, ttl=REFRESH_TTL):
+        self.path = path
+        self.url = url
+        self.meta_path = meta_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._profiles = None
+        self._meta = None
+        self._refresh_thread = None
+        self._last_attempt = 0.0
+
+    def _read_json(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.error(f"Profiles: Could not read {path}: {e}")
+            return {}
+
+    def _write_json(self, path, data, indent=None):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_path, path)
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self._profiles is None:
+                self._profiles = self._read_json(self.path)
+                self._meta = self._read_json(self.meta_path)
+                logger.info(f"Profiles: {len(self._profiles)} game profiles loaded.")
+
+    def profiles(self):
+        """Profils courants {nom de jeu: profil}. Le dictionnaire renvoyé n'est jamais modifié sur place.
+
+        Relance la synchro en arrière-plan si le TTL est écoulé (sans attendre son résultat).
+        """
+        self._ensure_loaded()
+        self.refresh_if_stale()
+        return self._profiles
+
+    def match(self, game_name):
+        """Premier profil dont le nom est contenu dans game_name (en minuscules), sinon None."""
+        game_name = game_name.lower()
+        for key, profile in self.profiles().items():
+            if key in game_name:
+                return profile
+        return None
+
+    def is_stale(self):
+        self._ensure_loaded()
+        return time.time() - self._meta.get("checked_at", 0) >= self.ttl
+
+    def refresh_if_stale(self):
+        """Lance refresh() en arrière-plan si le TTL est écoulé. Retourne le thread, ou None.
+
+        Après un échec (checked_at inchangé), pas de nouvel essai avant RETRY_DELAY.
+        """
+        if not self.is_stale():
+            return None
+        with self._lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return self._refresh_thread
+            if time.time() - self._last_attempt < RETRY_DELAY:
+                return None
+            self._last_attempt = time.time()
+            self._refresh_thread = threading.Thread(target=self.refresh, name="ProfileRefresh", daemon=True)
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def refresh(self):
+        """Requête conditionnelle vers le dépôt distant. Retourne "updated", "not_modified" ou "failed"."""
+        self._ensure_loaded()
+        headers = {}
+        # Sans fichier local, les validateurs ne décrivent plus rien : on redemande tout
+        if os.path.exists(self.path):
+            if self._meta.get("etag"):
+                headers["If-None-Match"] = self._meta["etag"]
+            if self._meta.get("last_modified"):
+                headers["If-Modified-Since"] = self._meta["last_modified"]
+
+        try:
+            import requests   # importé à la demande : inutile tant qu'aucune synchro n'a lieu
+            response = requests.get(self.url, headers=headers, timeout=HTTP_TIMEOUT)
+            if response.status_code == 304:
+                status = "not_modified"
+            elif response.status_code == 200:
+                cloud_data = response.json()
+                if not isinstance(cloud_data, dict):
+                    raise ValueError("unexpected payload")
+                merged = dict(self._profiles)
+                merged.update(cloud_data)
+                if merged != self._profiles:
+                    self._write_json(self.path, merged, indent=4)
+                    self._profiles = merged   # remplacement atomique : les lecteurs gardent l'ancienne version
+                status = "updated"
+            else:
+                raise ValueError(f"HTTP {response.status_code}")
+        except Exception as e:
+            logger.warning(f"Profiles: Cloud sync failed: {e}")
+            return "failed"
+
+        meta = {"checked_at": time.time()}
+        if status == "updated":
+            meta["etag"] = response.headers.get("ETag")
+            meta["last_modified"] = response.headers.get("Last-Modified")
+        else:
+            meta["etag"] = self._meta.get("etag")
+            meta["last_modified"] = self._meta.get("last_modified")
+        self._meta = meta
+        try:
+            self._write_json(self.meta_path, meta)
+        except OSError as e:
+            logger.error(f"Profiles: Could not save sync metadata: {e}")
+        logger.info(f"Profiles: Cloud sync {status} ({len(self._profiles)} profiles).")
+        return status
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_profile_registry():
+    """Registre partagé par le processus."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ProfileRegistry()
+        return _registry
@@ -2,11 +2,10 @@ import os
 import json
 import configparser
 import xml.etree.ElementTree as ET
-import winreg
-import requests
-import yaml
 import sqlite3
+import threading
 from core.logger import logger
+from core.optimizers.profile_registry import get_profile_registry
 import sys
 
 def resource_path(relative_path):
@@ -17,70 +16,35 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-# URLs
-CLOUD_PROFILES_URL = "https://raw.githubusercontent.com/NexusCoreProtocol/Database/main/game_profiles.json"
+# URLs (profils de jeux : voir core.optimizers.profile_registry)
 LUDUSAVI_MANIFEST_URL = "https://raw.githubusercontent.com/mtkennerly/ludusavi-manifest/master/data/manifest.yaml"
+# Téléchargement et conversion du manifeste : une seule à la fois (tâche de démarrage en
+# arrière-plan et recherche approfondie peuvent les demander en même temps)
+_ludusavi_lock = threading.Lock()
 
 class UniversalConfigReader:
-    def __init__(self):
-        self.profiles = self._load_profiles()
+    """Lecture des fichiers de configuration des jeux. Utiliser get_config_reader() (instance partagée)."""
+
+    def __init__(self, registry=None):
+        self.registry = registry or get_profile_registry()
         self.db_path = "data/ludusavi.db"
-        self._sync_with_cloud()
+        # Synchro des profils en arrière-plan, seulement si le TTL est écoulé
+        self.registry.refresh_if_stale()
         logger.info("Optimizer: UniversalConfigReader initialized.")
 
-    def _load_profiles(self):
-        if getattr(sys, 'frozen', False):
-            base_dir = os.path.dirname(sys.executable)
-        else:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            
-        ext_path = os.path.join(base_dir, "data", "game_profiles.json")
-        if os.path.exists(ext_path):
-            try:
-                with open(ext_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except: pass
-        return {}
+    @property
+    def profiles(self):
+        return self.registry.profiles()
 
-    def _sync_with_cloud(self):
-        try:
-            response = requests.get(CLOUD_PROFILES_URL, timeout=3)
-            if response.status_code == 200:
-                cloud_data = response.json()
-                self.profiles.update(cloud_data)
-                save_dir = "data"
-                os.makedirs(save_dir, exist_ok=True)
-                save_path = os.path.join(save_dir, "game_profiles.json")
-                with open(save_path, "w", encoding="utf-8") as f:
-                    json.dump(self.profiles, f, indent=4)
-        except: pass
-
-    def _convert_yaml_to_sqlite(self, yaml_path):
-        """Convertit le lourd YAML en base SQLite performante."""
+    def _convert_yaml_to_sqlite(self, yaml_path, progress_callback=None):
+        """Convertit le lourd YAML en base SQLite performante (lecture en flux, voir ludusavi_manifest)."""
         logger.info("Optimizer: Converting YAML manifest to SQLite...")
+        from core.optimizers.ludusavi_manifest import convert_manifest
+        report = None
+        if progress_callback:
+            report = lambda percent: progress_callback(f"OPTIMIZING DATABASE (SQLITE)... {percent}%")
         try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            
-            os.makedirs("data", exist_ok=True)
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("DROP TABLE IF EXISTS games")
-            cursor.execute("CREATE TABLE games (title TEXT PRIMARY KEY, files TEXT)")
-            
-            games = data.get("games", {})
-            batch = []
-            for title, g_data in games.items():
-                batch.append((title, json.dumps(g_data.get("files", {}))))
-                if len(batch) >= 500:
-                    cursor.executemany("INSERT INTO games VALUES (?, ?)", batch)
-                    batch = []
-            if batch:
-                cursor.executemany("INSERT INTO games VALUES (?, ?)", batch)
-            
-            cursor.execute("CREATE INDEX idx_title ON games(title)")
-            conn.commit()
-            conn.close()
+            convert_manifest(yaml_path, self.db_path, progress_callback=report)
             logger.info("Optimizer: SQLite conversion complete.")
             return True
         except Exception as e:
@@ -88,14 +52,22 @@ class UniversalConfigReader:
             return False
 
     def _load_ludusavi(self, progress_callback=None):
-        """Gère le téléchargement et la conversion si nécessaire."""
+        """Gère le téléchargement et la conversion si nécessaire.
+
+        Un appel concurrent attend la fin du premier, puis trouve la base prête.
+        """
+        with _ludusavi_lock:
+            return self._load_ludusavi_locked(progress_callback)
+
+    def _load_ludusavi_locked(self, progress_callback=None):
         yaml_path = "data/ludusavi_manifest.yaml"
-        
+
         # 1. Téléchargement si absent
         if not os.path.exists(yaml_path):
             try:
                 if progress_callback: progress_callback("DOWNLOADING GLOBAL MANIFEST...")
                 logger.info("Optimizer: Downloading Ludusavi manifest...")
+                import requests
                 response = requests.get(LUDUSAVI_MANIFEST_URL, timeout=15)
                 if response.status_code == 200:
                     os.makedirs("data", exist_ok=True)
@@ -105,10 +77,11 @@ class UniversalConfigReader:
                 logger.error(f"Optimizer: Download failed: {e}")
                 return False
 
-        # 2. Conversion en SQLite si absent
-        if not os.path.exists(self.db_path):
+        # 2. Conversion en SQLite si absente ou d'un schéma antérieur
+        from core.optimizers.ludusavi_manifest import manifest_db_ready
+        if not manifest_db_ready(self.db_path):
             if progress_callback: progress_callback("OPTIMIZING DATABASE (SQLITE)...")
-            return self._convert_yaml_to_sqlite(yaml_path)
+            return self._convert_yaml_to_sqlite(yaml_path, progress_callback)
             
         return True
 
@@ -117,11 +90,7 @@ class UniversalConfigReader:
         logger.info(f"Optimizer: Searching config for -> {game_name_clean}")
         
         # 1. JSON Profiles Match
-        profile = None
-        for key in self.profiles:
-            if key in game_name_clean:
-                profile = self.profiles[key]
-                break
+        profile = self.registry.match(game_name_clean)
         
         path = None
         if profile:
@@ -169,22 +138,22 @@ class UniversalConfigReader:
         return None
 
     def _deep_search_ludusavi(self, game_name):
-        """Recherche SQL ultra-rapide."""
-        if not os.path.exists(self.db_path):
+        """Recherche SQL ultra-rapide (index trigramme, meilleur titre d'abord)."""
+        from core.optimizers.ludusavi_manifest import manifest_db_ready, search_titles
+        if not manifest_db_ready(self.db_path):
             self._load_ludusavi()
             
         if not os.path.exists(self.db_path): return None, None
 
         try:
             conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            # Recherche avec LIKE pour matcher le titre
-            cursor.execute("SELECT files FROM games WHERE title LIKE ? LIMIT 1", (f"%{game_name}%",))
-            row = cursor.fetchone()
+            matches = search_titles(conn, game_name, limit=1)
             conn.close()
             
-            if row:
-                files = json.loads(row[0])
+            if matches:
+                title, files = matches[0]
+                logger.info(f"Optimizer: Ludusavi match -> {title}")
+                files = json.loads(files)
                 for f_path in files.keys():
                     if any(ext in f_path.lower() for ext in [".ini", ".cfg", ".json", ".xml", "settings", "prefs"]):
                         real_path = self._expand_ludusavi_path(f_path)
@@ -241,3 +210,15 @@ class UniversalConfigReader:
                             for f in os.listdir(fp):
                                 if "settings" in f.lower(): return os.path.join(fp, f), "xml"
         return None, None
+
+
+_config_reader = None
+_config_reader_lock = threading.Lock()
+
+def get_config_reader():
+    """Instance partagée par le processus (splash, agent IA, optimiseur)."""
+    global _config_reader
+    with _config_reader_lock:
+        if _config_reader is None:
+            _config_reader = UniversalConfigReader()
+        return _config_reader
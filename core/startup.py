@@ -0,0 +1,126 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from core.logger import logger, LOG_DIR
+
+# Historique des démarrages (une ligne JSON par lancement) pour repérer les régressions
+HISTORY_PATH = os.path.join(LOG_DIR, "startup_timeline.jsonl")
+HISTORY_SIZE = 20
+# Une phase est signalée si elle dépasse la médiane des lancements précédents de 25 % et de 20 ms
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN_MS = 20.0
+
+
+def _process_age_ms():
+    """Temps écoulé depuis la création du processus (interpréteur + premiers imports)."""
+    try:
+        import psutil
+        return max(0.0, (time.time() - psutil.Process().create_time()) * 1000)
+    except Exception:
+        return 0.0
+
+
+def _median(values):
+    values = sorted(values)
+    if not values:
+        return None
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+
+class StartupTimeline:
+    """Chronologie du démarrage : durée de chaque phase jusqu'à la fenêtre interactive.
+
+    mark(nom) clôt la phase séquentielle en cours ; phase(nom) mesure un bloc à l'intérieur
+    d'une phase (ou dans un autre thread), affiché en détail. report() écrit le tout dans le log,
+    une seule fois.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._last = self._t0
+        self._boot_ms = _process_age_ms()
+        self._phases = [("python_boot", -self._boot_ms, self._boot_ms, False)]   # (nom, début ms, durée ms, détail)
+        self._reported = False
+
+    def _now_ms(self):
+        return (time.perf_counter() - self._t0) * 1000
+
+    def _record(self, name, start, end, detail=False):
+        with self._lock:
+            self._phases.append((name, (start - self._t0) * 1000, (end - start) * 1000, detail))
+
+    def mark(self, name):
+        """Enregistre la phase écoulée depuis la marque précédente."""
+        now = time.perf_counter()
+        with self._lock:
+            start, self._last = self._last, now
+        self._record(name, start, now)
+
+    @contextmanager
+    def phase(self, name):
+        """Mesure un bloc sans clore la phase en cours (détail d'une étape)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, start, time.perf_counter(), detail=True)
+
+    def report(self, final="interactive"):
+        """Journalise les phases et le temps total depuis le lancement du processus."""
+        with self._lock:
+            if self._reported:
+                return
+            self._reported = True
+            phases = sorted(self._phases, key=lambda p: p[1])
+        total = self._boot_ms + self._now_ms()
+        # Comparaison avec les lancements de même déroulé uniquement (avec / sans splash...)
+        flow = [name for name, _, _, detail in phases if not detail]
+        history = self._load_history()
+        comparable = [h for h in history if h.get("flow") == flow]
+
+        for name, start, duration, detail in phases:
+            previous = _median([h["phases"][name] for h in comparable if name in h.get("phases", {})])
+            label = f"  {name}" if detail else name
+            line = f"Startup: {label:<24} {duration:8.1f} ms  (t+{start + self._boot_ms:7.1f})"
+            if previous is not None and duration > previous * REGRESSION_RATIO and duration - previous > REGRESSION_MIN_MS:
+                logger.warning(f"{line}  REGRESSION (median {previous:.1f} ms)")
+            else:
+                logger.info(line)
+
+        previous_total = _median([h["total_ms"] for h in comparable if "total_ms" in h])
+        summary = f"Startup: {final} after {total:.1f} ms"
+        if previous_total is not None:
+            summary += f" (median of last {len(comparable)} similar runs: {previous_total:.1f} ms)"
+        logger.info(summary)
+
+        entry = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "total_ms": round(total, 1),
+            "flow": flow,
+            "phases": {name: round(duration, 1) for name, _, duration, _ in phases},
+        }
+        self._save_history(history[-(HISTORY_SIZE - 1):] + [entry])
+
+    def _load_history(self):
+        try:
+            with open(HISTORY_PATH, "r", encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()][-HISTORY_SIZE:]
+        except (OSError, ValueError):
+            return []
+
+    def _save_history(self, history):
+        try:
+            with open(HISTORY_PATH, "w", encoding="utf-8") as f:
+                for entry in history:
+                    f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            logger.error(f"Startup: Could not save timeline history: {e}")
+
+
+# Instance unique, créée au premier import (le plus tôt possible dans main.py)
+timeline = StartupTimeline()
@@ -0,0 +1,212 @@
+import datetime
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from itertools import accumulate
+from sqlalchemy import select
+from core.database import engine, get_session, DATA_FOLDER, GameSession, HardwareSnapshot, SessionArchiveEntry
+from core.logger import logger
+
+# Format .nxa (little-endian), une archive par session terminée :
+#   en-tête 32 octets : magic, version, nb de colonnes, nb de lignes, t0 (ms epoch UTC)
+#   timestamps        : int32[n], écart en ms avec le relevé précédent (le premier vaut 0)
+#   colonnes          : float32[n] par métrique, dans l'ordre ARCHIVE_COLUMNS (NaN = absent)
+# Toutes les sections sont alignées sur 4 octets : elles se lisent sans copie via mmap.
+ARCHIVE_MAGIC = b"NXSA"
+ARCHIVE_VERSION = 1
+ARCHIVE_COLUMNS = ("cpu_usage", "ram_usage", "gpu_usage", "gpu_temp")
+HEADER = struct.Struct("<4sHHIq8x")
+ARCHIVE_FOLDER = os.path.join(DATA_FOLDER, "archives")
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+# Sessions en cours d'archivage : fin de session (archive_session_async) et passe de rétention
+# (archive_pending_sessions) peuvent viser la même session au même moment
+_archiving = set()
+_archiving_lock = threading.Lock()
+
+
+def _to_ms(ts):
+    return int((ts - _EPOCH).total_seconds() * 1000)
+
+
+class SessionArchive:
+    """Lecture d'une archive .nxa via mmap : les colonnes sont des memoryview float32 sans copie.
+
+    Les vues retournées ne sont valides que tant que l'archive est ouverte.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        magic, version, n_cols, self.row_count, self.t0_ms = HEADER.unpack_from(self._mmap, 0)
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION or n_cols != len(ARCHIVE_COLUMNS):
+            self.close()
+            raise ValueError(f"Invalid session archive: {path}")
+        self._exports = []
+
+    def _section(self, index, fmt):
+        start = HEADER.size + index * 4 * self.row_count
+        view = self._view[start:start + 4 * self.row_count].cast(fmt)
+        self._exports.append(view)
+        return view
+
+    def deltas_ms(self):
+        """Écarts bruts entre relevés (int32, sans copie)."""
+        return self._section(0, "i")
+
+    def column(self, name):
+        """Colonne float32 d'une métrique (sans copie)."""
+        return self._section(1 + ARCHIVE_COLUMNS.index(name), "f")
+
+    def offsets_ms(self):
+        """Temps écoulé depuis le début de la session pour chaque relevé (ms)."""
+        return array("q", accumulate(self.deltas_ms()))
+
+    @property
+    def start(self):
+        return _EPOCH + datetime.timedelta(milliseconds=self.t0_ms)
+
+    def close(self):
+        for view in getattr(self, "_exports", []):
+            view.release()
+        self._exports = []
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_archive(path, rows):
+    """Écrit une archive à partir d'un itérable trié de (timestamp, cpu, ram, gpu, gpu_temp).
+
+    Retourne (nb de lignes, premier timestamp, dernier timestamp).
+    """
+    deltas = array("i")
+    columns = [array("f") for _ in ARCHIVE_COLUMNS]
+    t0 = prev = None
+    first_ts = last_ts = None
+    for ts, *values in rows:
+        first_ts = first_ts or ts
+        last_ts = ts
+        ms = _to_ms(ts)
+        if t0 is None:
+            t0 = prev = ms
+        deltas.append(ms - prev)
+        prev = ms
+        for col, value in zip(columns, values):
+            col.append(float("nan") if value is None else value)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, len(ARCHIVE_COLUMNS), len(deltas), t0 or 0))
+        for section in [deltas] + columns:
+            if sys.byteorder != "little":
+                section.byteswap()
+            section.tofile(f)
+    # Écriture atomique : une archive interrompue n'est jamais visible
+    os.replace(tmp_path, path)
+    return len(deltas), first_ts, last_ts
+
+
+def archive_session(session_id):
+    """Compacte les snapshots d'une session terminée dans data/archives et l'indexe en base.
+
+    Un seul archivage par session à la fois : un appel concurrent rend la main sans rien faire.
+    """
+    with _archiving_lock:
+        if session_id in _archiving:
+            logger.debug(f"Archive: Session {session_id} already being archived, skipping.")
+            return False
+        _archiving.add(session_id)
+    try:
+        return _archive_session(session_id)
+    finally:
+        with _archiving_lock:
+            _archiving.discard(session_id)
+
+
+def _archive_session(session_id):
+    db = get_session()
+    try:
+        if db.get(SessionArchiveEntry, session_id):
+            return True
+        snap = HardwareSnapshot.__table__.c
+        os.makedirs(ARCHIVE_FOLDER, exist_ok=True)
+        path = os.path.join(ARCHIVE_FOLDER, f"session_{session_id}.nxa")
+
+        with engine.connect() as conn:
+            result = conn.execute(
+                select(snap.timestamp, snap.cpu_usage, snap.ram_usage, snap.gpu_usage, snap.gpu_temp)
+                .where(snap.session_id == session_id)
+                .order_by(snap.timestamp)
+            )
+            count, first_ts, last_ts = write_archive(path, result)
+
+        if not count:
+            # Session sans relevés : indexée sans fichier pour ne pas la retraiter à chaque passe
+            os.remove(path)
+            db.add(SessionArchiveEntry(session_id=session_id, path=None, row_count=0, byte_size=0))
+            db.commit()
+            return False
+
+        db.add(SessionArchiveEntry(
+            session_id=session_id, path=os.path.relpath(path, DATA_FOLDER), row_count=count,
+            start_time=first_ts, end_time=last_ts, byte_size=os.path.getsize(path)
+        ))
+        db.commit()
+        logger.info(f"Archive: Session {session_id} compacted ({count} rows, {os.path.getsize(path) // 1024} KiB).")
+        return True
+    except Exception as e:
+        logger.error(f"Archive: Failed to archive session {session_id}: {e}", exc_info=True)
+        return False
+    finally:
+        db.close()
+
+
+def archive_session_async(session_id):
+    threading.Thread(target=archive_session, args=(session_id,), name="SessionArchiver", daemon=True).start()
+
+
+def archive_pending_sessions():
+    """Archive les sessions terminées qui ne le sont pas encore (ex : application fermée pendant l'archivage)."""
+    db = get_session()
+    try:
+        archived = select(SessionArchiveEntry.session_id)
+        pending = [sid for (sid,) in db.query(GameSession.id)
+                   .filter(GameSession.end_time.isnot(None), GameSession.id.notin_(archived))]
+    finally:
+        db.close()
+    for session_id in pending:
+        archive_session(session_id)
+    return len(pending)
+
+
+def load_session_archive(session_id):
+    """Ouvre l'archive d'une session (None si la session n'est pas archivée)."""
+    db = get_session()
+    try:
+        entry = db.get(SessionArchiveEntry, session_id)
+    finally:
+        db.close()
+    if not entry or not entry.path:
+        return None
+    path = os.path.join(DATA_FOLDER, entry.path)
+    if not os.path.exists(path):
+        logger.warning(f"Archive: Indexed file missing for session {session_id}: {path}")
+        return None
+    return SessionArchive(path)
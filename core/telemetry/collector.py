@@ -1,73 +1,106 @@
-import psutil
+import threading
 import time
-from core.database import get_session, HardwareSnapshot
-from core.telemetry.lhm_wrapper import HardwareMonitor
+from core.logger import logger
+from core.telemetry.writer import get_telemetry_writer
+from core.telemetry.sources import create_source
+from core.telemetry.smoothing import Smoother
 
 class TelemetryCollector:
-    def __init__(self):
+    def __init__(self, source=None, smoothing=None):
         self.is_running = False
-        self.lhm = HardwareMonitor()
-        # Historiques pour lissage (Moyenne mobile sur 5 points)
-        self.cpu_history = []
-        self.gpu_history = []
+        # Origine des relevés (LHM, psutil, hwmon, rejeu) : voir core.telemetry.sources
+        self.source = source or create_source()
+        # Lissage par mesure (SMA sur 5 s par défaut, "telemetry_smoothing" dans data/config.json)
+        self.smoother = Smoother(smoothing)
+        # Relevé + lissage sous verrou : les tampons circulaires ne supportent pas deux écrivains
+        self._stats_lock = threading.Lock()
+        logger.info(f"Telemetry: Smoothing -> {self.smoother.describe()}")
+        # {abonné: (mesures, intervalle s)} : seul le matériel lu par un abonné est interrogé
+        self._subscriptions = {}
+        self._subscriptions_lock = threading.Lock()
 
-    def _smooth_value(self, history, new_val):
-        """Ajoute une valeur et retourne la moyenne lissée."""
-        history.append(new_val)
-        if len(history) > 5:
-            history.pop(0)
-        return sum(history) / len(history)
+    def subscribe(self, subscriber, metrics, interval):
+        """Déclare les mesures matérielles (voir sensor_index.METRICS) lues par un abonné, et à quel rythme.
+
+        Un nouvel appel pour le même abonné remplace sa demande.
+        """
+        request = (frozenset(metrics), float(interval))
+        with self._subscriptions_lock:
+            if self._subscriptions.get(subscriber) == request:
+                return
+            self._subscriptions[subscriber] = request
+        self._log_subscriptions()
+
+    def unsubscribe(self, subscriber):
+        with self._subscriptions_lock:
+            if self._subscriptions.pop(subscriber, None) is None:
+                return
+        self._log_subscriptions()
+
+    def update_intervals(self):
+        """{mesure: intervalle le plus court demandé}, ou None sans abonné déclaré (tout le matériel indexé)."""
+        with self._subscriptions_lock:
+            if not self._subscriptions:
+                return None
+            intervals = {}
+            for metrics, interval in self._subscriptions.values():
+                for metric in metrics:
+                    intervals[metric] = min(interval, intervals.get(metric, interval))
+            return intervals
+
+    def _log_subscriptions(self):
+        with self._subscriptions_lock:
+            summary = ", ".join(f"{name}({'/'.join(sorted(metrics))} @{interval:g}s)"
+                                for name, (metrics, interval) in sorted(self._subscriptions.items()))
+        logger.info(f"Telemetry: Subscriptions -> {summary or 'none'}")
+
+    def set_sample_period(self, period):
+        """Cadence des relevés (s) : les fenêtres de lissage gardent leur durée."""
+        with self._stats_lock:
+            self.smoother.set_period(period)
+        logger.info(f"Telemetry: Smoothing -> {self.smoother.describe()}")
 
     def get_stats(self):
-        """Récupère les stats hardware actuelles avec lissage."""
-        # 1. Capture brute
-        raw_cpu = psutil.cpu_percent(interval=None)
-        raw_ram = psutil.virtual_memory().percent
-        raw_gpu = 0.0
-        
-        lhm_data = self.lhm.get_data()
-        if lhm_data:
-            raw_gpu = lhm_data.get("gpu_load", 0.0)
-            cpu_temp = lhm_data.get("cpu_temp", 0.0)
-            gpu_temp = lhm_data.get("gpu_temp", 0.0)
-        else:
-            cpu_temp = 0.0
-            gpu_temp = 0.0
+        """Récupère les stats hardware actuelles avec lissage.
+
+        Chaque mesure lissée est aussi renvoyée brute sous "<mesure>_raw" (cpu_raw, gpu_raw par défaut).
+        """
+        intervals = self.update_intervals()
+        with self._stats_lock:
+            # 1. Capture brute
+            sample = self.source.read(intervals)
 
-        # 2. Lissage (SMA)
-        smooth_cpu = self._smooth_value(self.cpu_history, raw_cpu)
-        smooth_gpu = self._smooth_value(self.gpu_history, raw_gpu)
+            # 2. Lissage (tampons circulaires, voir core.telemetry.smoothing)
+            smoothed = self.smoother.update(sample)
+            filtered = list(self.smoother.filters)
 
-        return {
-            "cpu": round(smooth_cpu, 1),
-            "ram": raw_ram, # RAM est déjà stable en général
-            "gpu": round(smooth_gpu, 1),
-            "gpu_temp": gpu_temp,
-            "cpu_temp": cpu_temp
+        stats = {
+            "cpu": smoothed["cpu"],
+            "ram": smoothed["ram"], # RAM est déjà stable en général
+            "gpu": smoothed["gpu"],
+            "gpu_temp": smoothed["gpu_temp"],
+            "cpu_temp": smoothed["cpu_temp"]
         }
+        for metric in filtered:
+            if metric in stats:
+                stats[metric] = round(stats[metric], 1)
+                stats[f"{metric}_raw"] = sample[metric]
+        return stats
     
     def close(self):
-        if self.lhm:
-            self.lhm.close()
+        self.source.close()
 
-    def save_snapshot(self, game_id=None):
-        """Enregistre un snapshot dans la base de données."""
+    def save_snapshot(self, game_id=None, session_id=None):
+        """Enregistre un snapshot (écriture différée via le TelemetryWriter)."""
         stats = self.get_stats()
-        db_session = get_session()
-        try:
-            snapshot = HardwareSnapshot(
-                cpu_usage=stats["cpu"],
-                ram_usage=stats["ram"],
-                gpu_usage=stats["gpu"],
-                gpu_temp=stats["gpu_temp"],
-                active_game_id=game_id
-            )
-            db_session.add(snapshot)
-            db_session.commit()
-        except Exception as e:
-            print(f"Erreur sauvegarde télémétrie: {e}")
-        finally:
-            db_session.close()
+        get_telemetry_writer().submit(
+            cpu_usage=stats["cpu"],
+            ram_usage=stats["ram"],
+            gpu_usage=stats["gpu"],
+            gpu_temp=stats["gpu_temp"],
+            active_game_id=game_id,
+            session_id=session_id
+        )
 
 if __name__ == "__main__":
     # Test simple
@@ -1,7 +1,7 @@
-import clr # pythonnet
 import os
 import sys
 from core.logger import logger
+from core.telemetry import sensor_index
 import sys
 
 def resource_path(relative_path):
@@ -19,11 +19,15 @@ class HardwareMonitor:
     def __init__(self):
         self.computer = None
         self.enabled = False
+        # Capteurs retenus (voir sensor_index), reconstruit au prochain relevé si le matériel change
+        self._index = None
+        self._logged_plan = None
         
         if os.path.exists(DLL_PATH):
             try:
                 # Débloquer la DLL si besoin (Windows bloque parfois les DLL téléchargées)
                 # Mais ici on charge juste
+                import clr # pythonnet : démarre le CLR, importé seulement si la DLL est présente
                 clr.AddReference(DLL_PATH)
                 from LibreHardwareMonitor import Hardware
                 self.computer = Hardware.Computer()
@@ -38,6 +42,13 @@ class HardwareMonitor:
                 # Log detected hardware
                 for hw in self.computer.Hardware:
                     logger.info(f"Telemetry: Detected Hardware -> {hw.HardwareType}: {hw.Name}")
+
+                # Branchement / retrait de matériel (eGPU, pilote réinstallé...) : nouvelle découverte
+                try:
+                    self.computer.HardwareAdded += self._on_hardware_changed
+                    self.computer.HardwareRemoved += self._on_hardware_changed
+                except Exception as e:
+                    logger.debug(f"Telemetry: Hardware change events unavailable: {e}")
                     
             except Exception as e:
                 logger.error(f"Telemetry: Error loading LHM DLL: {e}", exc_info=True)
@@ -68,7 +79,8 @@ class HardwareMonitor:
         else:
             self.visitor = None
 
-    def get_data(self):
+    def get_data(self, intervals=None):
+        """Relevé des capteurs indexés. intervals {mesure: secondes} : voir SensorIndex.plan()."""
         if not self.enabled:
             return None
 
@@ -81,33 +93,31 @@ class HardwareMonitor:
         }
 
         try:
-            self.computer.Accept(self.visitor)
-            
-            for hardware in self.computer.Hardware:
-                # CPU
-                if "Cpu" in str(hardware.HardwareType): 
-                    for sensor in hardware.Sensors:
-                        if str(sensor.SensorType) == "Temperature":
-                            # On priorise le "Package" ou le "Core Max"
-                            if "Package" in sensor.Name or "Total" in sensor.Name or "Max" in sensor.Name:
-                                data["cpu_temp"] = sensor.Value if sensor.Value else data["cpu_temp"]
-                            elif data["cpu_temp"] == 0:
-                                data["cpu_temp"] = sensor.Value if sensor.Value else 0
-                            
-                # GPU (Intel, Nvidia, AMD)
-                if "Gpu" in str(hardware.HardwareType):
-                    for sensor in hardware.Sensors:
-                        if str(sensor.SensorType) == "Temperature":
-                            data["gpu_temp"] = max(data["gpu_temp"], sensor.Value if sensor.Value else 0)
-                        elif str(sensor.SensorType) == "Load" and ("Core" in sensor.Name or "GPU Core" in sensor.Name):
-                            data["gpu_load"] = sensor.Value if sensor.Value else 0
-                             
+            index = self._index
+            if index is None:
+                # Découverte : mise à jour complète de l'arbre (certains capteurs n'apparaissent
+                # qu'après un premier Update), puis sélection des capteurs utiles
+                self.computer.Accept(self.visitor)
+                index = self._index = sensor_index.discover(self.computer.Hardware)
+            else:
+                index.update(intervals)
+            plan = index.plan(intervals)
+            if plan != self._logged_plan:
+                self._logged_plan = plan
+                summary = ", ".join(f"{kind} {interval:g}s" if interval is not None else f"{kind} off" for kind, interval in plan)
+                logger.info(f"Telemetry: Update plan -> {summary or 'nothing to poll'}")
+            data.update(index.read())
         except Exception as e:
-            # print(f"Erreur lecture sensors: {e}") # Silent fail pour éviter spam
-            pass
+            # Capteur disparu ou pont .NET en erreur : nouvelle découverte au prochain relevé
+            logger.debug(f"Telemetry: Sensor read failed, rebuilding index: {e}")
+            self._index = None
             
         return data
 
+    def _on_hardware_changed(self, hardware):
+        # Appelé depuis LHM : on invalide seulement, la découverte se fait dans le thread de relevé
+        self._index = None
+
     def close(self):
         if self.computer:
             self.computer.Close()
@@ -0,0 +1,236 @@
+import datetime
+import threading
+from sqlalchemy import func, insert, select, delete
+from core.database import engine, load_config, HardwareSnapshot, SnapshotRollupMinute, SnapshotRollupHour, SessionArchiveEntry
+from core.telemetry.archive import archive_pending_sessions
+from core.logger import logger
+
+ROLLUP_METRICS = ("cpu_usage", "ram_usage", "gpu_usage", "gpu_temp")
+
+# Paliers d'agrégation : (modèle, taille de la tranche en secondes, tranches max traitées par passe)
+TIERS = (
+    (SnapshotRollupMinute, 60, 1440),
+    (SnapshotRollupHour, 3600, 48),
+)
+
+# Les relevés arrivent en différé via le TelemetryWriter : on n'agrège une tranche
+# qu'une fois ce délai écoulé après sa fin.
+SETTLE_DELAY = 120
+
+# Rétention par défaut (surchargeable via data/config.json)
+RAW_MAX_AGE_DAYS = 7            # "retention_raw_days"
+MINUTE_MAX_AGE_DAYS = 90        # "retention_minute_days" (les agrégats horaires sont conservés)
+
+RUN_INTERVAL = 300              # secondes entre deux passes quand tout est à jour
+CATCHUP_PAUSE = 0.5             # pause entre deux passes de rattrapage
+PRUNE_BATCH = 20000             # lignes supprimées par transaction
+
+
+def _floor(ts, size):
+    epoch = int((ts - datetime.datetime(1970, 1, 1)).total_seconds())
+    return datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=epoch - epoch % size)
+
+
+def _percentile(sorted_values, p):
+    """Percentile au rang le plus proche (même convention que core.telemetry.stats)."""
+    if not sorted_values:
+        return None
+    return sorted_values[int((len(sorted_values) - 1) * p / 100.0)]
+
+
+def _summarize(bucket_start, session_id, samples):
+    """Construit une ligne d'agrégat à partir des relevés bruts d'une tranche."""
+    row = {"bucket_start": bucket_start, "session_id": session_id, "sample_count": len(samples)}
+    for i, metric in enumerate(ROLLUP_METRICS):
+        values = [s[i] for s in samples if s[i] is not None and not (metric == "gpu_temp" and s[i] == 0)]
+        values.sort()
+        row[f"{metric}_avg"] = sum(values) / len(values) if values else None
+        row[f"{metric}_min"] = values[0] if values else None
+        row[f"{metric}_max"] = values[-1] if values else None
+        row[f"{metric}_p95"] = _percentile(values, 95)
+    return row
+
+
+class RetentionEngine:
+    """Agrège les snapshots bruts en tranches de 1 min / 1 h et purge les données expirées.
+
+    Le travail est incrémental : chaque passe reprend après la dernière tranche agrégée
+    et traite un nombre borné de tranches, dans un thread d'arrière-plan.
+    """
+
+    def __init__(self, raw_max_age_days=None, minute_max_age_days=None):
+        config = load_config()
+        if raw_max_age_days is None:
+            raw_max_age_days = config.get("retention_raw_days", RAW_MAX_AGE_DAYS)
+        if minute_max_age_days is None:
+            minute_max_age_days = config.get("retention_minute_days", MINUTE_MAX_AGE_DAYS)
+        self.raw_max_age = datetime.timedelta(days=raw_max_age_days)
+        self.minute_max_age = datetime.timedelta(days=minute_max_age_days)
+        # Plus grand id de snapshot déjà pris en compte : au-delà, une ligne sous le watermark
+        # d'un palier est arrivée en retard (voir _rollup_late_rows)
+        self._checked_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="RetentionEngine", daemon=True)
+        self._thread.start()
+        logger.info(f"Retention: Started (raw kept {self.raw_max_age.days}d, 1m kept {self.minute_max_age.days}d, 1h kept forever).")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                pending = self.run_once()
+            except Exception as e:
+                logger.error(f"Retention: Pass failed: {e}", exc_info=True)
+                pending = False
+            self._stop.wait(CATCHUP_PAUSE if pending else RUN_INTERVAL)
+
+    def run_once(self, now=None):
+        """Une passe : rollup de chaque palier puis purge. Retourne True s'il reste du retard."""
+        now = now or datetime.datetime.utcnow()
+        with engine.connect() as conn:
+            max_id = conn.execute(select(func.max(HardwareSnapshot.__table__.c.id))).scalar() or 0
+        # Les lignes insérées pendant la passe (id > max_id) sont laissées à la suivante
+        self._rollup_late_rows(max_id)
+        pending = False
+        for model, size, max_buckets in TIERS:
+            pending |= self._rollup_tier(model, size, max_buckets, now, max_id)
+        self._checked_id = max_id
+        archive_pending_sessions()
+        self._prune(now)
+        return pending
+
+    def watermark(self, model, size):
+        """Fin de la dernière tranche agrégée pour ce palier (None si rien n'a encore été agrégé)."""
+        with engine.connect() as conn:
+            last = conn.execute(select(func.max(model.bucket_start))).scalar()
+        if last is None:
+            return None
+        if isinstance(last, str):
+            last = datetime.datetime.fromisoformat(last)
+        return last + datetime.timedelta(seconds=size)
+
+    def _rollup_late_rows(self, max_id):
+        """Agrège à part les relevés arrivés sous le watermark d'un palier après son passage.
+
+        Le TelemetryWriter peut garder des lignes en mémoire au-delà de SETTLE_DELAY (base
+        indisponible) : le palier, déjà passé, ne les relirait jamais et la purge les supprimerait
+        sans qu'elles aient été agrégées. Elles sont repérées par leur id (auto-incrémenté, donc
+        dans l'ordre d'insertion) et résumées dans des lignes d'agrégat supplémentaires pour
+        leur tranche ; les lecteurs (core.telemetry.stats) pondèrent déjà par sample_count.
+        Les lignes insérées avant la première passe du processus sont considérées comme vues.
+        """
+        if self._checked_id is None or max_id <= self._checked_id:
+            return
+        watermarks = [(model, size, self.watermark(model, size)) for model, size, _ in TIERS]
+        known = [wm for _, _, wm in watermarks if wm is not None]
+        if not known:
+            return
+
+        snap = HardwareSnapshot.__table__.c
+        with engine.connect() as conn:
+            late = conn.execute(
+                select(snap.timestamp, snap.session_id, snap.cpu_usage, snap.ram_usage, snap.gpu_usage, snap.gpu_temp)
+                .where(snap.id > self._checked_id, snap.id <= max_id, snap.timestamp < max(known))
+            ).fetchall()
+        if not late:
+            return
+
+        for model, size, watermark in watermarks:
+            if watermark is None:
+                continue
+            groups = {}
+            for ts, session_id, *values in late:
+                if ts < watermark:
+                    groups.setdefault((_floor(ts, size), session_id), []).append(values)
+            if groups:
+                with engine.begin() as conn:
+                    conn.execute(insert(model), [_summarize(bucket, sid, vals) for (bucket, sid), vals in groups.items()])
+                logger.info(f"Retention: {model.__tablename__} rolled up {sum(len(v) for v in groups.values())} late snapshots ({len(groups)} buckets).")
+
+    def _rollup_tier(self, model, size, max_buckets, now, max_id):
+        snap = HardwareSnapshot.__table__.c
+        limit = _floor(now - datetime.timedelta(seconds=SETTLE_DELAY), size)
+        start = self.watermark(model, size)
+
+        with engine.connect() as conn:
+            # On saute directement au prochain relevé (les trous, PC éteint, ne coûtent rien)
+            query = select(func.min(snap.timestamp)).where(snap.id <= max_id)
+            if start is not None:
+                query = query.where(snap.timestamp >= start)
+            first = conn.execute(query).scalar()
+        if first is None:
+            return False
+        if isinstance(first, str):
+            first = datetime.datetime.fromisoformat(first)
+
+        start = _floor(first, size)
+        if start >= limit:
+            return False
+        end = min(limit, start + datetime.timedelta(seconds=size * max_buckets))
+
+        rows = []
+        current_key = None
+        with engine.connect() as conn:
+            result = conn.execute(
+                select(snap.timestamp, snap.session_id, snap.cpu_usage, snap.ram_usage, snap.gpu_usage, snap.gpu_temp)
+                .where(snap.timestamp >= start, snap.timestamp < end, snap.id <= max_id)
+                .order_by(snap.timestamp)
+            )
+            # Flux trié par date : une seule tranche (par session) en mémoire à la fois
+            groups = {}
+            for ts, session_id, *values in result:
+                bucket = _floor(ts, size)
+                if bucket != current_key:
+                    rows.extend(_summarize(current_key, sid, vals) for sid, vals in groups.items())
+                    current_key, groups = bucket, {}
+                groups.setdefault(session_id, []).append(values)
+            rows.extend(_summarize(current_key, sid, vals) for sid, vals in groups.items())
+
+        if rows:
+            with engine.begin() as conn:
+                conn.execute(insert(model), rows)
+        logger.debug(f"Retention: {model.__tablename__} rolled up {start} -> {end} ({len(rows)} buckets).")
+        return end < limit
+
+    def _delete_before(self, table, column, cutoff, *criteria):
+        deleted = 0
+        while not self._stop.is_set():
+            with engine.begin() as conn:
+                ids = select(table.c.id).where(column < cutoff, *criteria).limit(PRUNE_BATCH).scalar_subquery()
+                count = conn.execute(delete(table).where(table.c.id.in_(ids))).rowcount
+            deleted += count
+            if count < PRUNE_BATCH:
+                break
+        return deleted
+
+    def _prune(self, now):
+        # Les bruts ne sont supprimés qu'une fois agrégés dans tous les paliers
+        watermarks = [self.watermark(model, size) for model, size, _ in TIERS]
+        if None in watermarks:
+            return
+        raw_cutoff = min([now - self.raw_max_age] + watermarks)
+
+        snap = HardwareSnapshot.__table__
+        # Seules les lignes déjà vues par une passe sont couvertes : les plus récentes peuvent
+        # être des retardataires pas encore agrégées. La ligne d'id _checked_id est gardée :
+        # SQLite attribue max(rowid) + 1, les ids restent ainsi croissants après une purge
+        covered = snap.c.id < self._checked_id
+        raw_deleted = self._delete_before(snap, snap.c.timestamp, raw_cutoff, covered)
+        # Les sessions archivées n'ont plus besoin de leurs bruts dès qu'ils sont agrégés
+        archived = select(SessionArchiveEntry.session_id).where(SessionArchiveEntry.row_count > 0)
+        raw_deleted += self._delete_before(snap, snap.c.timestamp, min(watermarks), covered, snap.c.session_id.in_(archived))
+        minute = SnapshotRollupMinute.__table__
+        minute_deleted = self._delete_before(minute, minute.c.bucket_start, now - self.minute_max_age)
+        if raw_deleted or minute_deleted:
+            logger.info(f"Retention: Pruned {raw_deleted} raw snapshots and {minute_deleted} 1m rollups.")
@@ -0,0 +1,93 @@
+import sys
+import time
+from contextlib import contextmanager
+from core.database import load_config
+from core.logger import logger
+
+# Mode haute fréquence (opt-in) : clé "telemetry_hf_hz" de data/config.json, 0 ou absente = désactivé.
+# Actif uniquement pendant une session de jeu ; hors jeu, le relevé reste à 1 Hz.
+HF_MIN_HZ = 2
+HF_MAX_HZ = 50
+IDLE_PERIOD = 1.0
+
+
+def high_frequency_hz(config=None):
+    """Fréquence du mode haute fréquence configurée (bornée), ou 0 s'il est désactivé."""
+    config = load_config() if config is None else config
+    try:
+        hz = int(config.get("telemetry_hf_hz") or 0)
+    except (TypeError, ValueError):
+        logger.warning(f"Telemetry: Invalid telemetry_hf_hz {config.get('telemetry_hf_hz')!r}, high frequency disabled.")
+        return 0
+    if hz <= 0:
+        return 0
+    return max(HF_MIN_HZ, min(HF_MAX_HZ, hz))
+
+
+class SampleClock:
+    """Cadence de relevé sur horloge monotone, sans dérive.
+
+    Les échéances sont calculées à partir de la précédente (pas de l'heure de réveil) : le temps
+    passé à relever est déduit de l'attente et la fréquence moyenne reste exacte. Si un relevé
+    déborde de plus d'une période, les ticks manqués sont abandonnés (compté dans overruns)
+    au lieu d'être rattrapés en rafale. speed > 1 accélère l'horloge (rejeu, benchs).
+    """
+
+    def __init__(self, period=IDLE_PERIOD, speed=1.0, clock=time.monotonic, sleep=time.sleep):
+        self.period = period
+        self.speed = speed
+        self.clock = clock
+        self.sleep = sleep
+        self.ticks = 0
+        self.overruns = 0
+        self.sampled_ms = 0          # temps d'échantillonnage nominal écoulé (ms), base des autres échéances
+        self._deadline = None
+
+    def set_period(self, period):
+        """Change la cadence ; la prochaine échéance part de maintenant."""
+        if period != self.period:
+            self.period = period
+            self._deadline = None
+
+    def wait(self):
+        """Attend l'échéance suivante. Retourne le retard constaté au réveil (s, temps réel)."""
+        step = self.period / self.speed
+        now = self.clock()
+        self._deadline = now + step if self._deadline is None else self._deadline + step
+        delay = self._deadline - now
+        skipped = 0
+        if delay > 0:
+            self.sleep(delay)
+        elif -delay > step:
+            skipped = int(-delay // step)
+            self.overruns += skipped
+            self._deadline += skipped * step
+        self.ticks += 1
+        # Les ticks abandonnés comptent dans le temps écoulé : les échéances de l'UI, de la
+        # détection de jeu et de l'enregistreur ne ralentissent pas quand la machine est chargée
+        self.sampled_ms += round((1 + skipped) * self.period * 1000)
+        return max(0.0, self.clock() - self._deadline)
+
+
+@contextmanager
+def timer_resolution(ms=1):
+    """Granularité du timer système à 1 ms sous Windows le temps du mode haute fréquence.
+
+    Par défaut, Windows réveille les threads par pas de ~15,6 ms : à 20 Hz, une attente de
+    50 ms tomberait à 46,9 ou 62,5 ms. Sans effet ailleurs.
+    """
+    winmm = None
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            winmm = ctypes.windll.winmm
+            if winmm.timeBeginPeriod(ms) != 0:
+                winmm = None
+        except Exception as e:
+            logger.debug(f"Telemetry: timeBeginPeriod unavailable: {e}")
+            winmm = None
+    try:
+        yield
+    finally:
+        if winmm is not None:
+            winmm.timeEndPeriod(ms)
@@ -0,0 +1,165 @@
+import time
+from core.logger import logger
+
+# Capteurs de température CPU, du plus représentatif au moins représentatif
+CPU_TEMP_PRIORITY = ("Package", "Max", "Total")
+# Mesures fournies par l'index, auxquelles l'UI et l'enregistreur s'abonnent
+METRICS = ("cpu_temp", "gpu_temp", "gpu_load", "gpu_memory")
+# Intervalle minimal de rafraîchissement par type de matériel (s), quel que soit l'abonnement :
+# l'inertie thermique du CPU rend inutile un relevé par seconde, la sonde SuperIO est lente
+HARDWARE_MIN_INTERVAL = {"Cpu": 2.0, "Motherboard": 10.0}
+# Marge sur l'échéance : un relevé "toutes les 2 s" ne doit pas sauter un tick pour quelques ms
+INTERVAL_TOLERANCE = 0.9
+
+
+def _kind(node):
+    return str(node.HardwareType)
+
+
+class SensorIndex:
+    """Capteurs LibreHardwareMonitor utiles à la télémétrie, repérés une fois dans l'arbre.
+
+    La découverte parcourt tout le matériel (types et noms traversent le pont .NET) ; ensuite,
+    chaque relevé ne met à jour que le matériel concerné et ne lit que les capteurs retenus.
+    Fonctionne sur tout objet exposant l'interface de LHM (HardwareType, Name, Sensors,
+    SensorType, Value), ce qui permet de tester la sélection sur un arbre factice.
+    """
+
+    def __init__(self, hardware_nodes):
+        self.cpu_temps = []           # candidats ordonnés : le premier non nul est retenu
+        self.gpu_temps = []           # capteurs du GPU principal (coeur, hotspot, mémoire) : maximum
+        self.gpu_load = None
+        self.gpu_memory_used = None
+        self.gpu_memory_total = None
+        self.hardware = []            # [(matériel, type, mesures qu'il porte)] à mettre à jour
+        self._last_update = {}        # {position dans self.hardware: time.monotonic()}
+        self._discover(hardware_nodes)
+
+    def _discover(self, hardware_nodes):
+        cpu_ranked, cpu_other = [], []
+        gpus = []
+        for hardware in hardware_nodes:
+            kind = _kind(hardware)
+            if "Cpu" in kind:
+                used = False
+                for sensor in hardware.Sensors:
+                    if str(sensor.SensorType) != "Temperature":
+                        continue
+                    name = sensor.Name
+                    rank = next((i for i, key in enumerate(CPU_TEMP_PRIORITY) if key in name), None)
+                    if rank is None:
+                        cpu_other.append(sensor)
+                    else:
+                        cpu_ranked.append((rank, sensor))
+                    used = True
+                if used:
+                    self.hardware.append((hardware, kind, frozenset(["cpu_temp"])))
+            elif "Gpu" in kind:
+                gpus.append((kind, hardware))
+
+        self.cpu_temps = [sensor for _, sensor in sorted(cpu_ranked, key=lambda item: item[0])] + cpu_other
+
+        # GPU dédié (Nvidia / AMD) avant le GPU intégré : le premier qui porte une mesure la fournit,
+        # l'iGPU n'est donc plus interrogé à côté d'une carte dédiée
+        gpus.sort(key=lambda item: item[0] == "GpuIntel")
+        for kind, hardware in gpus:
+            metrics = set()
+            temps = []
+            core_load = None
+            memory = {}
+            for sensor in hardware.Sensors:
+                sensor_type = str(sensor.SensorType)
+                name = sensor.Name
+                if sensor_type == "Temperature":
+                    temps.append(sensor)
+                elif sensor_type == "Load" and "Core" in name:
+                    if core_load is None or name == "GPU Core":
+                        core_load = sensor
+                elif sensor_type == "SmallData" and name in ("GPU Memory Used", "GPU Memory Total"):
+                    memory[name] = sensor
+            if temps and not self.gpu_temps:
+                self.gpu_temps = temps
+                metrics.add("gpu_temp")
+            if core_load is not None and self.gpu_load is None:
+                self.gpu_load = core_load
+                metrics.add("gpu_load")
+            if memory and self.gpu_memory_used is None and self.gpu_memory_total is None:
+                self.gpu_memory_used = memory.get("GPU Memory Used")
+                self.gpu_memory_total = memory.get("GPU Memory Total")
+                metrics.add("gpu_memory")
+            if metrics:
+                self.hardware.append((hardware, kind, frozenset(metrics)))
+
+    def __len__(self):
+        handles = self.cpu_temps[:1] + self.gpu_temps + [self.gpu_load, self.gpu_memory_used, self.gpu_memory_total]
+        return sum(1 for sensor in handles if sensor is not None)
+
+    def describe(self):
+        """Résumé des capteurs retenus (pour le log)."""
+        parts = []
+        if self.cpu_temps:
+            parts.append(f"cpu_temp={self.cpu_temps[0].Name}")
+        if self.gpu_temps:
+            parts.append(f"gpu_temp=max({', '.join(s.Name for s in self.gpu_temps)})")
+        if self.gpu_load is not None:
+            parts.append(f"gpu_load={self.gpu_load.Name}")
+        return ", ".join(parts) or "no sensors"
+
+    def plan(self, intervals=None):
+        """Intervalle de rafraîchissement de chaque matériel : [(type, secondes ou None)].
+
+        intervals {mesure: secondes} vient des abonnés (None : toutes les mesures, sans délai).
+        Un matériel suit la mesure la plus pressée qu'il porte, sans descendre sous
+        HARDWARE_MIN_INTERVAL ; None si personne ne lit ses capteurs (il n'est plus interrogé).
+        """
+        if intervals is None:
+            intervals = dict.fromkeys(METRICS, 0.0)
+        plan = []
+        for hardware, kind, metrics in self.hardware:
+            wanted = [intervals[metric] for metric in metrics if metric in intervals]
+            plan.append((kind, max(min(wanted), HARDWARE_MIN_INTERVAL.get(kind, 0.0)) if wanted else None))
+        return plan
+
+    def update(self, intervals=None, now=None):
+        """Rafraîchit le matériel dont l'échéance est passée."""
+        now = time.monotonic() if now is None else now
+        for position, (kind, interval) in enumerate(self.plan(intervals)):
+            if interval is None:
+                continue
+            last = self._last_update.get(position)
+            if last is None or now - last >= interval * INTERVAL_TOLERANCE:
+                self.hardware[position][0].Update()
+                self._last_update[position] = now
+
+    def read(self):
+        """Valeurs courantes des capteurs retenus (0.0 si absent ou sans valeur)."""
+        cpu_temp = 0.0
+        for sensor in self.cpu_temps:
+            value = sensor.Value
+            if value:
+                cpu_temp = value
+                break
+
+        gpu_temp = 0.0
+        for sensor in self.gpu_temps:
+            gpu_temp = max(gpu_temp, sensor.Value or 0.0)
+
+        def value_of(sensor):
+            if sensor is None:
+                return 0.0
+            return sensor.Value or 0.0
+
+        return {
+            "cpu_temp": cpu_temp,
+            "gpu_temp": gpu_temp,
+            "gpu_load": value_of(self.gpu_load),
+            "gpu_memory_used": value_of(self.gpu_memory_used),
+            "gpu_memory_total": value_of(self.gpu_memory_total),
+        }
+
+
+def discover(hardware_nodes):
+    """Construit l'index et journalise la sélection."""
+    index = SensorIndex(hardware_nodes)
+    logger.info(f"Telemetry: Sensor index built ({len(index)} sensors): {index.describe()}")
+    return index
@@ -1,6 +1,8 @@
 import psutil
 import os
 from core.database import get_session, GameSession, HardwareSnapshot
+from core.telemetry.writer import get_telemetry_writer
+from core.telemetry.archive import archive_session_async
 import datetime
 from core.logger import logger
 
@@ -76,11 +78,15 @@ class SessionManager:
             return
         try:
             title = self.current_session['title']
+            # Les derniers relevés de la session doivent être en base avant de la clôturer
+            get_telemetry_writer().flush()
             db = get_session()
             sess = db.query(GameSession).filter(GameSession.id == self.current_session['id']).first()
             if sess:
                 sess.end_time = datetime.datetime.utcnow()
                 db.commit()
+                # Compactage colonnaire de la session en arrière-plan
+                archive_session_async(sess.id)
             logger.info(f"SessionMgr: ENDED session for {title}")
             self.current_session = None
             db.close()
@@ -0,0 +1,246 @@
+import bisect
+import math
+from array import array
+from core.logger import logger
+
+# Lissage par mesure : clé "telemetry_smoothing" de data/config.json, ex. {"cpu": "ema:8", "gpu": "median:2.5"}.
+# Forme "<filtre>:<fenêtre en secondes>" ; "none" laisse la mesure brute. Les mesures absentes gardent le défaut.
+# La fenêtre est convertie en relevés selon la cadence courante (1 Hz, ou haute fréquence en jeu).
+DEFAULT_SMOOTHING = {"cpu": "sma:5", "gpu": "sma:5"}
+MAX_WINDOW_SECONDS = 300
+
+
+class RingBuffer:
+    """Fenêtre glissante de taille fixe sur un array('d'), avec somme courante.
+
+    push() est en O(1) : la valeur la plus ancienne est écrasée et retirée de la somme. La somme
+    est recalculée exactement à chaque tour complet (O(1) amorti), pour que les erreurs
+    d'arrondi des soustractions ne s'accumulent pas sur des jours de relevés.
+    """
+    __slots__ = ("size", "values", "count", "total", "_head")
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError(f"RingBuffer: invalid size {size}")
+        self.size = size
+        self.values = array("d", bytes(8 * size))
+        self.count = 0
+        self.total = 0.0
+        self._head = 0      # prochaine case écrite (la plus ancienne une fois la fenêtre pleine)
+
+    def __len__(self):
+        return self.count
+
+    def push(self, value):
+        """Ajoute une valeur ; retourne la valeur évincée (None tant que la fenêtre n'est pas pleine)."""
+        evicted = None
+        if self.count == self.size:
+            evicted = self.values[self._head]
+            self.total -= evicted
+        else:
+            self.count += 1
+        self.values[self._head] = value
+        self.total += value
+        self._head += 1
+        if self._head == self.size:
+            self._head = 0
+            self.total = math.fsum(self.values)
+        return evicted
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def clear(self):
+        self.count = 0
+        self.total = 0.0
+        self._head = 0
+
+
+class SmaFilter:
+    """Moyenne mobile simple sur window relevés."""
+    name = "sma"
+
+    def __init__(self, window):
+        self.window = window
+        self.buffer = RingBuffer(window)
+
+    def update(self, value):
+        self.buffer.push(value)
+        return self.buffer.mean()
+
+    def resize(self, window):
+        """Nouvelle taille de fenêtre ; l'historique est résumé par sa moyenne (pas de saut de valeur)."""
+        if window == self.window:
+            return
+        buffer = self.buffer
+        self.buffer = _prefill(RingBuffer(window), buffer.mean(), buffer.count, self.window)
+        self.window = window
+
+    def reset(self):
+        self.buffer.clear()
+
+
+class EmaFilter:
+    """Moyenne mobile exponentielle, alpha = 2 / (window + 1) : même retard moyen qu'une SMA de window relevés.
+
+    Aucune fenêtre à conserver ; réagit plus vite qu'une SMA à un changement de palier.
+    """
+    name = "ema"
+
+    def __init__(self, window):
+        self.window = window
+        self.alpha = 2.0 / (window + 1)
+        self.value = None
+
+    def update(self, value):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    def resize(self, window):
+        self.window = window
+        self.alpha = 2.0 / (window + 1)
+
+    def reset(self):
+        self.value = None
+
+
+class MedianFilter:
+    """Médiane glissante sur window relevés : écarte un relevé aberrant isolé sans étaler les paliers.
+
+    Les valeurs de la fenêtre sont tenues triées à côté du tampon circulaire (recherche par
+    bisect) : la médiane se lit directement, sans trier la fenêtre à chaque relevé.
+    """
+    name = "median"
+
+    def __init__(self, window):
+        self.window = window
+        self.buffer = RingBuffer(window)
+        self._sorted = []
+
+    def update(self, value):
+        evicted = self.buffer.push(value)
+        if evicted is not None:
+            del self._sorted[bisect.bisect_left(self._sorted, evicted)]
+        bisect.insort(self._sorted, value)
+        count = len(self._sorted)
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    def resize(self, window):
+        """Nouvelle taille de fenêtre ; l'historique est résumé par sa médiane."""
+        if window == self.window:
+            return
+        count = len(self._sorted)
+        median = 0.0
+        if count:
+            middle = count // 2
+            median = self._sorted[middle] if count % 2 else (self._sorted[middle - 1] + self._sorted[middle]) / 2
+        self.buffer = _prefill(RingBuffer(window), median, count, self.window)
+        self._sorted = [median] * len(self.buffer)
+        self.window = window
+
+    def reset(self):
+        self.buffer.clear()
+        self._sorted = []
+
+
+def _prefill(buffer, value, count, old_window):
+    """Remplit buffer avec value, dans la même proportion que l'ancienne fenêtre (count / old_window)."""
+    if count:
+        for _ in range(max(1, round(buffer.size * count / old_window))):
+            buffer.push(value)
+    return buffer
+
+
+FILTERS = {cls.name: cls for cls in (SmaFilter, EmaFilter, MedianFilter)}
+
+
+def window_samples(seconds, period):
+    """Nombre de relevés couvrant seconds à la cadence period (au moins 1)."""
+    return max(1, round(seconds / period))
+
+
+def parse_filter(spec):
+    """(filtre, fenêtre en secondes) pour "<filtre>:<secondes>", None pour "none". ValueError si invalide."""
+    if spec in (None, "", "none"):
+        return None
+    name, _, seconds = str(spec).partition(":")
+    if name not in FILTERS:
+        raise ValueError(f"unknown filter '{name}'")
+    seconds = float(seconds) if seconds else 5.0
+    if not 0 < seconds <= MAX_WINDOW_SECONDS:
+        raise ValueError(f"window {seconds:g}s out of range 0-{MAX_WINDOW_SECONDS}s")
+    return name, seconds
+
+
+def smoothing_from_config(config=None):
+    """{mesure: description du filtre} : défauts complétés par "telemetry_smoothing"."""
+    if config is None:
+        from core.database import load_config
+        config = load_config()
+    specs = dict(DEFAULT_SMOOTHING)
+    overrides = config.get("telemetry_smoothing") or {}
+    if not isinstance(overrides, dict):
+        logger.warning(f"Telemetry: Invalid telemetry_smoothing {overrides!r}, using defaults.")
+        return specs
+    specs.update(overrides)
+    return specs
+
+
+class Smoother:
+    """Lissage d'un relevé, mesure par mesure, en gardant la valeur brute.
+
+    update(sample) renvoie le relevé avec les mesures filtrées remplacées par leur valeur
+    lissée ; les valeurs brutes du dernier relevé restent dans raw. Les fenêtres sont en
+    secondes : set_period() les recalcule en relevés quand la cadence change. Une description
+    invalide retombe sur le défaut de la mesure (ou la laisse brute).
+    """
+
+    def __init__(self, specs=None, period=1.0):
+        specs = smoothing_from_config() if specs is None else specs
+        self.period = period
+        self.filters = {}
+        self.seconds = {}
+        for metric, spec in specs.items():
+            try:
+                parsed = parse_filter(spec)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Telemetry: Invalid smoothing '{spec}' for {metric} ({e}), using default.")
+                parsed = parse_filter(DEFAULT_SMOOTHING.get(metric))
+            if parsed is not None:
+                name, seconds = parsed
+                self.filters[metric] = FILTERS[name](window_samples(seconds, period))
+                self.seconds[metric] = seconds
+        self.raw = {}
+
+    def describe(self):
+        return ", ".join(f"{metric}={f.name}:{self.seconds[metric]:g}s ({f.window} samples)"
+                         for metric, f in self.filters.items()) or "none"
+
+    def set_period(self, period):
+        """Cadence des relevés (s) : même durée lissée, en plus ou moins de relevés."""
+        if period == self.period:
+            return
+        self.period = period
+        for metric, smoothing_filter in self.filters.items():
+            smoothing_filter.resize(window_samples(self.seconds[metric], period))
+
+    def update(self, sample):
+        smoothed = dict(sample)
+        for metric, smoothing_filter in self.filters.items():
+            raw = sample.get(metric)
+            if raw is None or raw != raw:     # absente ou NaN : la fenêtre n'est pas polluée
+                continue
+            self.raw[metric] = raw
+            smoothed[metric] = smoothing_filter.update(float(raw))
+        return smoothed
+
+    def reset(self):
+        for smoothing_filter in self.filters.values():
+            smoothing_filter.reset()
+        self.raw = {}
@@ -0,0 +1,328 @@
+import glob
+import json
+from abc import ABC, abstractmethod
+import os
+import sys
+import threading
+import time
+import psutil
+from core.logger import logger
+
+# Clés d'un relevé brut, communes à toutes les sources (avant lissage par le collecteur)
+SAMPLE_KEYS = ("cpu", "ram", "gpu", "cpu_temp", "gpu_temp")
+
+# Sélection : variable d'env NEXUS_TELEMETRY_SOURCE, sinon clé "telemetry_source" de data/config.json.
+# "auto" (défaut), "lhm", "psutil", "hwmon" ou "replay:<fichier.jsonl>".
+# NEXUS_TELEMETRY_RECORD=<fichier.jsonl> enregistre en plus les relevés de la source choisie.
+DEFAULT_SOURCE = "auto"
+
+
+class TelemetrySource(ABC):
+    """Origine des relevés matériels du TelemetryCollector.
+
+    read() renvoie un relevé brut {cpu, ram, gpu, cpu_temp, gpu_temp} ; intervals
+    {mesure: secondes} transmet les abonnements du collecteur aux sources qui savent en
+    profiter (voir sensor_index.METRICS). open() fait l'initialisation lourde (pilotes, CLR),
+    idempotente, et indique si des capteurs de température sont disponibles.
+    """
+    name = "base"
+
+    def open(self):
+        return False
+
+    @abstractmethod
+    def read(self, intervals=None):
+        """Relevé brut courant (clés SAMPLE_KEYS)."""
+
+    def close(self):
+        pass
+
+
+class PsutilSource(TelemetrySource):
+    """Charge CPU et RAM seulement (aucune température, aucun GPU)."""
+    name = "psutil"
+
+    def read(self, intervals=None):
+        return {
+            "cpu": psutil.cpu_percent(interval=None),
+            "ram": psutil.virtual_memory().percent,
+            "gpu": 0.0,
+            "cpu_temp": 0.0,
+            "gpu_temp": 0.0,
+        }
+
+
+class LhmSource(PsutilSource):
+    """psutil + LibreHardwareMonitor (Windows, pythonnet et DLL requis)."""
+    name = "lhm"
+
+    def __init__(self):
+        self._lhm = None
+        self._lock = threading.Lock()
+
+    @property
+    def lhm(self):
+        """LibreHardwareMonitor ouvert au premier relevé (thread de télémétrie), pas au démarrage de l'UI."""
+        if self._lhm is None:
+            with self._lock:
+                if self._lhm is None:
+                    from core.telemetry.lhm_wrapper import HardwareMonitor
+                    self._lhm = HardwareMonitor()
+        return self._lhm
+
+    def open(self):
+        return self.lhm.enabled
+
+    def read(self, intervals=None):
+        sample = super().read(intervals)
+        lhm_data = self.lhm.get_data(intervals)
+        if lhm_data:
+            sample["gpu"] = lhm_data.get("gpu_load", 0.0)
+            sample["cpu_temp"] = lhm_data.get("cpu_temp", 0.0)
+            sample["gpu_temp"] = lhm_data.get("gpu_temp", 0.0)
+        return sample
+
+    def close(self):
+        if self._lhm:
+            self._lhm.close()
+
+
+class HwmonSource(PsutilSource):
+    """psutil + capteurs Linux exposés dans /sys/class/hwmon (k10temp, coretemp, amdgpu...).
+
+    Les fichiers utiles sont repérés une fois puis relus par pread() sur un descripteur ouvert,
+    sans parcourir l'arborescence à chaque relevé. Les lectures sysfs étant peu coûteuses, les
+    abonnements (intervals) sont ignorés.
+    """
+    name = "hwmon"
+    # Puces de température CPU et libellés préférés (premier trouvé), sinon le premier capteur
+    CPU_CHIPS = {"k10temp": ("Tctl", "Tdie"), "zenpower": ("Tdie", "Tctl"), "coretemp": ("Package id 0",),
+                 "cpu_thermal": ()}
+    GPU_CHIPS = ("amdgpu", "nouveau", "radeon", "i915", "xe")
+
+    def __init__(self, root="/sys/class/hwmon"):
+        self.root = root
+        self._cpu_temp = []       # descripteurs, par priorité
+        self._gpu_temps = []      # descripteurs du GPU retenu : maximum
+        self._gpu_busy = None     # descripteur de device/gpu_busy_percent (amdgpu)
+        self._opened = False
+        self._lock = threading.Lock()
+
+    def open(self):
+        with self._lock:
+            if not self._opened:
+                self._opened = True
+                self._discover()
+        return bool(self._cpu_temp or self._gpu_temps)
+
+    def _read_text(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _open_fd(self, path):
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+
+    def _temp_inputs(self, chip_dir):
+        """[(libellé, chemin de tempN_input)] dans l'ordre des N."""
+        inputs = []
+        for path in sorted(glob.glob(os.path.join(chip_dir, "temp*_input")),
+                           key=lambda p: int(os.path.basename(p)[4:-6] or 0)):
+            label = self._read_text(path[:-len("input")] + "label") or os.path.basename(path)[:-6]
+            inputs.append((label, path))
+        return inputs
+
+    def _discover(self):
+        for chip_dir in sorted(glob.glob(os.path.join(self.root, "hwmon*"))):
+            chip = self._read_text(os.path.join(chip_dir, "name"))
+            inputs = self._temp_inputs(chip_dir)
+            if not inputs:
+                continue
+            if chip in self.CPU_CHIPS and not self._cpu_temp:
+                preferred = self.CPU_CHIPS[chip]
+                ranked = sorted(inputs, key=lambda item: next((i for i, key in enumerate(preferred) if item[0].startswith(key)), len(preferred)))
+                self._cpu_temp = [fd for fd in (self._open_fd(path) for _, path in ranked) if fd is not None]
+            elif chip in self.GPU_CHIPS and not self._gpu_temps:
+                self._gpu_temps = [fd for fd in (self._open_fd(path) for _, path in inputs) if fd is not None]
+                self._gpu_busy = self._open_fd(os.path.join(chip_dir, "device", "gpu_busy_percent"))
+        logger.info(f"Telemetry: hwmon sensors -> {len(self._cpu_temp)} CPU, {len(self._gpu_temps)} GPU, "
+                    f"GPU load {'available' if self._gpu_busy is not None else 'unavailable'}.")
+
+    def _value(self, fd, scale):
+        try:
+            return int(os.pread(fd, 32, 0)) / scale
+        except (OSError, ValueError):
+            return 0.0
+
+    def read(self, intervals=None):
+        self.open()
+        sample = super().read(intervals)
+        for fd in self._cpu_temp:
+            value = self._value(fd, 1000.0)
+            if value:
+                sample["cpu_temp"] = value
+                break
+        for fd in self._gpu_temps:
+            sample["gpu_temp"] = max(sample["gpu_temp"], self._value(fd, 1000.0))
+        if self._gpu_busy is not None:
+            sample["gpu"] = self._value(self._gpu_busy, 1.0)
+        return sample
+
+    def close(self):
+        with self._lock:
+            for fd in self._cpu_temp + self._gpu_temps + ([self._gpu_busy] if self._gpu_busy is not None else []):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._cpu_temp, self._gpu_temps, self._gpu_busy = [], [], None
+            self._opened = False
+
+
+def load_recording(path):
+    """Relevés enregistrés (JSON lines {"t": secondes, cpu, ram, gpu, cpu_temp, gpu_temp}), triés par t."""
+    samples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                samples.append((float(record.get("t", len(samples))), {key: float(record.get(key) or 0.0) for key in SAMPLE_KEYS}))
+    samples.sort(key=lambda item: item[0])
+    return samples
+
+
+class ReplaySource(TelemetrySource):
+    """Rejoue un enregistrement, en temps accéléré ou pas à pas (déterministe).
+
+    speed=1000 : une heure enregistrée est rejouée en 3,6 s (le relevé renvoyé est celui en
+    vigueur à l'instant simulé). speed=None : chaque read() renvoie le relevé suivant, quelle
+    que soit l'horloge. Avec loop, l'enregistrement reprend au début une fois terminé.
+    """
+    name = "replay"
+
+    def __init__(self, recording, speed=None, loop=True, clock=time.monotonic):
+        self.path = recording if isinstance(recording, str) else None
+        self.samples = load_recording(recording) if self.path else list(recording)
+        if not self.samples:
+            raise ValueError("ReplaySource: empty recording")
+        self.speed = speed
+        self.loop = loop
+        self.clock = clock
+        self.position = 0
+        self.reads = 0
+        self._t0 = None
+        # Durée d'un tour complet : dernier relevé compris (un pas d'échantillonnage de plus).
+        # Le pas est le premier écart non nul (plusieurs relevés peuvent partager un même t)
+        step = next((b[0] - a[0] for a, b in zip(self.samples, self.samples[1:]) if b[0] > a[0]), 1.0)
+        self._period = self.samples[-1][0] - self.samples[0][0] + step
+
+    def open(self):
+        return any(sample["cpu_temp"] or sample["gpu_temp"] for _, sample in self.samples[:100])
+
+    def read(self, intervals=None):
+        self.reads += 1
+        if self.speed is None:
+            _, sample = self.samples[self.position]
+            self.position += 1
+            if self.position >= len(self.samples):
+                self.position = 0 if self.loop else len(self.samples) - 1
+            return dict(sample)
+
+        now = self.clock()
+        if self._t0 is None:
+            self._t0 = now
+        simulated = (now - self._t0) * self.speed
+        if self.loop:
+            simulated %= self._period
+        target = self.samples[0][0] + simulated
+        if target < self.samples[self.position][0]:
+            self.position = 0   # l'enregistrement a bouclé
+        while self.position + 1 < len(self.samples) and self.samples[self.position + 1][0] <= target:
+            self.position += 1
+        return dict(self.samples[self.position][1])
+
+
+class RecordingSource(TelemetrySource):
+    """Enregistre les relevés d'une autre source, au format lu par ReplaySource.
+
+    Un fichier existant est complété : t reprend après son dernier relevé (plus RESUME_GAP),
+    pour que le rejeu, trié par t, enchaîne les sessions au lieu de les entrelacer.
+    """
+    RESUME_GAP = 1.0
+
+    def __init__(self, inner, path):
+        self.inner = inner
+        self.name = inner.name
+        self.path = path
+        self._t0 = None
+        self._offset = self._resume_offset(path)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Tampon par ligne : chaque relevé est écrit aussitôt, un crash ne perd pas l'enregistrement
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def _resume_offset(self, path):
+        """t du premier relevé à écrire : 0 pour un nouveau fichier, sinon après le dernier relevé."""
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 4096))
+                lines = [line for line in f.read().splitlines() if line.strip()]
+            return float(json.loads(lines[-1])["t"]) + self.RESUME_GAP if lines else 0.0
+        except FileNotFoundError:
+            return 0.0
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Telemetry: Could not read last sample of {path} ({e}), recording from t=0.")
+            return 0.0
+
+    def open(self):
+        return self.inner.open()
+
+    def read(self, intervals=None):
+        sample = self.inner.read(intervals)
+        now = time.monotonic()
+        if self._t0 is None:
+            self._t0 = now
+        self._file.write(json.dumps({"t": round(self._offset + now - self._t0, 3), **sample}) + "\n")
+        return sample
+
+    def close(self):
+        self._file.close()
+        self.inner.close()
+
+
+def create_source(spec=None):
+    """Source de télémétrie selon spec, NEXUS_TELEMETRY_SOURCE ou data/config.json."""
+    if spec is None:
+        from core.database import load_config
+        spec = os.environ.get("NEXUS_TELEMETRY_SOURCE") or load_config().get("telemetry_source") or DEFAULT_SOURCE
+
+    if spec == "auto":
+        if sys.platform == "win32":
+            spec = "lhm"
+        elif os.path.isdir("/sys/class/hwmon"):
+            spec = "hwmon"
+        else:
+            spec = "psutil"
+
+    if spec.startswith("replay:"):
+        source = ReplaySource(spec[len("replay:"):], speed=1.0)
+    elif spec == "lhm":
+        source = LhmSource()
+    elif spec == "hwmon":
+        source = HwmonSource()
+    else:
+        if spec != "psutil":
+            logger.warning(f"Telemetry: Unknown source '{spec}', falling back to psutil.")
+        source = PsutilSource()
+
+    record_path = os.environ.get("NEXUS_TELEMETRY_RECORD")
+    if record_path:
+        source = RecordingSource(source, record_path)
+        logger.info(f"Telemetry: Recording samples to {record_path}")
+    logger.info(f"Telemetry: Using '{source.name}' source.")
+    return source
@@ -0,0 +1,188 @@
+import datetime
+import math
+from dataclasses import dataclass, field
+from sqlalchemy import text
+from core.database import engine
+from core.telemetry.archive import load_session_archive
+
+# Colonnes agrégées. gpu_temp vaut 0 quand le capteur est absent : on l'exclut des calculs.
+METRICS = {
+    "cpu_usage": "cpu_usage",
+    "ram_usage": "ram_usage",
+    "gpu_usage": "gpu_usage",
+    "gpu_temp": "NULLIF(gpu_temp, 0)",
+}
+DEFAULT_PERCENTILES = (50, 95)
+
+
+@dataclass
+class MetricStats:
+    avg: float = None
+    min: float = None
+    max: float = None
+    percentiles: dict = field(default_factory=dict)  # {95: valeur}
+
+
+@dataclass
+class StatsBucket:
+    start: datetime.datetime
+    count: int
+    metrics: dict  # {metric: MetricStats} (sans percentiles)
+
+
+@dataclass
+class SessionStats:
+    session_id: int
+    count: int
+    start: datetime.datetime = None
+    end: datetime.datetime = None
+    metrics: dict = field(default_factory=dict)  # {metric: MetricStats}
+    buckets: list = field(default_factory=list)  # [StatsBucket] si bucket_seconds est demandé
+    source: str = "raw"  # "raw", "archive" ou "rollup_1m" selon où se trouvent encore les données
+
+    def get(self, metric, stat="avg", default=0.0):
+        """Raccourci : stats.get("cpu_usage", "max") ou stats.get("gpu_temp", 95) pour un percentile."""
+        m = self.metrics.get(metric)
+        if m is None:
+            return default
+        value = m.percentiles.get(stat) if isinstance(stat, int) else getattr(m, stat)
+        return default if value is None else value
+
+
+def _parse_ts(value):
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime.fromisoformat(value)
+
+
+def _summary_sql(percentiles):
+    """Une seule requête : count, bornes temporelles, avg/min/max et percentiles de chaque métrique.
+
+    Les percentiles (rang le plus proche) sont des sous-requêtes scalaires ORDER BY ... LIMIT 1 OFFSET k
+    sur le CTE de la session, qui exploite l'index (session_id, timestamp).
+    """
+    cols = ["COUNT(*)", "MIN(timestamp)", "MAX(timestamp)"]
+    for name, expr in METRICS.items():
+        cols += [f"AVG({expr})", f"MIN({expr})", f"MAX({expr})"]
+        for p in percentiles:
+            cols.append(
+                f"(SELECT v FROM (SELECT {expr} AS v FROM s) WHERE v IS NOT NULL ORDER BY v "
+                f"LIMIT 1 OFFSET (SELECT CAST((COUNT({expr}) - 1) * {p} / 100.0 AS INTEGER) FROM s))"
+            )
+    return (
+        "WITH s AS (SELECT timestamp, cpu_usage, ram_usage, gpu_usage, gpu_temp "
+        "FROM hardware_snapshots WHERE session_id = :sid) "
+        f"SELECT {', '.join(cols)} FROM s"
+    )
+
+
+def _buckets_sql():
+    cols = ["CAST(strftime('%s', timestamp) AS INTEGER) / :bucket AS b", "COUNT(*)"]
+    for expr in METRICS.values():
+        cols += [f"AVG({expr})", f"MIN({expr})", f"MAX({expr})"]
+    return (
+        f"SELECT {', '.join(cols)} FROM hardware_snapshots "
+        "WHERE session_id = :sid GROUP BY b ORDER BY b"
+    )
+
+
+def _rollup_summary_sql():
+    """Même résumé calculé depuis les agrégats 1 min (les percentiles exacts ne sont plus disponibles)."""
+    cols = ["SUM(sample_count)", "MIN(bucket_start)", "MAX(bucket_start)"]
+    for name in METRICS:
+        cols += [f"SUM({name}_avg * sample_count) / SUM(CASE WHEN {name}_avg IS NOT NULL THEN sample_count END)",
+                 f"MIN({name}_min)", f"MAX({name}_max)"]
+    return f"SELECT {', '.join(cols)} FROM hardware_snapshots_1m WHERE session_id = :sid"
+
+
+def _rollup_buckets_sql():
+    cols = ["CAST(strftime('%s', bucket_start) AS INTEGER) / :bucket AS b", "SUM(sample_count)"]
+    for name in METRICS:
+        cols += [f"SUM({name}_avg * sample_count) / SUM(CASE WHEN {name}_avg IS NOT NULL THEN sample_count END)",
+                 f"MIN({name}_min)", f"MAX({name}_max)"]
+    return (
+        f"SELECT {', '.join(cols)} FROM hardware_snapshots_1m "
+        "WHERE session_id = :sid GROUP BY b ORDER BY b"
+    )
+
+
+def _archive_stats(session_id, percentiles, bucket_seconds):
+    """Résumé exact calculé depuis l'archive colonnaire de la session (None si non archivée)."""
+    archive = load_session_archive(session_id)
+    if archive is None:
+        return None
+    with archive:
+        offsets = archive.offsets_ms()
+        stats = SessionStats(session_id=session_id, count=archive.row_count, source="archive",
+                             start=archive.start,
+                             end=archive.start + datetime.timedelta(milliseconds=offsets[-1] if offsets else 0))
+        for name in METRICS:
+            column = archive.column(name)
+            values = sorted(v for v in column if not math.isnan(v) and not (name == "gpu_temp" and v == 0))
+            m = MetricStats()
+            if values:
+                m.avg, m.min, m.max = sum(values) / len(values), values[0], values[-1]
+                for p in percentiles:
+                    m.percentiles[p] = values[int((len(values) - 1) * p / 100.0)]
+            stats.metrics[name] = m
+
+            if bucket_seconds:
+                size_ms = int(bucket_seconds) * 1000
+                t0_bucket = archive.t0_ms // size_ms
+                groups = {}
+                for offset, v in zip(offsets, column):
+                    groups.setdefault((archive.t0_ms + offset) // size_ms - t0_bucket, []).append(v)
+                for i, (key, vals) in enumerate(sorted(groups.items())):
+                    if len(stats.buckets) <= i:
+                        start = datetime.datetime.utcfromtimestamp((t0_bucket + key) * int(bucket_seconds))
+                        stats.buckets.append(StatsBucket(start=start, count=len(vals), metrics={}))
+                    valid = [v for v in vals if not math.isnan(v) and not (name == "gpu_temp" and v == 0)]
+                    stats.buckets[i].metrics[name] = MetricStats(
+                        avg=sum(valid) / len(valid) if valid else None,
+                        min=min(valid, default=None), max=max(valid, default=None))
+    return stats
+
+
+def get_session_stats(session_id, percentiles=DEFAULT_PERCENTILES, bucket_seconds=None):
+    """Agrège les snapshots d'une session côté SQL (un aller-retour, mémoire Python constante).
+
+    Si les bruts ont été purgés, le résumé vient de l'archive de la session ou des agrégats 1 min.
+
+    bucket_seconds : si fourni, ajoute une série avg/min/max par tranche de temps (courbes du dashboard).
+    """
+    percentiles = tuple(int(p) for p in percentiles)
+    with engine.connect() as conn:
+        row = conn.execute(text(_summary_sql(percentiles)), {"sid": session_id}).fetchone()
+        source = "raw"
+        if not row[0]:
+            # Bruts purgés : archive colonnaire de la session, sinon agrégats 1 min
+            archived = _archive_stats(session_id, percentiles, bucket_seconds)
+            if archived is not None:
+                return archived
+            row = conn.execute(text(_rollup_summary_sql()), {"sid": session_id}).fetchone()
+            source = "rollup_1m"
+        stats = SessionStats(session_id=session_id, count=row[0] or 0,
+                             start=_parse_ts(row[1]), end=_parse_ts(row[2]), source=source)
+
+        i = 3
+        for name in METRICS:
+            m = MetricStats(avg=row[i], min=row[i + 1], max=row[i + 2])
+            i += 3
+            if source == "raw":
+                for p in percentiles:
+                    m.percentiles[p] = row[i]
+                    i += 1
+            stats.metrics[name] = m
+
+        if bucket_seconds and stats.count:
+            sql = _buckets_sql() if source == "raw" else _rollup_buckets_sql()
+            for b_row in conn.execute(text(sql), {"sid": session_id, "bucket": int(bucket_seconds)}):
+                metrics = {}
+                j = 2
+                for name in METRICS:
+                    metrics[name] = MetricStats(avg=b_row[j], min=b_row[j + 1], max=b_row[j + 2])
+                    j += 3
+                start = datetime.datetime.utcfromtimestamp(b_row[0] * int(bucket_seconds))
+                stats.buckets.append(StatsBucket(start=start, count=b_row[1], metrics=metrics))
+
+    return stats
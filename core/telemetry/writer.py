@@ -0,0 +1,152 @@
+import atexit
+import datetime
+import threading
+from collections import deque
+from sqlalchemy import insert
+from core.database import engine, HardwareSnapshot
+from core.logger import logger
+
+# Politique de flush : on écrit dès que FLUSH_MAX_ROWS lignes sont en attente,
+# ou au plus tard toutes les FLUSH_MAX_AGE secondes.
+FLUSH_MAX_ROWS = 64
+FLUSH_MAX_AGE = 30.0
+# Taille max du buffer mémoire (si la DB est indisponible, les plus anciens relevés sont perdus)
+BUFFER_CAPACITY = 4096
+# À haut débit (mode haute fréquence) : une transaction pour ~HIGH_RATE_BATCH_SECONDS de relevés,
+# et un buffer qui couvre au moins HIGH_RATE_BUFFER_SECONDS d'indisponibilité de la base
+HIGH_RATE_BATCH_SECONDS = 5
+HIGH_RATE_BUFFER_SECONDS = 600
+
+
+class TelemetryWriter:
+    """Write-behind des HardwareSnapshot.
+
+    Les relevés sont empilés dans un buffer circulaire en mémoire puis insérés
+    en une seule transaction (executemany) par un thread dédié. Le thread de
+    télémétrie ne touche donc plus jamais le disque.
+    """
+
+    def __init__(self, max_rows=FLUSH_MAX_ROWS, max_age=FLUSH_MAX_AGE, capacity=BUFFER_CAPACITY):
+        self.max_rows = max_rows
+        self.max_age = max_age
+        self._base_rows = max_rows
+        self._base_capacity = capacity
+        self._buffer = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.dropped = 0
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="TelemetryWriter", daemon=True)
+        self._thread.start()
+        logger.info(f"TelemetryWriter: Started (batch={self.max_rows} rows, max_age={self.max_age}s).")
+
+    def submit(self, cpu_usage, ram_usage, gpu_usage=None, gpu_temp=None,
+               session_id=None, active_game_id=None, timestamp=None):
+        """Ajoute un relevé au buffer (non bloquant)."""
+        row = {
+            "timestamp": timestamp or datetime.datetime.utcnow(),
+            "cpu_usage": cpu_usage,
+            "ram_usage": ram_usage,
+            "gpu_usage": gpu_usage,
+            "gpu_temp": gpu_temp,
+            "active_game_id": active_game_id,
+            "session_id": session_id,
+        }
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(row)
+            pending = len(self._buffer)
+
+        if pending >= self.max_rows:
+            self._wake.set()
+
+    def set_expected_rate(self, rows_per_second):
+        """Adapte lot et buffer au débit attendu (0 : valeurs par défaut, débit normal)."""
+        max_rows = max(self._base_rows, int(rows_per_second * HIGH_RATE_BATCH_SECONDS))
+        capacity = max(self._base_capacity, int(rows_per_second * HIGH_RATE_BUFFER_SECONDS))
+        with self._lock:
+            self.max_rows = max_rows
+            if capacity != self._buffer.maxlen:
+                # Les plus anciens relevés sont sacrifiés si le buffer rétrécit
+                self.dropped += max(0, len(self._buffer) - capacity)
+                self._buffer = deque(self._buffer, maxlen=capacity)
+        logger.info(f"TelemetryWriter: Expecting {rows_per_second:g} rows/s (batch={max_rows} rows, buffer={capacity}).")
+
+    def pending(self):
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self):
+        """Écrit immédiatement tout le buffer en une transaction. Retourne le nombre de lignes écrites."""
+        with self._flush_lock:
+            with self._lock:
+                rows = list(self._buffer)
+                self._buffer.clear()
+            if not rows:
+                return 0
+
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(HardwareSnapshot), rows)
+            except Exception as e:
+                logger.error(f"TelemetryWriter: Flush of {len(rows)} rows failed: {e}")
+                # On remet les lignes en tête du buffer pour la prochaine tentative
+                with self._lock:
+                    free = self._buffer.maxlen - len(self._buffer)
+                    if free < len(rows):
+                        self.dropped += len(rows) - free
+                        rows = rows[len(rows) - free:]
+                    self._buffer.extendleft(reversed(rows))
+                return 0
+
+            if self.dropped:
+                logger.warning(f"TelemetryWriter: {self.dropped} snapshots dropped (buffer full).")
+                self.dropped = 0
+            return len(rows)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(timeout=self.max_age)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Arrête le thread et garantit l'écriture des relevés restants."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        written = self.flush()
+        logger.info(f"TelemetryWriter: Stopped (final flush: {written} rows).")
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_telemetry_writer():
+    """Retourne le writer partagé du process (démarré au premier appel)."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = TelemetryWriter()
+            _writer.start()
+            atexit.register(shutdown_telemetry_writer)
+        return _writer
+
+
+def shutdown_telemetry_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+            _writer = None
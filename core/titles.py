@@ -0,0 +1,18 @@
+import re
+import unicodedata
+
+# Sans dépendance (ni base, ni logger) : utilisé par core.database et par la conversion du
+# manifeste Ludusavi, qui ne doit pas ouvrir data/nexus_core.db.
+
+
+def normalize_title(title):
+    """Forme canonique d'un titre pour la recherche : minuscules sans accents, lettres/chiffres Unicode, espaces simples.
+
+    "Pokémon Légendes" -> "pokemon legendes", "Ōkami HD" -> "okami hd" ; les écritures sans
+    accents décomposables (CJK, cyrillique...) sont conservées telles quelles.
+    """
+    if not title:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", title.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(word for word in re.split(r"[\W_]+", stripped) if word)
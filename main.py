@@ -4,14 +4,18 @@ import os
 # Ensure the root directory is in python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Chronologie du démarrage : importée en premier pour mesurer tout le reste
+from core.startup import timeline
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon, QPixmap, QImage
 from PySide6.QtCore import Qt, QTimer, QThread, QRect
-import time
 import os
 import sys
 from core.logger import logger
+from core.bootstrap import Bootstrap, BootTask
 from app_ui.splash import NexusSplash, resource_path
+from app_ui import assets
 
 def get_nexus_icon():
     """Charge l'icône personnalisée assets/icon.png."""
@@ -27,18 +31,79 @@ def exception_hook(exctype, value, traceback):
 
 sys.excepthook = exception_hook
 
+def report_when_interactive():
+    """Clôt la chronologie au premier tour de boucle d'événements après l'affichage de la fenêtre."""
+    def done():
+        timeline.mark("first_frame")
+        timeline.report()
+    QTimer.singleShot(0, done)
+
+# --- Étapes de démarrage, exécutées en parallèle hors du thread UI ---
+
+def boot_database(deps, progress):
+    import core.database # moteur SQLite, création des tables et migrations à l'import
+    return core.database.DB_PATH
+
+def boot_ui_modules(deps, progress):
+    import app_ui.mainwindow # widgets, qtawesome, modèles de la bibliothèque
+    return True
+
+def boot_library(deps, progress):
+    from plugins.scan_cache import load_cached_library
+    return load_cached_library()
+
+def boot_telemetry(deps, progress):
+    from core.telemetry.collector import TelemetryCollector
+    collector = TelemetryCollector()
+    # Chargement du CLR et Computer.Open() de LibreHardwareMonitor (le plus long)
+    if not collector.source.open():
+        progress("HARDWARE SENSORS: PSUTIL FALLBACK")
+    return collector
+
+def boot_profiles(deps, progress):
+    from core.optimizers.universal_reader import get_config_reader
+    reader = get_config_reader() # instance partagée avec l'agent IA ; synchro cloud en arrière-plan
+    progress(f"{len(reader.profiles)} GAME PROFILES LOADED") # JSON local lu ici plutôt qu'au premier usage
+    return reader
+
+def boot_manifest(deps, progress):
+    return deps["profiles"]._load_ludusavi(progress_callback=progress)
+
+def build_boot_tasks():
+    """Graphe de démarrage. Les profils et le manifeste Ludusavi (réseau) ne retardent pas la fenêtre."""
+    return [
+        BootTask("database", boot_database, label="ESTABLISHING DATABASE LINK...", weight=2),
+        BootTask("ui_modules", boot_ui_modules, deps=["database"], label="MOUNTING CORE UI COMPONENTS...", weight=3),
+        BootTask("library", boot_library, deps=["database"], label="LOADING GAME LIBRARY..."),
+        BootTask("telemetry", boot_telemetry, deps=["database"], label="SCANNING SYSTEM INTERFACES...", weight=2),
+        BootTask("profiles", boot_profiles, label="SYNCING GAME PROFILES...", blocking=False),
+        BootTask("manifest", boot_manifest, deps=["profiles"], label="SYNCING GAME DATABASE...", blocking=False),
+    ]
+
+def open_main_window(boot):
+    """Construit la fenêtre (thread UI) avec les services préparés par le bootstrap."""
+    from app_ui.mainwindow import MainWindow
+    window = MainWindow(collector=boot.results.get("telemetry"), cached_library=boot.results.get("library"))
+    timeline.mark("mainwindow_init")
+    return window
+
 def main():
     # Sécurité pour PyInstaller
     if getattr(sys, 'frozen', False):
         os.chdir(os.path.dirname(sys.executable))
         
     logger.info("--- NEXUS CORE STARTING ---")
+    timeline.mark("imports")
     
     app = QApplication(sys.argv)
     app.setApplicationName("Nexus Core")
     app.setOrganizationName("NexusCorp")
     app.setWindowIcon(get_nexus_icon()) # Application de l'icône globale
-    
+    timeline.mark("qapplication")
+
+    boot = Bootstrap(build_boot_tasks())
+    state = {}
+
     # Vérifier si on doit afficher le splash
     show_splash = "--no-splash" not in sys.argv
     
@@ -46,63 +111,45 @@ def main():
         splash = NexusSplash()
         splash.show()
         splash.fade_in()
-    
-    # On laisse l'animation de fade-in se terminer proprement (800ms)
-    start_time = time.time()
-    while time.time() - start_time < 0.8:
-        app.processEvents()
-        time.sleep(0.01)
-
-    # 2. Simulation réaliste du chargement initial
-    for pct in range(1, 45):
-        if pct == 10: msg = "LOADING KERNEL MODULES..."
-        elif pct == 25: msg = "INITIALIZING NEURAL NETWORK..."
-        else: msg = "SCANNING SYSTEM INTERFACES..."
-        
-        splash.update_progress(pct, msg)
-        app.processEvents()
-        time.sleep(0.02)
+        assets.preload(assets.MAIN_WINDOW_IMAGES) # décodées pendant le splash
+        timeline.mark("splash")
+
+    def pump():
+        # Le splash suit les événements réels du bootstrap (aucune progression simulée)
+        for kind, name, payload in boot.pump():
+            if not show_splash or "window" in state:
+                continue
+            task = boot.tasks[name]
+            if kind == "progress":
+                splash.update_progress(int(5 + 85 * boot.fraction), payload)
+            elif kind == "started" and task.blocking:
+                splash.update_progress(int(5 + 85 * boot.fraction), task.label)
+            elif kind in ("done", "failed", "skipped") and task.blocking:
+                running = [t.label for n, t in boot.tasks.items() if t.blocking and boot.status[n] == "running"]
+                splash.update_progress(int(5 + 85 * boot.fraction), running[0] if running else "FINALIZING HUD...")
+
+        if boot.finished and "window" not in state:
+            timeline.mark("bootstrap")
+            if show_splash:
+                splash.update_progress(95, "FINALIZING HUD...")
+                splash.repaint()
+            window = state["window"] = open_main_window(boot)
+            window.show()
+            if show_splash:
+                splash.update_progress(100, "SYSTEM READY.")
+                splash.fade_out(splash.close)
+            report_when_interactive()
+            boot.start_background()
+
+        # Les tâches non bloquantes (réseau) se poursuivent après l'ouverture de la fenêtre
+        if boot.all_done:
+            pump_timer.stop()
+
+    pump_timer = QTimer()
+    pump_timer.timeout.connect(pump)
+    pump_timer.start(15)
 
-    # 3. Le gros morceau : Initialisation & Téléchargements réels (45% -> 90%)
-    splash.update_progress(50, "MOUNTING CORE UI COMPONENTS...")
-    app.processEvents()
-    
-    from app_ui.mainwindow import MainWindow
-    from core.optimizers.universal_reader import UniversalConfigReader # Import direct
-    
-    # Étape réelle : Sync Database
-    splash.update_progress(60, "SYNCING GAME DATABASE...")
-    app.processEvents()
-    
-    reader = UniversalConfigReader()
-    # On passe une fonction lambda pour mettre à jour le splash en temps réel
-    reader._load_ludusavi(progress_callback=lambda msg: (splash.update_progress(70, msg), app.processEvents()))
-    
-    splash.update_progress(85, "ESTABLISHING DATABASE LINK...")
-    app.processEvents()
-    
-    window = MainWindow() 
-    splash.update_progress(95, "FINALIZING HUD...")
-    app.processEvents()
-    
-    time.sleep(0.2)
-    splash.update_progress(100, "SYSTEM READY.")
-    app.processEvents()
-    time.sleep(0.4) 
-    
-    # 4. Fade out and Launch
-    def launch_app():
-        window.show()
-        splash.close()
-
-    splash.fade_out(launch_app)
-    else:
-        # Lancement direct (via le Launcher)
-        from app_ui.mainwindow import MainWindow
-        window = MainWindow()
-        window.show()
-    
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
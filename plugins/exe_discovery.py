@@ -0,0 +1,127 @@
+import os
+import re
+import threading
+
+# Profondeur max explorée sous le dossier d'installation (0 = racine seule)
+MAX_DEPTH = 4
+# Nombre max d'entrées examinées par dossier d'installation (borne le coût sur les très gros jeux)
+MAX_ENTRIES = 20000
+
+# Dossiers jamais explorés : dépendances, installeurs, anti-cheat, outils moteur
+PRUNED_DIRS = {
+    "_commonredist", "redist", "redistributables", "vcredist", "directx", "dotnet", "dotnetfx",
+    "__installer", "installer", "installers", "support", "prereqs", "prerequisites",
+    "easyanticheat", "battleye", "crashreporter", "crashpad", "cef", "webhelper",
+    "__pycache__", "logs", "cache", "shadercache", "screenshots", "saves", "mods",
+}
+PRUNED_SUBPATHS = (
+    "engine/binaries/thirdparty", "engine/extras", "engine/programs", "engine/plugins", "engine/content",
+)
+
+# Exécutables ignorés quel que soit le launcher
+EXCLUDED_NAMES = (
+    "unins", "crash", "redist", "setup", "install", "helper", "update", "report",
+    "dxsetup", "vc_redist", "ue4prereq", "ueprereq", "cefprocess", "webhelper", "easyanticheat", "beservice",
+)
+
+_cache = {}   # {(dossier, exclusions, titre): (mtime_ns, exe)}
+_cache_lock = threading.Lock()
+
+
+def _compact(text):
+    return re.sub(r"[^a-z0-9]", "", text.lower())
+
+
+def _is_pruned(rel_path, name):
+    if name in PRUNED_DIRS:
+        return True
+    return any(rel_path == sub or rel_path.endswith("/" + sub) for sub in PRUNED_SUBPATHS)
+
+
+def iter_executables(install_dir, max_depth=MAX_DEPTH, exclude=()):
+    """Parcourt install_dir (os.scandir, profondeur bornée, dossiers inutiles élagués).
+
+    Génère (chemin, profondeur, taille) pour chaque .exe non exclu.
+    """
+    excluded = EXCLUDED_NAMES + tuple(x.lower() for x in exclude)
+    root_len = len(os.path.normpath(install_dir)) + 1
+    stack = [(install_dir, 0)]
+    visited = 0
+    while stack and visited < MAX_ENTRIES:
+        path, depth = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                visited += 1
+                name = entry.name.lower()
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth < max_depth:
+                            rel_path = entry.path[root_len:].lower().replace("\\", "/")
+                            if not _is_pruned(rel_path, name):
+                                stack.append((entry.path, depth + 1))
+                    elif name.endswith(".exe") and not any(x in name for x in excluded):
+                        yield entry.path, depth, entry.stat().st_size
+                except OSError:
+                    continue
+
+
+def score_executable(path, depth, size, hints=()):
+    """Score d'un exe candidat : proche de la racine, volumineux, nom proche du titre / dossier."""
+    stem = _compact(os.path.splitext(os.path.basename(path))[0])
+    score = -15 * depth
+    score += min(size / (1 << 20), 200) * 0.2   # jusqu'à +40 pour un binaire de 200 Mo
+    for hint in hints:
+        if not hint or len(stem) < 3:
+            continue
+        if stem == hint:
+            score += 60
+        elif stem in hint or hint in stem:
+            score += 30
+    if "launcher" in stem:
+        score -= 20
+    return score
+
+
+def rank_executables(install_dir, title=None, exclude=(), max_depth=MAX_DEPTH):
+    """Candidats triés du plus probable au moins probable : [(score, chemin)]."""
+    hints = {_compact(os.path.basename(os.path.normpath(install_dir)))}
+    if title:
+        hints.add(_compact(title))
+    ranked = [(score_executable(path, depth, size, hints), path)
+              for path, depth, size in iter_executables(install_dir, max_depth, exclude)]
+    ranked.sort(key=lambda r: (-r[0], r[1]))
+    return ranked
+
+
+def find_game_exe(install_dir, title=None, exclude=(), max_depth=MAX_DEPTH):
+    """Exécutable principal d'un jeu installé (None si introuvable).
+
+    Le résultat est mis en cache tant que la date de modification du dossier d'installation ne change pas.
+    """
+    if not install_dir:
+        return None
+    try:
+        mtime = os.stat(install_dir).st_mtime_ns
+    except OSError:
+        return None
+
+    key = (os.path.normcase(os.path.normpath(install_dir)), tuple(exclude), title, max_depth)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    ranked = rank_executables(install_dir, title, exclude, max_depth)
+    exe = ranked[0][1] if ranked else None
+    with _cache_lock:
+        _cache[key] = (mtime, exe)
+    return exe
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
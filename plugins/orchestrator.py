@@ -0,0 +1,118 @@
+import importlib
+import os
+import queue
+import threading
+import time
+from core.logger import logger
+
+# Scanners de la bibliothèque, dans l'ordre de priorité pour la déduplication :
+# (source, libellé launcher, module, fonction, accepte le cache)
+SCAN_SOURCES = [
+    ("launchers", "Launcher", "plugins.scanner_launchers.scanner", "scan_launchers", False),
+    ("steam", "Steam", "plugins.scanner_steam.scanner", "scan_steam_games", True),
+    ("epic", "Epic", "plugins.scanner_epic", "scan_epic_games", True),
+    ("ubisoft", "Ubisoft", "plugins.scanner_ubisoft", "scan_ubisoft_games", True),
+    ("ea", "EA", "plugins.scanner_ea", "scan_ea_games", True),
+    ("battlenet", "Battle.net", "plugins.scanner_battlenet", "scan_battlenet_games", True),
+    ("riot", "Riot", "plugins.scanner_riot", "scan_riot_games", True),
+]
+SOURCE_LABELS = {source: label for source, label, *_ in SCAN_SOURCES}
+
+# Délai max accordé à chaque scanner (secondes) : au-delà ses résultats sont ignorés
+SCAN_TIMEOUT = 20.0
+
+
+def item_key(item):
+    """Identité d'un jeu de la bibliothèque : exe normalisé, ou titre pour les jeux sans exe."""
+    if item.get("exe"):
+        return os.path.normpath(item["exe"]).lower()
+    return "title:" + item["title"].lower().strip()
+
+
+class LibraryMerger:
+    """Déduplication de la bibliothèque : par exe normalisé, ou par titre pour les jeux sans exe."""
+
+    def __init__(self):
+        self.items = []
+        self._seen_exes = set()
+        self._seen_titles = set()
+
+    def add_item(self, title, launcher, exe):
+        """Ajoute le jeu s'il n'est pas déjà connu. Retourne True s'il a été ajouté."""
+        title_norm = title.lower().strip()
+        if not exe:
+            if title_norm not in self._seen_titles:
+                self.items.append({"title": title, "launcher": launcher, "exe": None})
+                self._seen_titles.add(title_norm)
+                return True
+            return False
+
+        normalized_exe = os.path.normpath(exe).lower()
+        if normalized_exe not in self._seen_exes:
+            self.items.append({"title": title, "launcher": launcher, "exe": exe})
+            self._seen_exes.add(normalized_exe)
+            self._seen_titles.add(title_norm)
+            return True
+        return False
+
+
+def merge_results(results, extra=()):
+    """Fusionne {source: jeux} toujours dans l'ordre de SCAN_SOURCES, quel que soit l'ordre d'arrivée.
+
+    extra : (titre, launcher, exe) ajoutés en dernier (jeux personnalisés).
+    """
+    merger = LibraryMerger()
+    for source, label, *_ in SCAN_SOURCES:
+        for g in results.get(source, ()):
+            merger.add_item(g['title'], label, g.get('exe'))
+    for title, launcher, exe in extra:
+        merger.add_item(title, launcher, exe)
+    return merger.items
+
+
+def _run_scanner(source, module_name, func_name, uses_cache, cache, results):
+    t0 = time.perf_counter()
+    try:
+        scan = getattr(importlib.import_module(module_name), func_name)
+        games = scan(cache=cache) if uses_cache else scan()
+        results.put((source, list(games), (time.perf_counter() - t0) * 1000, None))
+    except Exception as e:
+        results.put((source, None, (time.perf_counter() - t0) * 1000, e))
+
+
+def run_scanners(cache=None, timeout=SCAN_TIMEOUT, on_result=None):
+    """Lance tous les scanners en parallèle et attend chacun au plus `timeout` secondes.
+
+    on_result(source, games, elapsed_ms) est appelé depuis le thread appelant dès qu'un scanner
+    termine, dans l'ordre d'arrivée. Retourne ({source: jeux}, {source: statut}) ; les sources
+    en échec ou hors délai sont absentes des résultats.
+
+    Les threads sont des daemons : un scanner bloqué (os.walk sur un disque lent) est abandonné
+    sans retenir la fermeture de l'application.
+    """
+    done = queue.Queue()
+    deadline = time.monotonic() + timeout
+    for source, _label, module_name, func_name, uses_cache in SCAN_SOURCES:
+        threading.Thread(target=_run_scanner, name=f"Scanner-{source}", daemon=True,
+                         args=(source, module_name, func_name, uses_cache, cache, done)).start()
+
+    results = {}
+    status = {source: "timeout" for source, *_ in SCAN_SOURCES}
+    for _ in SCAN_SOURCES:
+        try:
+            source, games, elapsed, error = done.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            break
+        if error is not None:
+            status[source] = f"failed after {elapsed:.0f}ms ({error})"
+            logger.warning(f"Library: Scanner '{source}' failed: {error}")
+            continue
+        results[source] = games
+        status[source] = f"{elapsed:.0f}ms"
+        if on_result:
+            on_result(source, games, elapsed)
+
+    for source, state in status.items():
+        if state == "timeout":
+            logger.warning(f"Library: Scanner '{source}' exceeded {timeout:.0f}s, results ignored.")
+    return results, status
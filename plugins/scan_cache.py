@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+from core.database import get_session, ScanCacheEntry
+from core.logger import logger
+
+# Entrée spéciale : dernière bibliothèque fusionnée, affichée dès le démarrage
+LIBRARY_SOURCE = "library"
+LIBRARY_KEY = "last_scan"
+
+
+def file_fingerprint(path):
+    """Empreinte d'un fichier ou dossier : mtime (ns) + taille. None s'il n'existe pas."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def registry_fingerprint(key):
+    """Empreinte d'une clé de registre ouverte : date de dernière écriture (QueryInfoKey)."""
+    import winreg
+    try:
+        return str(winreg.QueryInfoKey(key)[2])
+    except OSError:
+        return None
+
+
+def load_cached_library():
+    """Dernière bibliothèque fusionnée, lue seule (liste vide si aucun scan n'a encore eu lieu)."""
+    db = get_session()
+    try:
+        entry = db.query(ScanCacheEntry).filter(
+            ScanCacheEntry.source == LIBRARY_SOURCE, ScanCacheEntry.key == LIBRARY_KEY).first()
+        return json.loads(entry.payload) if entry else []
+    except Exception as e:
+        logger.error(f"ScanCache: Could not read cached library: {e}")
+        return []
+    finally:
+        db.close()
+
+
+class ScanCache:
+    """Cache persistant des scanners, chargé en une requête et sauvegardé en une transaction.
+
+    Chaque scanner interroge le cache par (source, clé, empreinte) : une entrée n'est
+    réutilisée que si l'empreinte est identique, sinon la source est re-parsée.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}   # {(source, key): (fingerprint, payload)}
+        self._dirty = {}
+        self._touched = {}   # {source: set(keys)}
+        self.stats = {}      # {source: [hits, misses]}
+        self._load()
+
+    def _load(self):
+        db = get_session()
+        try:
+            for e in db.query(ScanCacheEntry).all():
+                try:
+                    self._entries[(e.source, e.key)] = (e.fingerprint, json.loads(e.payload))
+                except (TypeError, ValueError):
+                    pass
+        except Exception as e:
+            logger.error(f"ScanCache: Load failed: {e}")
+        finally:
+            db.close()
+
+    def get(self, source, key, fingerprint):
+        """Payload en cache si l'empreinte correspond, sinon None."""
+        with self._lock:
+            self._touched.setdefault(source, set()).add(key)
+            counters = self.stats.setdefault(source, [0, 0])
+            cached = self._entries.get((source, key))
+            if fingerprint is not None and cached and cached[0] == fingerprint:
+                counters[0] += 1
+                return cached[1]
+            counters[1] += 1
+            return None
+
+    def put(self, source, key, fingerprint, payload):
+        with self._lock:
+            self._touched.setdefault(source, set()).add(key)
+            self._entries[(source, key)] = (fingerprint, payload)
+            self._dirty[(source, key)] = (fingerprint, payload)
+
+    def set_library(self, items):
+        self.put(LIBRARY_SOURCE, LIBRARY_KEY, None, items)
+
+    def save(self, sources=()):
+        """Écrit les entrées modifiées et purge celles des `sources` scannées qui n'ont pas été revues."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            stale = [(s, k) for (s, k) in self._entries if s in sources and k not in self._touched.get(s, ())]
+            for item in stale:
+                del self._entries[item]
+
+        db = get_session()
+        try:
+            existing = {(e.source, e.key): e for e in db.query(ScanCacheEntry).all()}
+            for (source, key), (fingerprint, payload) in dirty.items():
+                entry = existing.get((source, key))
+                if entry is None:
+                    entry = ScanCacheEntry(source=source, key=key)
+                    db.add(entry)
+                entry.fingerprint = fingerprint
+                entry.payload = json.dumps(payload)
+            for item in stale:
+                if item in existing:
+                    db.delete(existing[item])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"ScanCache: Save failed: {e}")
+        finally:
+            db.close()
+
+    def summary(self, source):
+        hits, misses = self.stats.get(source, (0, 0))
+        return f"{hits} cached / {misses} parsed"
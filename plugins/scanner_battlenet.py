@@ -1,8 +1,9 @@
-import os
 import winreg
+from plugins.exe_discovery import find_game_exe
+from plugins.scan_cache import file_fingerprint, registry_fingerprint
 
-def scan_battlenet_games():
-    """Scanne les jeux Blizzard Battle.net via le registre Uninstall."""
+def scan_battlenet_games(cache=None):
+    """Scanne les jeux Blizzard Battle.net via le registre Uninstall (recherche d'exe évitée si rien n'a changé)."""
     games = []
     try:
         # Battle.net utilise les clés Uninstall standard
@@ -19,23 +20,25 @@ def scan_battlenet_games():
                                 title, _ = winreg.QueryValueEx(subkey, "DisplayName")
                                 install_dir, _ = winreg.QueryValueEx(subkey, "InstallLocation")
                                 
-                                # Chercher un exe probable
-                                exe_path = None
-                                if os.path.exists(install_dir):
-                                    # On cherche dans le dossier racine
-                                    for f in os.listdir(install_dir):
-                                        if f.endswith(".exe") and not any(x in f.lower() for x in ["launcher", "setup", "update", "browser"]):
-                                            exe_path = os.path.join(install_dir, f)
-                                            break
+                                cache_key = f"{reg_path}\\{subkey_name}"
+                                fingerprint = f"{registry_fingerprint(subkey)}|{file_fingerprint(install_dir)}"
+                                game = cache.get("battlenet", cache_key, fingerprint) if cache else None
+                                if game is None:
+                                    # Chercher un exe probable
+                                    exe_path = find_game_exe(install_dir, title, exclude=("launcher", "browser"))
                                 
-                                if title and install_dir:
-                                    games.append({
-                                        "id": f"bnet:{subkey_name}",
-                                        "title": title,
-                                        "launcher": "Battle.net",
-                                        "exe": exe_path,
-                                        "install_dir": install_dir
-                                    })
+                                    if title and install_dir:
+                                        game = {
+                                            "id": f"bnet:{subkey_name}",
+                                            "title": title,
+                                            "launcher": "Battle.net",
+                                            "exe": exe_path,
+                                            "install_dir": install_dir
+                                        }
+                                        if cache:
+                                            cache.put("battlenet", cache_key, fingerprint, game)
+                                if game:
+                                    games.append(game)
                             except: pass
                     i += 1
                 except OSError: break
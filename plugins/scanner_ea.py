@@ -1,8 +1,10 @@
 import os
 import winreg
+from plugins.exe_discovery import find_game_exe
+from plugins.scan_cache import file_fingerprint, registry_fingerprint
 
-def scan_ea_games():
-    """Scanne les jeux EA Desktop (EA App) via le registre."""
+def scan_ea_games(cache=None):
+    """Scanne les jeux EA Desktop (EA App) via le registre (recherche d'exe évitée si rien n'a changé)."""
     games = []
     try:
         reg_path = r"SOFTWARE\Electronic Arts\EA Desktop\Installations"
@@ -17,21 +19,23 @@ def scan_ea_games():
                             # Le nom est souvent dans un dossier parent ou via une autre clé
                             title = os.path.basename(install_dir.rstrip("\\/"))
                             
-                            exe_path = None
-                            if os.path.exists(install_dir):
-                                # On cherche l\'exe dans le dossier racine d\'abord
-                                for f in os.listdir(install_dir):
-                                    if f.endswith(".exe") and not any(x in f.lower() for x in ["cleanup", "touchup", "ea", "installer"]):
-                                        exe_path = os.path.join(install_dir, f)
-                                        break
+                            cache_key = f"{reg_path}\\{game_code}"
+                            fingerprint = f"{registry_fingerprint(subkey)}|{file_fingerprint(install_dir)}"
+                            game = cache.get("ea", cache_key, fingerprint) if cache else None
+                            if game is None:
+                                # Les exe de la racine sont favorisés par le score
+                                exe_path = find_game_exe(install_dir, title, exclude=("cleanup", "touchup"))
 
-                            games.append({
-                                "id": f"ea:{game_code}",
-                                "title": title,
-                                "launcher": "EA",
-                                "exe": exe_path,
-                                "install_dir": install_dir
-                            })
+                                game = {
+                                    "id": f"ea:{game_code}",
+                                    "title": title,
+                                    "launcher": "EA",
+                                    "exe": exe_path,
+                                    "install_dir": install_dir
+                                }
+                                if cache:
+                                    cache.put("ea", cache_key, fingerprint, game)
+                            games.append(game)
                         except:
                             pass
                     i += 1
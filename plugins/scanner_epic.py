@@ -1,8 +1,9 @@
 import os
 import json
+from plugins.scan_cache import file_fingerprint
 
-def scan_epic_games():
-    """Scanne les jeux Epic Games via les fichiers manifest (.item)."""
+def scan_epic_games(cache=None):
+    """Scanne les jeux Epic Games via les fichiers manifest (.item), avec cache par manifest."""
     # Chemin standard des manifests Epic sur Windows
     manifest_path = r"C:\ProgramData\Epic\EpicGamesLauncher\Data\Manifests"
     games = []
@@ -13,7 +14,14 @@ def scan_epic_games():
     try:
         for file in os.listdir(manifest_path):
             if file.endswith(".item"):
-                with open(os.path.join(manifest_path, file), "r", encoding="utf-8") as f:
+                item_path = os.path.join(manifest_path, file)
+                fingerprint = file_fingerprint(item_path)
+                if cache:
+                    cached = cache.get("epic", item_path, fingerprint)
+                    if cached:
+                        games.append(cached)
+                        continue
+                with open(item_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
                     # On récupère le nom et le chemin de l\'exe
                     title = data.get("DisplayName")
@@ -22,13 +30,16 @@ def scan_epic_games():
                     
                     if title and install_dir and launch_exe:
                         exe_full_path = os.path.join(install_dir, launch_exe).replace("/", "\\")
-                        games.append({
+                        game = {
                             "id": f"epic:{data.get('AppName')}",
                             "title": title,
                             "launcher": "Epic",
                             "exe": exe_full_path,
                             "install_dir": install_dir
-                        })
+                        }
+                        games.append(game)
+                        if cache:
+                            cache.put("epic", item_path, fingerprint, game)
     except Exception as e:
         print(f"Erreur scan Epic: {e}")
         
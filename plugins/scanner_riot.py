@@ -1,8 +1,9 @@
-import os
 import winreg
+from plugins.exe_discovery import find_game_exe
+from plugins.scan_cache import file_fingerprint, registry_fingerprint
 
-def scan_riot_games():
-    """Scanne les jeux Riot (Valorant, LoL) via le registre ou chemins standard."""
+def scan_riot_games(cache=None):
+    """Scanne les jeux Riot (Valorant, LoL) via le registre (recherche d'exe évitée si rien n'a changé)."""
     games = []
     
     # Riot stocke les infos dans HKCU
@@ -19,23 +20,23 @@ def scan_riot_games():
                                 title, _ = winreg.QueryValueEx(subkey, "DisplayName")
                                 install_dir, _ = winreg.QueryValueEx(subkey, "InstallLocation")
                                 
-                                # Chercher l'exe (Riot utilise souvent des raccourcis, mais on cherche le vrai exe)
-                                exe_path = None
-                                if os.path.exists(install_dir):
-                                    for root, dirs, files in os.walk(install_dir):
-                                        for f in files:
-                                            if f.endswith(".exe") and not any(x in f.lower() for x in ["crash", "bug", "redist", "port"]):
-                                                exe_path = os.path.join(root, f)
-                                                break
-                                        if exe_path: break
+                                cache_key = f"{reg_path}\\{subkey_name}"
+                                fingerprint = f"{registry_fingerprint(subkey)}|{file_fingerprint(install_dir)}"
+                                game = cache.get("riot", cache_key, fingerprint) if cache else None
+                                if game is None:
+                                    # Chercher l'exe (Riot utilise souvent des raccourcis, mais on cherche le vrai exe)
+                                    exe_path = find_game_exe(install_dir, title, exclude=("bug",))
                                 
-                                games.append({
-                                    "id": f"riot:{subkey_name}",
-                                    "title": title,
-                                    "launcher": "Riot",
-                                    "exe": exe_path,
-                                    "install_dir": install_dir
-                                })
+                                    game = {
+                                        "id": f"riot:{subkey_name}",
+                                        "title": title,
+                                        "launcher": "Riot",
+                                        "exe": exe_path,
+                                        "install_dir": install_dir
+                                    }
+                                    if cache:
+                                        cache.put("riot", cache_key, fingerprint, game)
+                                games.append(game)
                             except: pass
                     i += 1
                 except OSError: break
@@ -1,6 +1,8 @@
 import os
 import winreg
 import re
+from plugins.exe_discovery import find_game_exe
+from plugins.scan_cache import file_fingerprint
 
 def get_steam_install_path():
     """Trouve le chemin d'installation de Steam via le registre Windows."""
@@ -20,8 +22,8 @@ def parse_vdf(content):
         paths.append(m.replace("\\\\", "\\"))
     return paths
 
-def scan_steam_games():
-    """Scanne les jeux Steam installés."""
+def scan_steam_games(cache=None):
+    """Scanne les jeux Steam installés (les manifests inchangés sont relus depuis le cache)."""
     steam_path = get_steam_install_path()
     if not steam_path:
         return []
@@ -47,6 +49,12 @@ def scan_steam_games():
         for file in os.listdir(folder):
             if file.startswith("appmanifest_") and file.endswith(".acf"):
                 manifest_path = os.path.join(folder, file)
+                fingerprint = file_fingerprint(manifest_path)
+                if cache:
+                    cached = cache.get("steam", manifest_path, fingerprint)
+                    if cached:
+                        games.append(cached)
+                        continue
                 try:
                     with open(manifest_path, "r", encoding="utf-8") as f:
                         m_content = f.read()
@@ -56,13 +64,18 @@ def scan_steam_games():
                         
                         if name_match and appid_match:
                             game_id = f"steam:{appid_match.group(1)}"
-                            games.append({
+                            install_dir = os.path.join(folder, "common", folder_match.group(1)) if folder_match else ""
+                            game = {
                                 "id": game_id,
                                 "title": name_match.group(1),
                                 "launcher": "Steam",
-                                "install_dir": os.path.join(folder, "common", folder_match.group(1)) if folder_match else "",
+                                "install_dir": install_dir,
+                                "exe": find_game_exe(install_dir, name_match.group(1)),
                                 "appid": appid_match.group(1)
-                            })
+                            }
+                            games.append(game)
+                            if cache:
+                                cache.put("steam", manifest_path, fingerprint, game)
                 except Exception as e:
                     print(f"Erreur lecture manifest {file}: {e}")
                     
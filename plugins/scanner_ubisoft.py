@@ -1,9 +1,11 @@
 import os
 import winreg
+from plugins.exe_discovery import find_game_exe
+from plugins.scan_cache import file_fingerprint, registry_fingerprint
 import yaml # Si besoin, mais souvent c'est binaire ou registry
 
-def scan_ubisoft_games():
-    """Scanne les jeux Ubisoft Connect via le registre."""
+def scan_ubisoft_games(cache=None):
+    """Scanne les jeux Ubisoft Connect via le registre (recherche d'exe évitée si rien n'a changé)."""
     games = []
     try:
         # Ubisoft stocke les installations ici
@@ -21,23 +23,23 @@ def scan_ubisoft_games():
                             # On prend le nom du dossier par défaut
                             title = os.path.basename(install_dir.rstrip("\\/"))
                             
-                            # Chercher un exe probable
-                            exe_path = None
-                            if os.path.exists(install_dir):
-                                for root, dirs, files in os.walk(install_dir):
-                                    for f in files:
-                                        if f.endswith(".exe") and not any(x in f.lower() for x in ["ubi", "crash", "version", "overlay", "plugin"]):
-                                            exe_path = os.path.join(root, f)
-                                            break
-                                    if exe_path: break
+                            cache_key = f"{reg_path}\\{game_id}"
+                            fingerprint = f"{registry_fingerprint(subkey)}|{file_fingerprint(install_dir)}"
+                            game = cache.get("ubisoft", cache_key, fingerprint) if cache else None
+                            if game is None:
+                                # Chercher un exe probable
+                                exe_path = find_game_exe(install_dir, title, exclude=("ubi", "version", "overlay", "plugin"))
 
-                            games.append({
-                                "id": f"ubisoft:{game_id}",
-                                "title": title,
-                                "launcher": "Ubisoft",
-                                "exe": exe_path,
-                                "install_dir": install_dir
-                            })
+                                game = {
+                                    "id": f"ubisoft:{game_id}",
+                                    "title": title,
+                                    "launcher": "Ubisoft",
+                                    "exe": exe_path,
+                                    "install_dir": install_dir
+                                }
+                                if cache:
+                                    cache.put("ubisoft", cache_key, fingerprint, game)
+                            games.append(game)
                         except:
                             pass
                     i += 1
@@ -0,0 +1,108 @@
+"""Bench de la recherche d'exécutable (plugins.exe_discovery) sur des arborescences synthétiques.
+
+Compare l'ancien parcours (os.walk complet, premier .exe hors liste noire) au moteur
+borné et classé, à froid puis avec le cache par mtime du dossier d'installation.
+
+Usage : python tests/bench_exe_discovery.py [nb_fichiers ...]
+Exemple : python tests/bench_exe_discovery.py 10000 50000
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plugins.exe_discovery import find_game_exe, clear_cache
+
+GAME_TITLE = "Star Voyager"
+RUNS = 5
+
+
+def touch(path, size=0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        if size:
+            f.truncate(size)
+
+
+def build_tree(root, total_files):
+    """Arborescence type Unreal : redistribuables, outils et tiers moteur autour du vrai binaire."""
+    game = os.path.join(root, "StarVoyager")
+    # Leurres rencontrés en premier par un parcours naïf
+    touch(os.path.join(game, "_CommonRedist", "vcredist", "2019", "VC_redist.x64.exe"), 1 << 20)
+    touch(os.path.join(game, "Engine", "Binaries", "ThirdParty", "CEF3", "Win64", "UnrealCEFSubProcess.exe"), 1 << 20)
+    touch(os.path.join(game, "Engine", "Binaries", "Win64", "CrashReportClient.exe"), 1 << 20)
+    touch(os.path.join(game, "AAA_Tools", "ModEditor.exe"), 1 << 18)
+    # Vrai jeu : aucun exe à la racine (cas Riot / Ubisoft), binaire dans le sous-dossier du jeu
+    touch(os.path.join(game, "StarVoyager", "Binaries", "Win64", "StarVoyager.exe"), 80 << 20)
+
+    # Remplissage : contenu (.pak/.uasset) et tiers moteur sur plusieurs niveaux
+    per_dir = 200
+    for i in range(total_files):
+        d = i // per_dir
+        if d % 3 == 0:
+            sub = os.path.join(game, "Engine", "Binaries", "ThirdParty", f"Lib{d}", "Win64")
+        elif d % 3 == 1:
+            sub = os.path.join(game, "StarVoyager", "Content", "Paks", f"chunk{d // 10}", f"part{d}")
+        else:
+            sub = os.path.join(game, "Engine", "Content", f"Pack{d}", "Data")
+        touch(os.path.join(sub, f"file{i}.{'dll' if d % 3 == 0 else 'uasset'}"))
+    return game
+
+
+def legacy_find(install_dir):
+    """Reproduit l'ancien comportement de scanner_riot / scanner_ubisoft."""
+    for root, dirs, files in os.walk(install_dir):
+        for f in files:
+            if f.endswith(".exe") and not any(x in f.lower() for x in ["crash", "bug", "redist", "port"]):
+                return os.path.join(root, f)
+    return None
+
+
+def legacy_full_walk(install_dir):
+    """Coût d'un os.walk non borné jusqu'au bout (cas où aucun leurre n'arrête le parcours tôt)."""
+    found = None
+    for root, dirs, files in os.walk(install_dir):
+        for f in files:
+            if f.endswith(".exe") and "StarVoyager" in f:
+                found = os.path.join(root, f)
+    return found
+
+
+def timed(fn, *args, **kwargs):
+    timings = []
+    result = None
+    for _ in range(RUNS):
+        t0 = time.perf_counter()
+        result = fn(*args, **kwargs)
+        timings.append(time.perf_counter() - t0)
+    timings.sort()
+    return timings[len(timings) // 2] * 1000, result
+
+
+def cold_find(install_dir):
+    clear_cache()
+    return find_game_exe(install_dir, GAME_TITLE)
+
+
+def bench(total_files):
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        game = build_tree(tmp, total_files)
+        print(f"\n=== {total_files:,} fichiers (création : {time.perf_counter() - t0:.1f}s) ===")
+
+        for label, fn, args in (
+            ("os.walk naïf      ", legacy_find, (game,)),
+            ("os.walk complet   ", legacy_full_walk, (game,)),
+            ("moteur (à froid)  ", cold_find, (game,)),
+            ("moteur (cache)    ", find_game_exe, (game, GAME_TITLE)),
+        ):
+            ms, exe = timed(fn, *args)
+            print(f"{label}: {ms:8.2f} ms  -> {os.path.relpath(exe, game) if exe else None}")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [20_000]
+    for size in sizes:
+        bench(size)
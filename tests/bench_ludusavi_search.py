@@ -0,0 +1,92 @@
+"""Bench de la recherche de titres dans le manifeste Ludusavi : ancien LIKE vs index trigramme.
+
+Utilise data/ludusavi_manifest.yaml s'il est présent (manifeste complet), sinon un manifeste
+synthétique de nb_jeux titres.
+
+Usage : python tests/bench_ludusavi_search.py [nb_jeux]
+Exemple : python tests/bench_ludusavi_search.py 60000
+"""
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.optimizers.ludusavi_manifest import convert_manifest, search_titles
+
+MANIFEST_PATH = "data/ludusavi_manifest.yaml"
+WORDS = ["Dark", "Souls", "Legend", "Star", "War", "Rust", "Space", "Craft", "Racing", "Hollow", "Knight",
+         "Dead", "Cell", "Final", "Fantasy", "Cyber", "Punk", "Tales", "Shadow", "Empire", "City", "Lost"]
+QUERIES_PER_KIND = 200
+
+
+def write_synthetic_manifest(path, nb_games):
+    """Manifeste au format Ludusavi : {titre: {files, installDir, steam}}."""
+    random.seed(42)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(nb_games):
+            title = " ".join(random.sample(WORDS, random.randint(1, 3))) + f" {i}"
+            f.write(f'"{title}":\n  files:\n')
+            f.write(f'    "<winAppData>/Studio{i}/settings.ini":\n      tags:\n        - config\n')
+            f.write(f"  installDir:\n    Game{i}: {{}}\n  steam:\n    id: {100000 + i}\n")
+
+
+def old_search(conn, game_name):
+    """Requête d'origine : LIKE sur le titre brut, premier résultat quelconque."""
+    return conn.execute("SELECT files FROM games WHERE title LIKE ? LIMIT 1", (f"%{game_name}%",)).fetchone()
+
+
+def timed(func, conn, queries):
+    timings = []
+    for query in queries:
+        t0 = time.perf_counter()
+        func(conn, query)
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95)]
+
+
+def main():
+    nb_games = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+    tmp_dir = tempfile.mkdtemp(prefix="nexus_ludusavi_")
+    manifest = MANIFEST_PATH
+    if not os.path.exists(manifest):
+        manifest = os.path.join(tmp_dir, "manifest.yaml")
+        write_synthetic_manifest(manifest, nb_games)
+    db_path = os.path.join(tmp_dir, "ludusavi.db")
+
+    t0 = time.perf_counter()
+    count = convert_manifest(manifest, db_path)
+    print(f"Manifeste : {manifest} ({os.path.getsize(manifest) / 1e6:.1f} Mo, {count} jeux), "
+          f"conversion + index en {time.perf_counter() - t0:.1f} s")
+
+    conn = sqlite3.connect(db_path)
+    titles = [row[0] for row in conn.execute("SELECT title FROM games")]
+    random.seed(7)
+    sample = random.sample(titles, min(QUERIES_PER_KIND, len(titles)))
+    kinds = {
+        "titre exact": sample,
+        "titre en minuscules": [t.lower() for t in sample],
+        "sous-chaîne": [t.split()[-1] if len(t.split()) > 1 else t[1:] for t in sample],
+        "nom de launcher": [f"{t} - Deluxe Edition" for t in sample],
+        "absent": [f"Nexus Missing {i} Game" for i in range(QUERIES_PER_KIND)],
+    }
+
+    print(f"{'requête':<22}{'LIKE méd.':>12}{'LIKE p95':>12}{'index méd.':>12}{'index p95':>12}{'bon jeu':>10}")
+    for kind, queries in kinds.items():
+        old_median, old_p95 = timed(old_search, conn, queries)
+        new_median, new_p95 = timed(lambda c, q: search_titles(c, q, limit=1), conn, queries)
+        hits = ""
+        if kind != "absent" and kind != "sous-chaîne":
+            found = sum(1 for q, t in zip(queries, sample) if (search_titles(conn, q, limit=1) or [(None,)])[0][0] == t)
+            hits = f"{found}/{len(queries)}"
+        print(f"{kind:<22}{old_median:>10.3f}ms{old_p95:>10.3f}ms{new_median:>10.3f}ms{new_p95:>10.3f}ms{hits:>10}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
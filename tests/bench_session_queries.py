@@ -0,0 +1,112 @@
+"""Bench des requêtes de session (NexusAgent.analyze_last_session) avec et sans index.
+
+Usage : python tests/bench_session_queries.py [nb_snapshots ...]
+Exemple : python tests/bench_session_queries.py 1000000 10000000
+"""
+import datetime
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Base, DB_PRAGMAS, GameSession, HardwareSnapshot, create_tuned_engine, normalize_title
+
+SNAPSHOTS_PER_SESSION = 1800  # ~1h de jeu à 1 relevé / 2s
+TITLES = ["Rust", "Cyberpunk 2077", "Valorant", "Fortnite", "Elden Ring", "Counter-Strike 2", "Apex Legends",
+          "Pokémon Légendes", "Ōkami HD", "鬼泣"]
+INDEXES = [index for table in (HardwareSnapshot.__table__, GameSession.__table__) for index in table.indexes]
+QUERY_RUNS = 20
+
+
+def populate(db_path, total_snapshots):
+    """Remplit une base de test avec des sessions et snapshots synthétiques (sqlite3 brut)."""
+    conn = sqlite3.connect(db_path)
+    nb_sessions = max(1, total_snapshots // SNAPSHOTS_PER_SESSION)
+    start = datetime.datetime(2025, 1, 1)
+
+    sessions = []
+    for sid in range(1, nb_sessions + 1):
+        title = random.choice(TITLES)
+        t0 = start + datetime.timedelta(hours=sid * 2)
+        sessions.append((sid, f"game:{title}", title, normalize_title(title), t0, t0 + datetime.timedelta(hours=1)))
+    conn.executemany(
+        "INSERT INTO game_sessions (id, game_id, game_title, game_title_norm, start_time, end_time) VALUES (?, ?, ?, ?, ?, ?)",
+        [(sid, gid, t, tn, s.isoformat(" "), e.isoformat(" ")) for sid, gid, t, tn, s, e in sessions]
+    )
+
+    def rows():
+        for i in range(total_snapshots):
+            sid = i // SNAPSHOTS_PER_SESSION + 1
+            ts = start + datetime.timedelta(hours=sid * 2, seconds=(i % SNAPSHOTS_PER_SESSION) * 2)
+            yield (ts.isoformat(" "), random.uniform(5, 100), random.uniform(30, 90),
+                   random.uniform(0, 100), random.uniform(40, 85), min(sid, nb_sessions))
+
+    conn.executemany(
+        "INSERT INTO hardware_snapshots (timestamp, cpu_usage, ram_usage, gpu_usage, gpu_temp, session_id) VALUES (?, ?, ?, ?, ?, ?)",
+        rows()
+    )
+    conn.commit()
+    conn.close()
+
+
+def run_queries(engine, title):
+    """Reproduit le chemin d'analyse de l'agent : session la plus récente puis ses snapshots."""
+    title_norm = normalize_title(title)
+    timings = []
+    with engine.connect() as conn:
+        for _ in range(QUERY_RUNS):
+            t0 = time.perf_counter()
+            sid = conn.exec_driver_sql(
+                "SELECT id FROM game_sessions WHERE game_title_norm = ? ORDER BY start_time DESC LIMIT 1", (title_norm,)
+            ).scalar()
+            rows = conn.exec_driver_sql(
+                "SELECT cpu_usage, ram_usage, gpu_usage, gpu_temp FROM hardware_snapshots WHERE session_id = ? ORDER BY timestamp", (sid,)
+            ).fetchall()
+            timings.append(time.perf_counter() - t0)
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT cpu_usage FROM hardware_snapshots WHERE session_id = ? ORDER BY timestamp", (sid,)
+        ).fetchall()
+    timings.sort()
+    return timings[len(timings) // 2] * 1000, len(rows), " | ".join(row[-1] for row in plan)
+
+
+def bench(total_snapshots):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        engine = create_tuned_engine(db_path, DB_PRAGMAS)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for index in INDEXES:
+                index.drop(conn)
+
+        t0 = time.perf_counter()
+        populate(db_path, total_snapshots)
+        print(f"\n=== {total_snapshots:,} snapshots (insert: {time.perf_counter() - t0:.1f}s) ===")
+
+        median_ms, count, plan = run_queries(engine, "Rust")
+        print(f"Sans index : {median_ms:8.2f} ms  ({count} snapshots)  plan: {plan}")
+
+        t0 = time.perf_counter()
+        with engine.begin() as conn:
+            for index in INDEXES:
+                index.create(conn)
+            conn.exec_driver_sql("ANALYZE")
+        print(f"Création des index : {time.perf_counter() - t0:.1f}s")
+
+        median_ms, count, plan = run_queries(engine, "Rust")
+        print(f"Avec index : {median_ms:8.2f} ms  ({count} snapshots)  plan: {plan}")
+        # Titres non ASCII : même chemin indexé, saisis sans accents
+        for title in ("pokemon legendes", "OKAMI HD", "鬼泣"):
+            median_ms, count, _ = run_queries(engine, title)
+            print(f"  '{title}' -> {normalize_title(title)!r} : {median_ms:8.2f} ms  ({count} snapshots)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000]
+    for size in sizes:
+        bench(size)
@@ -0,0 +1,83 @@
+"""Bench du lissage de télémétrie : listes d'origine (pop(0) + sum) contre tampons circulaires.
+
+Vérifie d'abord que la SMA sur tampon circulaire reproduit l'ancien _smooth_value, puis
+mesure le coût par relevé de chaque filtre selon la taille de fenêtre (5 points : défaut,
+100 et 600 : fenêtres de quelques secondes en haute fréquence).
+
+Usage : python tests/bench_smoothing.py [relevés]
+Exemple : python tests/bench_smoothing.py 200000
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.telemetry.smoothing import FILTERS, Smoother
+
+WINDOWS = (5, 100, 600)
+
+
+def legacy_smooth(history, new_val, window):
+    """_smooth_value d'origine du TelemetryCollector (fenêtre paramétrée)."""
+    history.append(new_val)
+    if len(history) > window:
+        history.pop(0)
+    return sum(history) / len(history)
+
+
+def legacy_median(history, new_val, window):
+    """Médiane naïve : liste + tri complet à chaque relevé."""
+    history.append(new_val)
+    if len(history) > window:
+        history.pop(0)
+    return statistics.median(history)
+
+
+def timed(func, values):
+    t0 = time.perf_counter()
+    for value in values:
+        func(value)
+    return (time.perf_counter() - t0) / len(values) * 1e6
+
+
+def check(values):
+    for window in WINDOWS:
+        history, median_history = [], []
+        sma, median = FILTERS["sma"](window), FILTERS["median"](window)
+        for value in values[:20000]:
+            expected = legacy_smooth(history, value, window)
+            assert abs(sma.update(value) - expected) < 1e-9, f"SMA {window} diverge"
+            assert median.update(value) == legacy_median(median_history, value, window), f"médiane {window} diverge"
+
+    # Relevé complet par défaut : mêmes valeurs que l'ancien collecteur, brutes conservées
+    smoother = Smoother({"cpu": "sma:5", "gpu": "sma:5"})
+    cpu_history = []
+    for value in values[:1000]:
+        smoothed = smoother.update({"cpu": value, "ram": 50.0, "gpu": value})
+        assert abs(smoothed["cpu"] - legacy_smooth(cpu_history, value, 5)) < 1e-9
+        assert smoother.raw["cpu"] == value and smoothed["ram"] == 50.0
+    print("Équivalence avec l'implémentation d'origine : OK")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    random.seed(42)
+    values = [max(0.0, min(100.0, random.gauss(60, 15))) for _ in range(count)]
+    check(values)
+
+    print(f"{count} relevés, µs par relevé :")
+    print(f"  {'fenêtre':>8} {'liste SMA':>10} {'sma':>8} {'ema':>8} {'liste méd.':>11} {'median':>8}")
+    for window in WINDOWS:
+        history, median_history = [], []
+        legacy_us = timed(lambda v: legacy_smooth(history, v, window), values)
+        legacy_median_us = timed(lambda v: legacy_median(median_history, v, window), values[:count // 10])
+        ring = {name: timed(cls(window).update, values) for name, cls in FILTERS.items()}
+        print(f"  {window:>8} {legacy_us:>10.2f} {ring['sma']:>8.2f} {ring['ema']:>8.2f} "
+              f"{legacy_median_us:>11.2f} {ring['median']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Bench de la chaîne de télémétrie complète en rejeu accéléré, sans matériel ni DLL.
+
+ReplaySource -> TelemetryCollector (lissage) -> TelemetryWriter (base temporaire) -> signal
+stats_ready du TelemetryWorker reçu dans le thread principal. Chaque relevé consomme un
+échantillon enregistré ; à vitesse 1000, une heure à 1 Hz passe en 3,6 s si la chaîne tient le
+rythme. Le mode haute fréquence est mesuré ensuite. Sans fichier, un enregistrement
+synthétique déterministe est généré.
+
+Usage : python tests/bench_telemetry_pipeline.py [secondes_rejouées] [vitesse] [enregistrement.jsonl]
+Exemple : python tests/bench_telemetry_pipeline.py 3600 1000
+"""
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QCoreApplication, QTimer
+
+from core.database import Base, DB_PRAGMAS, create_tuned_engine
+from core.telemetry import writer as telemetry_writer
+from core.telemetry.collector import TelemetryCollector
+from core.telemetry.sources import ReplaySource
+
+HF_HZ = 20
+
+
+def write_synthetic_recording(path, seconds):
+    """Session de jeu type : chargement, combat (charge GPU élevée), menus, à 1 relevé / s."""
+    random.seed(1234)
+    with open(path, "w", encoding="utf-8") as f:
+        for t in range(seconds):
+            phase = math.sin(t / 300.0)
+            gpu = max(0.0, min(100.0, 75 + 20 * phase + random.gauss(0, 4)))
+            sample = {
+                "t": t,
+                "cpu": max(0.0, min(100.0, 40 + 15 * phase + random.gauss(0, 6))),
+                "ram": 55 + 5 * math.sin(t / 900.0),
+                "gpu": gpu,
+                "cpu_temp": 62 + 10 * phase + random.gauss(0, 0.5),
+                "gpu_temp": 58 + gpu * 0.2 + random.gauss(0, 0.3),
+            }
+            f.write(json.dumps(sample) + "\n")
+
+
+class ReplaySession:
+    """Session de jeu fixe pour le TelemetryWorker (pas de scan de processus pendant le bench)."""
+    current_session = {"id": 1, "title": "Replay"}
+
+    def check_running_games(self):
+        return True
+
+    def get_current_session_id(self):
+        return 1
+
+
+def bench_stages(recording, ticks):
+    """Coût par tick de chaque étage, boucle nue (sans attente entre les ticks)."""
+    source = ReplaySource(recording)
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        source.read()
+    read_us = (time.perf_counter() - t0) / ticks * 1e6
+
+    collector = TelemetryCollector(source=ReplaySource(recording))
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        collector.get_stats()
+    stats_us = (time.perf_counter() - t0) / ticks * 1e6
+
+    writer = telemetry_writer.TelemetryWriter(capacity=ticks)
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        stats = collector.get_stats()
+        writer.submit(cpu_usage=stats["cpu"], ram_usage=stats["ram"], gpu_usage=stats["gpu"],
+                      gpu_temp=stats["gpu_temp"], session_id=1)
+    submit_us = (time.perf_counter() - t0) / ticks * 1e6
+    t0 = time.perf_counter()
+    written = writer.flush()
+    flush_rows_s = written / max(time.perf_counter() - t0, 1e-9)
+
+    print(f"  ReplaySource.read          {read_us:8.1f} µs/tick")
+    print(f"  get_stats (lissage)        {stats_us:8.1f} µs/tick")
+    print(f"  get_stats + writer.submit  {submit_us:8.1f} µs/tick")
+    print(f"  writer.flush               {flush_rows_s:8.0f} lignes/s ({written} lignes)")
+
+
+def bench_worker(recording, ticks, speed, hf_hz=0):
+    """TelemetryWorker réel (thread Qt) sur horloge accélérée, signal reçu dans la boucle Qt.
+
+    hf_hz > 0 : mode haute fréquence (la session rejouée est toujours "en jeu").
+    """
+    from app_ui.mainwindow import TelemetryWorker
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    source = ReplaySource(recording)
+    collector = TelemetryCollector(source=source)
+    worker = TelemetryWorker(collector, ReplaySession(), speed=speed)
+    worker.hf_hz = hf_hz
+    received = []
+    worker.stats_ready.connect(lambda stats, is_gaming: received.append(stats["gpu"]))
+    writer = telemetry_writer.get_telemetry_writer()
+    written_before = writer_rows()
+
+    def check():
+        if source.reads >= ticks:
+            worker.stop()
+            app.quit()
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(5)
+
+    t0 = time.perf_counter()
+    worker.start()
+    app.exec()
+    elapsed = time.perf_counter() - t0
+    worker.wait(2000)
+    writer.flush()
+    sampled = worker.sampler.sampled_ms / 1000
+    rows = writer_rows() - written_before
+
+    print(f"  {source.reads} relevés ({sampled:.0f} s échantillonnées) en {elapsed:.2f} s -> "
+          f"x{sampled / elapsed:.0f} temps réel (cible x{speed:g}), {worker.sampler.overruns} ticks abandonnés")
+    print(f"  {len(received)} signaux UI, {rows} lignes en base")
+
+
+def writer_rows():
+    """Lignes présentes dans la base du bench."""
+    with telemetry_writer.engine.connect() as conn:
+        return conn.exec_driver_sql("SELECT COUNT(*) FROM hardware_snapshots").scalar()
+
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 3600
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else 1000.0
+    tmp_dir = tempfile.mkdtemp(prefix="nexus_telemetry_")
+    recording = sys.argv[3] if len(sys.argv) > 3 else os.path.join(tmp_dir, "recording.jsonl")
+    if not os.path.exists(recording):
+        write_synthetic_recording(recording, seconds)
+
+    # Le writer écrit dans une base jetable, pas dans data/nexus_core.db
+    engine = create_tuned_engine(os.path.join(tmp_dir, "bench.db"), DB_PRAGMAS)
+    Base.metadata.create_all(engine)
+    telemetry_writer.engine = engine
+
+    print(f"Enregistrement : {recording} ({seconds} s)")
+    print("Étages (boucle nue) :")
+    bench_stages(recording, seconds)
+    print(f"Chaîne complète (TelemetryWorker à x{speed:g}, 1 Hz) :")
+    bench_worker(recording, seconds, speed)
+    # Même nombre de relevés par seconde réelle qu'à 1 Hz : x50 à 20 Hz pour une cible x1000
+    print(f"Chaîne complète (TelemetryWorker à x{speed / HF_HZ:g}, haute fréquence {HF_HZ} Hz) :")
+    bench_worker(recording, seconds, speed / HF_HZ, hf_hz=HF_HZ)
+    telemetry_writer.shutdown_telemetry_writer()
+
+
+if __name__ == "__main__":
+    main()
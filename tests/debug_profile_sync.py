@@ -0,0 +1,69 @@
+"""Vérifie la synchro conditionnelle des profils de jeux contre un serveur HTTP local.
+
+Le serveur répond 200 avec un ETag, puis 304 tant que le client renvoie le même ETag ;
+le registre ne doit réécrire game_profiles.json qu'au premier échange.
+
+Usage : python tests/debug_profile_sync.py
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.optimizers.profile_registry import ProfileRegistry
+
+CLOUD_PROFILES = {"stand-in game": {"config_file": "settings.ini", "format": "ini", "search_in": "appdata"}}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    body = json.dumps(CLOUD_PROFILES).encode("utf-8")
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    requests = []
+
+    def do_GET(self):
+        StandInHandler.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/game_profiles.json"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "game_profiles.json")
+        meta_path = os.path.join(tmp, "game_profiles.meta.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"local game": {"format": "json"}}, f)
+
+        registry = ProfileRegistry(path=path, url=url, meta_path=meta_path, ttl=3600)
+        print(f"1er échange : {registry.refresh()}  profils={sorted(registry.profiles())}")
+        mtime = os.stat(path).st_mtime_ns
+
+        # Nouveau processus : le registre relit les validateurs sur le disque
+        registry = ProfileRegistry(path=path, url=url, meta_path=meta_path, ttl=3600)
+        print(f"2e échange  : {registry.refresh()}  fichier réécrit={os.stat(path).st_mtime_ns != mtime}")
+        print(f"TTL écoulé  : {registry.is_stale()}  (refresh_if_stale -> {registry.refresh_if_stale()})")
+        print(f"En-têtes du 2e échange : If-None-Match={StandInHandler.requests[-1].get('If-None-Match')}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Vérifie la sélection des capteurs (core.telemetry.sensor_index) sur un arbre LHM factice.
+
+Chaque accès à un attribut de l'arbre compte comme un appel à travers le pont .NET : le script
+compare le parcours complet d'origine et un relevé via l'index, puis simule un changement de
+matériel. Ne nécessite ni la DLL ni pythonnet.
+
+Usage : python tests/debug_sensor_index.py
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.telemetry.sensor_index import SensorIndex
+
+CALLS = [0]
+
+
+class Fake:
+    """Objet dont chaque attribut lu coûte un appel interop."""
+
+    def __init__(self, **attrs):
+        object.__setattr__(self, "_attrs", attrs)
+
+    def __getattr__(self, name):
+        CALLS[0] += 1
+        return self._attrs[name]
+
+    def __setattr__(self, name, value):
+        self._attrs[name] = value
+
+
+def sensor(sensor_type, name, value):
+    return Fake(SensorType=sensor_type, Name=name, Value=value)
+
+
+def hardware(kind, name, sensors):
+    return Fake(HardwareType=kind, Name=name, Sensors=sensors, SubHardware=[], Update=lambda: None)
+
+
+def build_tree():
+    cpu = hardware("Cpu", "AMD Ryzen 7 7800X3D",
+                   [sensor("Temperature", f"Core #{i}", 55.0 + i) for i in range(1, 9)]
+                   + [sensor("Temperature", "Core (Tctl/Tdie)", 71.0), sensor("Temperature", "Package", 68.5)]
+                   + [sensor("Load", f"CPU Core #{i}", 20.0) for i in range(1, 17)]
+                   + [sensor("Clock", f"Core #{i}", 4800.0) for i in range(1, 9)]
+                   + [sensor("Power", "Package", 85.0)])
+    igpu = hardware("GpuIntel", "AMD Radeon(TM) Graphics",
+                    [sensor("Temperature", "GPU Core", 45.0), sensor("Load", "GPU Core", 3.0)])
+    dgpu = hardware("GpuNvidia", "NVIDIA GeForce RTX 4080",
+                    [sensor("Temperature", "GPU Core", 64.0), sensor("Temperature", "GPU Hot Spot", 76.5),
+                     sensor("Load", "GPU Core", 97.0), sensor("Load", "GPU Memory Controller", 40.0),
+                     sensor("Load", "GPU Video Engine", 0.0), sensor("SmallData", "GPU Memory Used", 9800.0),
+                     sensor("SmallData", "GPU Memory Total", 16376.0)]
+                    + [sensor("Clock", f"GPU Clock {i}", 2600.0) for i in range(4)]
+                    + [sensor("Fan", f"GPU Fan {i}", 1500.0) for i in range(2)])
+    board = hardware("Motherboard", "ASUS ROG STRIX",
+                     [sensor("Voltage", f"Vcore {i}", 1.2) for i in range(30)]
+                     + [sensor("Fan", f"Fan #{i}", 900.0) for i in range(7)])
+    memory = hardware("Memory", "Generic Memory", [sensor("Load", "Memory", 41.0), sensor("Data", "Memory Used", 13.0)])
+    return [cpu, igpu, dgpu, board, memory]
+
+
+def legacy_read(tree):
+    """Parcours d'origine de HardwareMonitor.get_data (avant l'index)."""
+    data = {"cpu_temp": 0.0, "gpu_temp": 0.0, "gpu_load": 0.0}
+    for hw in tree:
+        hw.Update()
+    for hw in tree:
+        if "Cpu" in str(hw.HardwareType):
+            for s in hw.Sensors:
+                if str(s.SensorType) == "Temperature":
+                    if "Package" in s.Name or "Total" in s.Name or "Max" in s.Name:
+                        data["cpu_temp"] = s.Value if s.Value else data["cpu_temp"]
+                    elif data["cpu_temp"] == 0:
+                        data["cpu_temp"] = s.Value if s.Value else 0
+        if "Gpu" in str(hw.HardwareType):
+            for s in hw.Sensors:
+                if str(s.SensorType) == "Temperature":
+                    data["gpu_temp"] = max(data["gpu_temp"], s.Value if s.Value else 0)
+                elif str(s.SensorType) == "Load" and "Core" in s.Name:
+                    data["gpu_load"] = s.Value if s.Value else 0
+    return data
+
+
+def measure(label, func):
+    CALLS[0] = 0
+    result = func()
+    shown = result if isinstance(result, dict) else result.describe()
+    print(f"{label:<28} {CALLS[0]:>5} appels interop  -> {shown}")
+    return result
+
+
+def main():
+    tree = build_tree()
+    legacy = measure("Parcours complet (origine)", lambda: legacy_read(tree))
+    index = measure("Découverte", lambda: SensorIndex(tree))
+
+    def tick():
+        index.update()
+        return index.read()
+    data = measure("Relevé via l'index", tick)
+
+    assert data["cpu_temp"] == 68.5, "Package doit primer sur les coeurs"
+    assert data["gpu_load"] == 97.0, "charge du GPU dédié, pas de l'iGPU"
+    assert data["gpu_temp"] == 76.5, "maximum des capteurs du GPU dédié"
+    assert data["gpu_memory_used"] == 9800.0 and data["gpu_memory_total"] == 16376.0
+    assert legacy["cpu_temp"] == data["cpu_temp"] and legacy["gpu_temp"] == data["gpu_temp"]
+
+    # Package sans valeur (capteur en veille) : repli sur le premier capteur non nul, comme avant
+    tree[0].Sensors[9].Value = None
+    assert index.read()["cpu_temp"] == legacy_read(tree)["cpu_temp"] == 56.0
+
+    # Plan de mise à jour sur 30 s de jeu : tableau de bord (1 s) + enregistreur (GPU, 2 s)
+    updates = {hw.Name: 0 for hw in tree}
+    for hw in tree:
+        hw.Update = lambda name=hw.Name: updates.__setitem__(name, updates[name] + 1)
+    planned = SensorIndex(tree)
+    dashboard = {"cpu_temp": 1.0, "gpu_temp": 1.0, "gpu_load": 1.0}
+    print(f"Plan (tableau de bord)        -> {planned.plan(dashboard)}")
+    for second in range(30):
+        planned.update(dashboard, now=float(second))
+    print(f"Update() en 30 s              -> {updates}")
+    assert updates["NVIDIA GeForce RTX 4080"] == 30 and updates["AMD Ryzen 7 7800X3D"] == 15
+    assert updates["AMD Radeon(TM) Graphics"] == 0, "iGPU inutile à côté du GPU dédié"
+    assert updates["ASUS ROG STRIX"] == 0 and updates["Generic Memory"] == 0
+
+    # Fenêtre réduite hors jeu : seul l'enregistreur (GPU, 15 s) reste abonné, le CPU n'est plus lu
+    recorder = {"gpu_temp": 15.0, "gpu_load": 15.0}
+    print(f"Plan (enregistreur seul)      -> {planned.plan(recorder)}")
+    assert dict(planned.plan(recorder))["Cpu"] is None
+
+    # Retrait du GPU dédié : une nouvelle découverte retient l'iGPU
+    tree.pop(2)
+    rebuilt = SensorIndex(tree).read()
+    assert rebuilt["gpu_load"] == 3.0 and rebuilt["gpu_temp"] == 45.0
+    print(f"Après retrait du GPU dédié    -> {rebuilt}")
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()